@@ -1,5 +1,9 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 import logging
 
 from fastapi import HTTPException, Request, Response, status
@@ -12,11 +16,75 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+class PasswordHashExecutor:
+    """bcrypt 전용 실행기 - 동시 실행 수와 대기열 길이를 제한
+
+    bcrypt 는 해싱 중 GIL 을 놓으므로 스레드 풀로 충분하며, 로그인 폭주 시에도
+    웹 스레드풀/이벤트 루프를 점유하지 않고 대기열이 가득 차면 즉시 503 으로 거절합니다.
+    """
+
+    def __init__(self, max_workers: int = 4, max_queue: int = 100):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hash")
+        self._lock = threading.Lock()
+        self.pending = 0  # 대기 + 실행 중
+        self.active = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_seconds = 0.0
+        self.peak_pending = 0
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        with self._lock:
+            if self.pending >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Authentication service is busy, please retry shortly",
+                )
+            self.pending += 1
+            self.peak_pending = max(self.peak_pending, self.pending)
+
+        def run() -> Any:
+            with self._lock:
+                self.active += 1
+            started = time.monotonic()
+            try:
+                return fn(*args)
+            finally:
+                elapsed = time.monotonic() - started
+                with self._lock:
+                    self.active -= 1
+                    self.pending -= 1
+                    self.completed += 1
+                    self.total_seconds += elapsed
+
+        return self._executor.submit(run)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "active": self.active,
+                "queued": self.pending - self.active,
+                "peak_pending": self.peak_pending,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "avg_seconds": round(self.total_seconds / self.completed, 4) if self.completed else 0.0,
+            }
+
+
 class AuthManager:
     def __init__(self) -> None:
         self.secret_key = settings.secret_key
         self.algorithm = "HS256"
         self.expire_minutes = settings.access_token_expire_minutes
+        self.hash_executor = PasswordHashExecutor(
+            max_workers=settings.password_hash_workers,
+            max_queue=settings.password_hash_max_queue,
+        )
 
     def _truncate_password(self, password: str) -> str:
         """
@@ -29,7 +97,7 @@ class AuthManager:
         # 72바이트로 자르되, UTF-8 문자가 깨지지 않도록 처리
         return password_bytes[:72].decode('utf-8', errors='ignore')
 
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+    def _verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """bcrypt를 직접 사용하여 비밀번호 검증"""
         truncated_password = self._truncate_password(plain_password)
         try:
@@ -41,7 +109,7 @@ class AuthManager:
             logger.error(f"Password verification failed: {exc}")
             return False
 
-    def hash_password(self, password: str) -> str:
+    def _hash_password(self, password: str) -> str:
         """bcrypt를 직접 사용하여 비밀번호 해싱"""
         truncated_password = self._truncate_password(password)
         try:
@@ -54,6 +122,23 @@ class AuthManager:
             logger.error(f"Password hashing failed: {exc}")
             raise
 
+    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        """비밀번호 검증 (bcrypt 전용 실행기에서 실행 후 결과 대기) - 스크립트/동기 코드 전용, 라우트는 *_async 사용"""
+        return self.hash_executor.submit(self._verify_password, plain_password, hashed_password).result()
+
+    def hash_password(self, password: str) -> str:
+        """비밀번호 해싱 (bcrypt 전용 실행기에서 실행 후 결과 대기) - 스크립트/동기 코드 전용, 라우트는 *_async 사용"""
+        return self.hash_executor.submit(self._hash_password, password).result()
+
+    async def verify_password_async(self, plain_password: str, hashed_password: str) -> bool:
+        """async 라우트용 - 이벤트 루프를 막지 않고 검증"""
+        future = self.hash_executor.submit(self._verify_password, plain_password, hashed_password)
+        return await asyncio.wrap_future(future)
+
+    async def hash_password_async(self, password: str) -> str:
+        """async 라우트용 - 이벤트 루프를 막지 않고 해싱"""
+        return await asyncio.wrap_future(self.hash_executor.submit(self._hash_password, password))
+
     def create_access_token(self, subject: str, expires_delta: Optional[timedelta] = None) -> str:
         expire = datetime.utcnow() + (expires_delta or timedelta(minutes=self.expire_minutes))
         to_encode = {"sub": subject, "exp": expire}
@@ -1,72 +1,402 @@
-"""간단한 인메모리 캐싱 시스템"""
-from datetime import datetime, timedelta
+"""크기 제한 LRU + TTL 인메모리 캐싱 시스템"""
+from collections import OrderedDict
 from functools import wraps
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 import hashlib
+import heapq
 import json
 import logging
+import math
+import random
+import sys
+import threading
+import time
+
+from .config import get_settings
 
 logger = logging.getLogger(__name__)
 
 
-class SimpleCache:
-    """간단한 TTL 기반 인메모리 캐시"""
+def _estimate_size(value: Any, _depth: int = 0) -> int:
+    """값의 대략적인 메모리 사용량(bytes) 추정
+
+    스냅샷처럼 dict/list 로 중첩된 JSON 형태의 값을 기준으로 하며,
+    너무 깊은 구조는 일정 깊이 이후 얕은 크기만 계산합니다.
+    """
+    size = sys.getsizeof(value)
+    if _depth >= 6:
+        return size
+    if isinstance(value, dict):
+        for item_key, item_value in value.items():
+            size += _estimate_size(item_key, _depth + 1) + _estimate_size(item_value, _depth + 1)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += _estimate_size(item, _depth + 1)
+    return size
+
+
+class _CacheEntry:
+    __slots__ = ("value", "expires_at", "size", "compute_seconds")
+
+    def __init__(self, value: Any, expires_at: float, size: int, compute_seconds: float = 0.0):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+        self.compute_seconds = compute_seconds
+
+
+class _Flight:
+    __slots__ = ("event", "value", "error")
 
     def __init__(self):
-        self._cache = {}
-        self._timestamps = {}
-
-    def get(self, key: str) -> Optional[Any]:
-        """캐시에서 값 가져오기"""
-        if key in self._cache:
-            # TTL 체크
-            if key in self._timestamps:
-                if datetime.now() < self._timestamps[key]:
-                    return self._cache[key]
+        self.event = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """같은 키에 대한 동시 계산을 하나로 합치는 요청 병합기 (프로세스 내 스레드 간)
+
+    처음 호출한 스레드(leader)만 함수를 실행하고, 그 사이 같은 키로 들어온
+    호출은 leader 의 결과(또는 예외)를 그대로 돌려받습니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            flight = self._flights.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = _Flight()
+                self._flights[key] = flight
+            else:
+                self.coalesced += 1
+
+        if not is_leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = fn()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.event.set()
+        return flight.value
+
+    def do_many(self, keys: List[str], fn: Callable[[List[str]], Dict[str, Any]]) -> Dict[str, Any]:
+        """여러 키를 한 번에 계산 - 다른 호출이 계산 중인 키는 기다리고 나머지만 ``fn`` 으로 계산
+
+        ``fn`` 은 맡은 키 목록을 받아 {키: 값} 을 돌려줍니다. 자기 몫을 끝낸 뒤에만
+        다른 leader 를 기다리므로 서로 겹치는 묶음끼리 교착되지 않습니다.
+        """
+        owned: Dict[str, _Flight] = {}
+        waiting: Dict[str, _Flight] = {}
+        with self._lock:
+            for key in keys:
+                flight = self._flights.get(key)
+                if flight is None:
+                    flight = _Flight()
+                    self._flights[key] = flight
+                    owned[key] = flight
                 else:
-                    # 만료된 캐시 삭제
-                    del self._cache[key]
-                    del self._timestamps[key]
-        return None
+                    self.coalesced += 1
+                    waiting[key] = flight
+
+        results: Dict[str, Any] = {}
+        if owned:
+            try:
+                values = fn(list(owned))
+                for key, flight in owned.items():
+                    flight.value = results[key] = values.get(key)
+            except BaseException as exc:
+                for flight in owned.values():
+                    flight.error = exc
+                raise
+            finally:
+                with self._lock:
+                    for key in owned:
+                        self._flights.pop(key, None)
+                for flight in owned.values():
+                    flight.event.set()
+
+        for key, flight in waiting.items():
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            results[key] = flight.value
+        return results
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._flights)
+
+
+class BoundedTTLCache:
+    """크기 제한이 있는 LRU + TTL 인메모리 캐시 (스레드 안전)
+
+    - 항목 수(max_entries)와 추정 메모리(max_bytes) 상한을 넘으면 가장 오래 사용하지 않은 항목부터 제거
+    - 만료 시각은 최소 힙으로 관리하여 set 시점마다 만료 항목을 즉시 정리
+    - hit/miss/eviction/expiration 카운터 제공 (stats)
+    - get_or_compute: 키별 single-flight 재계산 + 확률적 조기 갱신(XFetch)
+    """
+
+    def __init__(self, max_entries: int = 10_000, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._expiry_heap: List[Tuple[float, int, str]] = []
+        self._sequence = 0
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.early_refreshes = 0
+        self._flights = SingleFlight()
+
+    def get(self, key: str, *, early_refresh_beta: float = 0.0) -> Optional[Any]:
+        """캐시에서 값 가져오기 (조기 갱신 대상으로 뽑히면 None 반환)"""
+        value, fresh = self.lookup(key, early_refresh_beta=early_refresh_beta)
+        return value if fresh else None
+
+    def lookup(self, key: str, *, early_refresh_beta: float = 0.0) -> Tuple[Optional[Any], bool]:
+        """캐시 조회 결과와 신선도 반환
+
+        Returns:
+            (value, fresh) - 미스면 (None, False), 아직 유효하지만 확률적 조기 갱신
+            대상으로 뽑힌 경우 (value, False), 그 외에는 (value, True)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, False
+            now = time.monotonic()
+            if now >= entry.expires_at:
+                # 만료된 캐시 삭제
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None, False
+            self._entries.move_to_end(key)
+            if early_refresh_beta > 0 and self._should_refresh_early(entry, now, early_refresh_beta):
+                self.early_refreshes += 1
+                self.misses += 1
+                return entry.value, False
+            self.hits += 1
+            return entry.value, True
+
+    def compute(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        ttl_seconds: Union[int, Callable[[Any], int]] = 300,
+        *,
+        force: bool = False,
+    ) -> Any:
+        """loader 결과를 계산해 저장 (같은 키의 동시 호출은 한 번만 실행)
+
+        Args:
+            loader: 값을 새로 계산하는 함수
+            ttl_seconds: 유효 시간 또는 계산된 값을 받아 TTL 을 돌려주는 함수
+            force: False 면 leader 가 실행 직전에 캐시를 다시 확인해 이미 채워진 값을 재사용
+        """
+        def run() -> Any:
+            if not force:
+                with self._lock:
+                    entry = self._entries.get(key)
+                    if entry is not None and time.monotonic() < entry.expires_at:
+                        return entry.value
+            started = time.monotonic()
+            value = loader()
+            elapsed = time.monotonic() - started
+            ttl = ttl_seconds(value) if callable(ttl_seconds) else ttl_seconds
+            self.set(key, value, ttl, compute_seconds=elapsed)
+            return value
+
+        return self._flights.do(key, run)
+
+    def compute_many(
+        self,
+        keys: List[str],
+        loader: Callable[[List[str]], Dict[str, Any]],
+        ttl_seconds: Callable[[str, Any], int],
+        *,
+        force_keys: Iterable[str] = (),
+    ) -> Dict[str, Any]:
+        """여러 키를 한 번의 loader 호출로 계산해 저장 (키마다 ``compute`` 와 같은 single-flight 공유)
+
+        Args:
+            loader: 계산할 키 목록을 받아 {키: 값} 을 돌려주는 함수
+            ttl_seconds: (키, 계산된 값) 을 받아 TTL 을 돌려주는 함수
+            force_keys: 캐시를 다시 확인하지 않고 새로 계산할 키
+        """
+        force_keys = set(force_keys)
+
+        def run(claimed: List[str]) -> Dict[str, Any]:
+            values: Dict[str, Any] = {}
+            now = time.monotonic()
+            with self._lock:
+                for key in claimed:
+                    entry = self._entries.get(key)
+                    if key not in force_keys and entry is not None and now < entry.expires_at:
+                        values[key] = entry.value
+            missing = [key for key in claimed if key not in values]
+            if missing:
+                started = time.monotonic()
+                loaded = loader(missing)
+                elapsed = time.monotonic() - started
+                for key in missing:
+                    value = loaded.get(key)
+                    self.set(key, value, ttl_seconds(key, value), compute_seconds=elapsed)
+                    values[key] = value
+            return values
+
+        return self._flights.do_many(list(keys), run)
+
+    def get_or_compute(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        ttl_seconds: Union[int, Callable[[Any], int]] = 300,
+        *,
+        early_refresh_beta: float = 0.0,
+    ) -> Any:
+        """캐시 조회 후 미스(또는 조기 갱신)면 single-flight 로 재계산"""
+        value, fresh = self.lookup(key, early_refresh_beta=early_refresh_beta)
+        if fresh:
+            return value
+        return self.compute(key, loader, ttl_seconds, force=value is not None)
 
-    def set(self, key: str, value: Any, ttl_seconds: int = 300):
+    def set(self, key: str, value: Any, ttl_seconds: int = 300, *, compute_seconds: float = 0.0):
         """캐시에 값 저장 (기본 TTL: 5분)"""
-        self._cache[key] = value
-        self._timestamps[key] = datetime.now() + timedelta(seconds=ttl_seconds)
+        size = _estimate_size(value)
+        now = time.monotonic()
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                logger.debug(f"Cache value for {key} ({size} bytes) exceeds max_bytes, not cached")
+                return
+            expires_at = now + ttl_seconds
+            self._entries[key] = _CacheEntry(value, expires_at, size, compute_seconds)
+            self._bytes += size
+            self._sequence += 1
+            heapq.heappush(self._expiry_heap, (expires_at, self._sequence, key))
+
+            self._purge_expired(now)
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+            self._compact_heap()
 
     def delete(self, key: str):
         """캐시에서 값 삭제"""
-        if key in self._cache:
-            del self._cache[key]
-        if key in self._timestamps:
-            del self._timestamps[key]
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
 
     def clear(self):
         """모든 캐시 삭제"""
-        self._cache.clear()
-        self._timestamps.clear()
+        with self._lock:
+            self._entries.clear()
+            self._expiry_heap.clear()
+            self._bytes = 0
 
     def cleanup_expired(self):
         """만료된 캐시 정리"""
-        now = datetime.now()
-        expired_keys = [
-            key for key, timestamp in self._timestamps.items()
-            if now >= timestamp
-        ]
-        for key in expired_keys:
-            self.delete(key)
+        with self._lock:
+            self._purge_expired(time.monotonic())
+            self._compact_heap()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 사용량 및 적중률 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "early_refreshes": self.early_refreshes,
+                "coalesced": self._flights.coalesced,
+                "in_flight": self._flights.in_flight(),
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _should_refresh_early(entry: _CacheEntry, now: float, beta: float) -> bool:
+        # XFetch: 계산 비용이 클수록, 만료가 가까울수록 먼저 갱신될 확률이 높아짐
+        if entry.compute_seconds <= 0:
+            return False
+        jitter = -entry.compute_seconds * beta * math.log(1.0 - random.random())
+        return now + jitter >= entry.expires_at
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def _purge_expired(self, now: float) -> None:
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, _, key = heapq.heappop(heap)
+            entry = self._entries.get(key)
+            # 다시 set 되었거나 이미 삭제된 키의 오래된 힙 항목은 무시
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove(key)
+                self.expirations += 1
 
+    def _compact_heap(self) -> None:
+        # 덮어쓰기/삭제로 남은 오래된 힙 항목이 많아지면 재구성
+        if len(self._expiry_heap) > 2 * len(self._entries) + 64:
+            self._expiry_heap = [
+                (entry.expires_at, index, key)
+                for index, (key, entry) in enumerate(self._entries.items())
+            ]
+            heapq.heapify(self._expiry_heap)
+
+
+# 하위 호환용 별칭
+SimpleCache = BoundedTTLCache
 
 # 전역 캐시 인스턴스
-cache = SimpleCache()
+_settings = get_settings()
+cache = BoundedTTLCache(
+    max_entries=_settings.cache_max_entries,
+    max_bytes=_settings.cache_max_bytes,
+)
 
 
-def cached(ttl_seconds: int = 300, key_prefix: str = ""):
+def cached(ttl_seconds: int = 300, key_prefix: str = "", early_refresh_beta: float = 0.0):
     """함수 결과를 캐싱하는 데코레이터
 
+    캐시 미스 시 같은 인자로 동시에 들어온 호출은 한 번만 실행됩니다 (single-flight).
+
     Args:
         ttl_seconds: 캐시 유효 시간 (초)
         key_prefix: 캐시 키 접두사
+        early_refresh_beta: 0보다 크면 만료 직전 확률적으로 미리 재계산 (클수록 일찍 갱신)
     """
     def decorator(func: Callable) -> Callable:
         @wraps(func)
@@ -74,18 +404,12 @@ def cached(ttl_seconds: int = 300, key_prefix: str = ""):
             # 캐시 키 생성
             cache_key = _generate_cache_key(func.__name__, key_prefix, args, kwargs)
 
-            # 캐시에서 조회
-            cached_value = cache.get(cache_key)
-            if cached_value is not None:
-                return cached_value
-
-            # 캐시 미스 - 함수 실행
-            result = func(*args, **kwargs)
-
-            # 결과 캐싱
-            cache.set(cache_key, result, ttl_seconds)
-
-            return result
+            return cache.get_or_compute(
+                cache_key,
+                lambda: func(*args, **kwargs),
+                ttl_seconds,
+                early_refresh_beta=early_refresh_beta,
+            )
         return wrapper
     return decorator
 
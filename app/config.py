@@ -13,7 +13,15 @@ class Settings(BaseSettings):
     app_name: str = "Creator Control Center"
     secret_key: str = Field("super-secret-key", env="SECRET_KEY")
     database_url: str = Field(f"sqlite:///{DEFAULT_DB_PATH}", env="DATABASE_URL")
+    # DB 연결 풀 (PostgreSQL) - 프로세스당 최대 연결 수 = 동기 (POOL_SIZE + MAX_OVERFLOW) + async (ASYNC_POOL_SIZE + ASYNC_MAX_OVERFLOW)
+    # 기본값은 기존 단일 풀 예산(60)을 동기 20 / async 40 으로 나눈 값
+    db_pool_size: int = Field(8, env="DB_POOL_SIZE")  # 동기 풀 (스케줄러/메일 워커/리포트/내보내기/sync 라우트)
+    db_max_overflow: int = Field(12, env="DB_MAX_OVERFLOW")
+    db_async_pool_size: int = Field(12, env="DB_ASYNC_POOL_SIZE")  # async 라우트용 풀 (asyncpg)
+    db_async_max_overflow: int = Field(28, env="DB_ASYNC_MAX_OVERFLOW")
     access_token_expire_minutes: int = 60 * 24
+    password_hash_workers: int = Field(4, env="PASSWORD_HASH_WORKERS")  # bcrypt 동시 실행 수
+    password_hash_max_queue: int = Field(100, env="PASSWORD_HASH_MAX_QUEUE")  # 초과 시 503 응답
     verification_code_length: int = 6
     verification_code_expiry_minutes: int = 15
     password_reset_token_expiry_minutes: int = 30
@@ -43,6 +51,14 @@ class Settings(BaseSettings):
     imap_port: int = Field(993, env="IMAP_PORT")
     imap_use_ssl: bool = Field(True, env="IMAP_USE_SSL")
     imap_sent_folder: str = Field("[Gmail]/Sent Mail", env="IMAP_SENT_FOLDER")
+    imap_snippet_bytes: int = Field(2048, env="IMAP_SNIPPET_BYTES")  # 미리보기용으로 가져올 본문 앞부분 크기
+    mailbox_poller_enabled: bool = Field(False, env="MAILBOX_POLLER_ENABLED")  # 웹 프로세스에서 메일함 주기 갱신
+    mailbox_refresh_seconds: int = Field(120, env="MAILBOX_REFRESH_SECONDS")  # 메일함 스냅샷 갱신 주기
+    mail_queue_worker_enabled: bool = Field(True, env="MAIL_QUEUE_WORKER_ENABLED")  # 웹 프로세스 내 발송 워커 실행 여부
+    mail_queue_poll_seconds: int = Field(10, env="MAIL_QUEUE_POLL_SECONDS")  # 발송 대상 확인 간격
+    mail_queue_batch_size: int = Field(50, env="MAIL_QUEUE_BATCH_SIZE")  # 한 번에 발송할 메일 수
+    mail_queue_max_attempts: int = Field(5, env="MAIL_QUEUE_MAX_ATTEMPTS")  # 이 횟수만큼 실패하면 FAILED
+    mail_queue_backoff_seconds: int = Field(30, env="MAIL_QUEUE_BACKOFF_SECONDS")  # 첫 재시도 간격 (실패마다 2배)
 
     # Gmail API 설정 (SMTP/IMAP 대체)
     gmail_sender_email: str = Field("", env="GMAIL_SENDER_EMAIL")
@@ -50,6 +66,52 @@ class Settings(BaseSettings):
     gmail_delegated_email: str = Field("", env="GMAIL_DELEGATED_EMAIL")  # Domain-wide delegation
     gmail_credentials_json: str = Field("", env="GMAIL_CREDENTIALS_JSON")  # OAuth2 credentials
 
+    # 채널 스냅샷 동시 조회 설정
+    snapshot_fetch_max_workers: int = Field(8, env="SNAPSHOT_FETCH_MAX_WORKERS")  # 요청당 동시 커넥터 호출 수 (1이면 순차 조회)
+    snapshot_fetch_deadline_seconds: float = Field(15.0, env="SNAPSHOT_FETCH_DEADLINE_SECONDS")  # 요청 전체 대기 한도
+    snapshot_early_refresh_beta: float = Field(1.0, env="SNAPSHOT_EARLY_REFRESH_BETA")  # 만료 전 확률적 갱신 강도 (0이면 비활성)
+    snapshot_stale_while_revalidate: bool = Field(True, env="SNAPSHOT_STALE_WHILE_REVALIDATE")  # 마지막 스냅샷 즉시 반환 후 백그라운드 갱신
+    snapshot_stale_max_age_seconds: int = Field(24 * 60 * 60, env="SNAPSHOT_STALE_MAX_AGE_SECONDS")  # 마지막 스냅샷 보관 기간
+
+    # 채널 지표 이력 적재 설정
+    metric_history_batch_size: int = Field(200, env="METRIC_HISTORY_BATCH_SIZE")  # bulk INSERT 단위
+    metric_history_flush_seconds: int = Field(30, env="METRIC_HISTORY_FLUSH_SECONDS")  # 버퍼 주기적 기록 간격
+
+    # 채널 스냅샷 백그라운드 갱신 스케줄러
+    refresh_scheduler_enabled: bool = Field(False, env="REFRESH_SCHEDULER_ENABLED")  # 웹 프로세스 내 실행 여부
+    refresh_scheduler_tick_seconds: int = Field(60, env="REFRESH_SCHEDULER_TICK_SECONDS")  # 갱신 대상 확인 간격
+    refresh_scheduler_batch_size: int = Field(200, env="REFRESH_SCHEDULER_BATCH_SIZE")  # 한 번에 조회할 채널 수
+
+    # PDF 리포트 작업 큐
+    report_worker_processes: int = Field(2, env="REPORT_WORKER_PROCESSES")  # 렌더링 프로세스 수 (0이면 앱 프로세스 내 스레드)
+    report_cache_ttl_seconds: int = Field(3600, env="REPORT_CACHE_TTL_SECONDS")  # 같은 입력의 PDF 재사용 기간
+
+    # /metrics 접근 토큰 (비어 있으면 production 에서는 METRICS_PUBLIC=true 일 때만 공개, 그 외 403)
+    metrics_token: str = Field("", env="METRICS_TOKEN")
+    metrics_public: bool = Field(False, env="METRICS_PUBLIC")  # 토큰 없이 공개하려면 명시적으로 true
+    slow_query_threshold_ms: int = Field(200, env="SLOW_QUERY_THRESHOLD_MS")  # 이 시간 이상 걸린 쿼리는 라우트와 함께 경고 로그 (0이면 비활성)
+
+    # 인메모리 캐시 상한 (워커 프로세스당)
+    cache_max_entries: int = Field(10_000, env="CACHE_MAX_ENTRIES")
+    cache_max_bytes: int = Field(64 * 1024 * 1024, env="CACHE_MAX_BYTES")  # 추정 메모리 기준 (기본 64MB)
+    user_cache_ttl_seconds: int = Field(30, env="USER_CACHE_TTL_SECONDS")  # 로그인 사용자 조회 요청 간 캐시 (0이면 비활성)
+    credential_decrypt_cache_size: int = Field(2048, env="CREDENTIAL_DECRYPT_CACHE_SIZE")  # 복호화한 채널 토큰 보관 개수 (0이면 비활성)
+    credential_decrypt_cache_ttl_seconds: int = Field(300, env="CREDENTIAL_DECRYPT_CACHE_TTL_SECONDS")  # 평문 토큰 메모리 보관 시간
+    pagination_count_cache_seconds: int = Field(60, env="PAGINATION_COUNT_CACHE_SECONDS")  # 목록 전체 개수 캐시 (0이면 매번 COUNT)
+
+    # 커넥터 HTTP 커넥션 풀 설정 (모든 커넥터가 공유)
+    connector_http_pool_connections: int = Field(20, env="CONNECTOR_HTTP_POOL_CONNECTIONS")  # 호스트별 풀 개수
+    connector_http_pool_maxsize: int = Field(20, env="CONNECTOR_HTTP_POOL_MAXSIZE")  # 호스트당 keep-alive 연결 수
+    connector_http2_enabled: bool = Field(False, env="CONNECTOR_HTTP2_ENABLED")  # h2 패키지 필요
+    connector_graph_batch_size: int = Field(50, env="CONNECTOR_GRAPH_BATCH_SIZE")  # Graph batch 요청당 채널 수 (최대 50, 1이면 비활성)
+
+    # 커넥터 호출 제한 및 재시도 설정
+    connector_rate_limit_enabled: bool = Field(True, env="CONNECTOR_RATE_LIMIT_ENABLED")  # 플랫폼/토큰별 토큰 버킷
+    connector_max_retries: int = Field(2, env="CONNECTOR_MAX_RETRIES")  # 429/5xx 재시도 횟수
+    connector_backoff_base_seconds: float = Field(0.5, env="CONNECTOR_BACKOFF_BASE_SECONDS")  # 지수 백오프 시작 간격
+    connector_backoff_max_seconds: float = Field(8.0, env="CONNECTOR_BACKOFF_MAX_SECONDS")  # 지수 백오프 상한
+    connector_max_wait_seconds: float = Field(5.0, env="CONNECTOR_MAX_WAIT_SECONDS")  # 호출 한 번이 제한/재시도로 기다릴 최대 시간
+
     @property
     def is_production(self) -> bool:
         """Check if running in production environment (Cloud Run)"""
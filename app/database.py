@@ -1,23 +1,40 @@
+import asyncio
 import time
-from contextlib import contextmanager
-from typing import Iterator
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Iterator, Optional
 import logging
 
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from .config import get_settings
+from .services.query_stats import instrument_engine
+
+try:
+    import asyncpg  # noqa: F401
+    ASYNCPG_AVAILABLE = True
+except ImportError:
+    ASYNCPG_AVAILABLE = False
+
+try:
+    import aiosqlite  # noqa: F401
+    AIOSQLITE_AVAILABLE = True
+except ImportError:
+    AIOSQLITE_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
 # PostgreSQL 연결 - 프로덕션 환경 최적화
-# 동시 접속자 500-1000명 대응 가능한 연결 풀 설정
+# 동기 풀과 async 풀이 함께 열리므로 두 풀의 합이 프로세스당 연결 예산 (DATABASE_SETUP.md 참고)
 engine = create_engine(
     settings.database_url,
     echo=False,
     pool_pre_ping=True,  # 연결 유효성 자동 확인
-    pool_size=20,  # 기본 연결 풀 크기 (기본값: 5)
-    max_overflow=40,  # 피크 시간 추가 연결 수 (총 60개 동시 연결 가능)
+    pool_size=settings.db_pool_size,  # 기본 연결 풀 크기 (DB_POOL_SIZE)
+    max_overflow=settings.db_max_overflow,  # 피크 시간 추가 연결 수 (DB_MAX_OVERFLOW)
     pool_timeout=30,  # 연결 대기 최대 시간 (초)
     pool_recycle=3600,  # 1시간마다 연결 재생성 (장시간 유휴 연결 방지)
     connect_args={
@@ -25,6 +42,22 @@ engine = create_engine(
         "options": "-c statement_timeout=30000"  # 30초 쿼리 타임아웃
     } if "postgresql" in settings.database_url else {},
 )
+instrument_engine(engine)  # 요청별 쿼리 수 / 느린 쿼리 측정
+
+
+def enable_sqlite_foreign_keys(sync_engine) -> None:
+    """SQLite 연결마다 외래 키 제약을 켬 (ON DELETE CASCADE 가 동작하도록, 다른 DB 는 무시)"""
+    if sync_engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(sync_engine, "connect")
+    def _set_foreign_keys(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+enable_sqlite_foreign_keys(engine)
 
 # Track if database has been initialized
 _db_initialized = False
@@ -35,6 +68,16 @@ class DatabaseInitializationError(Exception):
     pass
 
 
+def _ensure_indexes() -> None:
+    """기존 테이블에 나중에 추가된 인덱스 생성 (create_all 은 새 테이블에만 인덱스를 만듦)"""
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                index.create(engine, checkfirst=True)
+            except Exception as e:
+                logger.warning(f"Could not create index {index.name}: {e}")
+
+
 def init_db(max_retries: int = 2, retry_delay: int = 1) -> None:
     """Initialize database with retry logic for Cloud Run deployments
 
@@ -50,6 +93,7 @@ def init_db(max_retries: int = 2, retry_delay: int = 1) -> None:
         try:
             logger.info(f"Database initialization attempt {attempt + 1}/{max_retries}")
             SQLModel.metadata.create_all(engine)
+            _ensure_indexes()
             logger.info(f"Database initialized successfully on attempt {attempt + 1}")
             _db_initialized = True
             return
@@ -92,3 +136,129 @@ def session_context() -> Iterator[Session]:
 
     with Session(engine) as session:
         yield session
+
+
+def _async_database_url(url: str) -> Optional[str]:
+    """동기 DATABASE_URL 을 async 드라이버 URL 로 변환 (드라이버가 없으면 None)"""
+    scheme, _, rest = url.partition("://")
+    base = scheme.split("+", 1)[0]
+    if base in ("postgresql", "postgres") and ASYNCPG_AVAILABLE:
+        return f"postgresql+asyncpg://{rest}"
+    if base == "sqlite" and AIOSQLITE_AVAILABLE:
+        return f"sqlite+aiosqlite://{rest}"
+    return None
+
+
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+
+
+def get_async_engine() -> Optional[AsyncEngine]:
+    """async 엔진 (asyncpg / aiosqlite 가 설치되지 않았으면 None)"""
+    global _async_engine, _async_session_factory
+    if _async_engine is None:
+        async_url = _async_database_url(settings.database_url)
+        if async_url is None:
+            return None
+        if async_url.startswith("postgresql"):
+            _async_engine = create_async_engine(
+                async_url,
+                echo=False,
+                pool_pre_ping=True,
+                pool_size=settings.db_async_pool_size,  # 동기 풀과 예산을 나눠 씀 (DB_ASYNC_POOL_SIZE)
+                max_overflow=settings.db_async_max_overflow,
+                pool_timeout=30,
+                pool_recycle=3600,
+                connect_args={
+                    "timeout": 10,
+                    "server_settings": {"statement_timeout": "30000"},  # 30초 쿼리 타임아웃
+                },
+            )
+        else:
+            _async_engine = create_async_engine(async_url, echo=False)
+        instrument_engine(_async_engine.sync_engine)
+        enable_sqlite_foreign_keys(_async_engine.sync_engine)
+        # 커밋 후 템플릿 렌더링 중 속성 접근이 지연 로딩(IO)을 일으키지 않도록 만료하지 않음
+        _async_session_factory = async_sessionmaker(
+            _async_engine, class_=AsyncSession, expire_on_commit=False
+        )
+    return _async_engine
+
+
+class ThreadedAsyncSession:
+    """async 드라이버가 없을 때 쓰는 대체 세션 - 동기 Session 호출을 스레드에서 실행
+
+    AsyncSession 과 같은 방식(await session.exec(...))으로 사용할 수 있으며,
+    이벤트 루프를 막지 않습니다. 한 번에 하나의 호출만 실행되도록 직렬화합니다.
+    """
+
+    def __init__(self, session: Session):
+        self.sync_session = session
+        self._lock = asyncio.Lock()
+
+    async def _run(self, fn, *args, **kwargs) -> Any:
+        async with self._lock:
+            return await asyncio.to_thread(fn, *args, **kwargs)
+
+    async def exec(self, statement, **kwargs) -> Any:
+        return await self._run(self.sync_session.exec, statement, **kwargs)
+
+    async def execute(self, statement, *args, **kwargs) -> Any:
+        return await self._run(self.sync_session.execute, statement, *args, **kwargs)
+
+    async def get(self, entity, ident, **kwargs) -> Any:
+        return await self._run(self.sync_session.get, entity, ident, **kwargs)
+
+    async def merge(self, instance, *, load: bool = True) -> Any:
+        return await self._run(self.sync_session.merge, instance, load=load)
+
+    async def refresh(self, instance, **kwargs) -> None:
+        await self._run(self.sync_session.refresh, instance, **kwargs)
+
+    async def commit(self) -> None:
+        await self._run(self.sync_session.commit)
+
+    async def rollback(self) -> None:
+        await self._run(self.sync_session.rollback)
+
+    async def delete(self, instance) -> None:
+        await self._run(self.sync_session.delete, instance)
+
+    async def close(self) -> None:
+        await self._run(self.sync_session.close)
+
+    async def run_sync(self, fn, *args, **kwargs) -> Any:
+        return await self._run(fn, self.sync_session, *args, **kwargs)
+
+    def add(self, instance) -> None:
+        self.sync_session.add(instance)
+
+    def add_all(self, instances) -> None:
+        self.sync_session.add_all(instances)
+
+    def __contains__(self, instance) -> bool:
+        return instance in self.sync_session
+
+
+@asynccontextmanager
+async def async_session_context() -> AsyncIterator[Any]:
+    """async 코드용 세션 컨텍스트 (AsyncSession 또는 스레드 기반 대체 세션)"""
+    if not _db_initialized:
+        await asyncio.to_thread(init_db)
+
+    if get_async_engine() is not None:
+        async with _async_session_factory() as session:
+            yield session
+        return
+
+    session = Session(engine, expire_on_commit=False)
+    try:
+        yield ThreadedAsyncSession(session)
+    finally:
+        await asyncio.to_thread(session.close)
+
+
+async def get_async_session() -> AsyncIterator[Any]:
+    """FastAPI Depends용 async 세션 - async def 라우트에서 DB 호출이 이벤트 루프를 막지 않음"""
+    async with async_session_context() as session:
+        yield session
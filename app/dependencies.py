@@ -1,25 +1,128 @@
 from typing import Optional
 
 from fastapi import Depends, HTTPException, Request, status
-from sqlmodel import select
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlmodel import Session, select
 
 from .auth import auth_manager
-from .database import get_session
+from .cache import cache
+from .config import get_settings
+from .database import get_async_session, get_session
 from .models import Subscription, SubscriptionTier, User, UserRole
 
+USER_CACHE_PREFIX = "user:email:"
 
-def get_current_user(request: Request, session=Depends(get_session)) -> User:
+
+def _detached_user(user: User) -> User:
+    """세션과 분리된 사용자 사본 (다른 세션에 merge(load=False) 로 쿼리 없이 붙일 수 있음)"""
+    snapshot = User(**user.model_dump())
+    make_transient_to_detached(snapshot)
+    return snapshot
+
+
+def _cached_user(email: str) -> Optional[User]:
+    if get_settings().user_cache_ttl_seconds <= 0:
+        return None
+    return cache.get(f"{USER_CACHE_PREFIX}{email}")
+
+
+def _remember_user(user: Optional[User]) -> Optional[User]:
+    if user is None:
+        return None
+    snapshot = _detached_user(user)
+    ttl = get_settings().user_cache_ttl_seconds
+    if ttl > 0:
+        cache.set(f"{USER_CACHE_PREFIX}{snapshot.email}", snapshot, ttl)
+    return snapshot
+
+
+def lookup_user_by_email(session: Session, email: str) -> Optional[User]:
+    """이메일로 사용자 조회 - USER_CACHE_TTL_SECONDS 동안 요청 간 캐시 (분리된 사본 반환)"""
+    cached = _cached_user(email)
+    if cached is not None:
+        return cached
+    return _remember_user(session.exec(select(User).where(User.email == email)).first())
+
+
+async def lookup_user_by_email_async(session, email: str) -> Optional[User]:
+    """lookup_user_by_email 의 async 세션 버전"""
+    cached = _cached_user(email)
+    if cached is not None:
+        return cached
+    result = await session.exec(select(User).where(User.email == email))
+    return _remember_user(result.first())
+
+
+def invalidate_cached_user(email: Optional[str]) -> None:
+    if email:
+        cache.delete(f"{USER_CACHE_PREFIX}{email}")
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user_on_change(mapper, connection, target: User) -> None:
+    # 프로필/권한/활성 상태가 바뀌면 캐시된 사용자 즉시 제거 (이메일 변경 시 이전 키 포함)
+    invalidate_cached_user(target.email)
+    for previous_email in inspect(target).attrs.email.history.deleted or ():
+        invalidate_cached_user(previous_email)
+
+
+def resolve_request_user(request: Request, session: Session) -> Optional[User]:
+    """요청당 한 번만 세션 토큰을 해석해 사용자를 찾고 request.state 에 보관
+
+    localization 미들웨어와 get_current_user 가 같은 결과를 공유하므로
+    한 요청에서 JWT 디코딩과 사용자 조회는 최대 한 번만 일어납니다.
+    """
+    state = request.state
+    if hasattr(state, "current_user"):
+        return state.current_user
     token: Optional[str] = auth_manager.extract_token(request)
     if not token:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+        state.current_user = None
+        return None
+    email = auth_manager.decode_token(token)
+    state.current_user = lookup_user_by_email(session, email)
+    return state.current_user
 
+
+async def resolve_request_user_async(request: Request, session) -> Optional[User]:
+    """resolve_request_user 의 async 세션 버전 (결과는 같은 request.state 에 공유)"""
+    state = request.state
+    if hasattr(state, "current_user"):
+        return state.current_user
+    token: Optional[str] = auth_manager.extract_token(request)
+    if not token:
+        state.current_user = None
+        return None
     email = auth_manager.decode_token(token)
-    user = session.exec(select(User).where(User.email == email)).first()
+    state.current_user = await lookup_user_by_email_async(session, email)
+    return state.current_user
+
+
+def _ensure_active(user: Optional[User], *, token: Optional[str]) -> None:
+    if not token:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
     if not user.is_active:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Account inactive")
-    return user
+
+
+def get_current_user(request: Request, session=Depends(get_session)) -> User:
+    token: Optional[str] = auth_manager.extract_token(request)
+    cached_user = resolve_request_user(request, session) if token else None
+    _ensure_active(cached_user, token=token)
+    # 요청 세션에 쿼리 없이 연결 (라우트에서 수정/커밋 가능)
+    return session.merge(cached_user, load=False)
+
+
+async def get_current_user_async(request: Request, session=Depends(get_async_session)) -> User:
+    """async 라우트용 get_current_user (get_async_session 과 같은 세션에 연결)"""
+    token: Optional[str] = auth_manager.extract_token(request)
+    cached_user = await resolve_request_user_async(request, session) if token else None
+    _ensure_active(cached_user, token=token)
+    return await session.merge(cached_user, load=False)
 
 
 def require_roles(*roles: UserRole):
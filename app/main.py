@@ -1,3 +1,4 @@
+import hmac
 import logging
 import os
 import sys
@@ -20,20 +21,31 @@ from fastapi.templating import Jinja2Templates
 from sqlmodel import select
 
 from .auth import auth_manager
-from .database import get_session, session_context
-from .dependencies import get_current_user
+from .database import async_session_context, get_session
+from .dependencies import get_current_user, resolve_request_user_async
 from .models import SocialAccount, User
 
-from .routers import admin, ai_pd, auth, channels, dashboard, subscriptions
+from .routers import admin, ai_pd, auth, channels, dashboard, reports, subscriptions
 
 from .services.localization import translator
+from .services.metrics import http_request_duration, http_requests_in_flight, registry as metrics_registry, route_template
+from .services.query_stats import record_request as record_query_stats, track_queries
 from .services.social_auth import social_auth_service
 
-from .seo import get_seo_service, get_sitemap_generator, generate_robots_txt
+from .seo import get_seo_service, get_sitemap_generator, generate_robots_txt, preload_seo_services
 
 BASE_DIR = Path(__file__).resolve().parent
 UI_DIR = BASE_DIR.parent / "ui"
 
+# SEO head 를 미리 만들어 두는 공개 페이지 (페이지 키: 경로)
+SEO_PAGES = {
+    "home": "/",
+    "services": "/services",
+    "personal": "/personal",
+    "business": "/business",
+    "support": "/support",
+}
+
 app = FastAPI(title="Creator Control Center")
 app.state.asset_version = os.getenv("ASSET_VERSION", str(int(time.time())))
 
@@ -95,6 +107,9 @@ async def on_startup() -> None:
     logger.info("=" * 50)
     logger.info("Application startup completed - database will initialize on first request")
 
+    # 공개 랜딩 페이지 SEO head 미리 생성 (요청마다 JSON 로드/직렬화하지 않도록)
+    preload_seo_services(SEO_PAGES)
+
     # 캐시 정리 스케줄러 (10분마다)
     async def cleanup_cache_periodically():
         while True:
@@ -103,38 +118,65 @@ async def on_startup() -> None:
 
     asyncio.create_task(cleanup_cache_periodically())
 
+    # 채널 지표 이력 버퍼 주기적 기록
+    from .config import get_settings
+    from .services.metric_history import history_writer
 
-@app.middleware("http")
-async def performance_monitoring_middleware(request: Request, call_next):
-    """요청 시간 모니터링 미들웨어"""
-    start_time = time.time()
+    flush_interval = get_settings().metric_history_flush_seconds
 
-    response = await call_next(request)
+    async def flush_metric_history_periodically():
+        while True:
+            await asyncio.sleep(flush_interval)
+            await asyncio.to_thread(history_writer.flush)
 
-    process_time = time.time() - start_time
+    asyncio.create_task(flush_metric_history_periodically())
 
-    # 응답 헤더에 처리 시간 추가
-    response.headers["X-Process-Time"] = f"{process_time:.3f}s"
+    # 채널 스냅샷 백그라운드 갱신 (별도 워커로 돌릴 때는 비활성)
+    settings = get_settings()
+    if settings.refresh_scheduler_enabled:
+        from .services.refresh_scheduler import build_scheduler
 
-    # 느린 요청만 로깅 (1초 이상)
-    if process_time > 1.0:
-        logger.warning(
-            f"Slow request: {request.method} {request.url.path} "
-            f"took {process_time:.2f}s"
+        app.state.refresh_scheduler = build_scheduler()
+        asyncio.create_task(
+            app.state.refresh_scheduler.run_forever(settings.refresh_scheduler_tick_seconds)
         )
 
-    return response
+    # 슈퍼관리자 메일함 스냅샷 주기 갱신 (비활성이면 대시보드 조회 시 필요할 때만 갱신)
+    if settings.mailbox_poller_enabled:
+        from .services.mailbox_poller import mailbox_poller
+
+        asyncio.create_task(mailbox_poller.run_forever(settings.mailbox_refresh_seconds))
+
+    # 발송 메일 대기열 워커 (별도 워커로 돌릴 때는 비활성)
+    if settings.mail_queue_worker_enabled:
+        from .services.mail_queue import mail_worker
+
+        asyncio.create_task(mail_worker.run_forever(settings.mail_queue_poll_seconds))
+
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    from .services.connector_transport import close_transport
+    from .services.mail_queue import mail_worker
+    from .services.metric_history import history_writer
+    from .services.report_jobs import report_queue
+
+    # 남은 지표 이력 기록 및 커넥터 공용 HTTP 커넥션 풀 / 리포트 렌더링 프로세스 / SMTP 세션 정리
+    history_writer.flush()
+    close_transport()
+    report_queue.shutdown()
+    mail_worker.close()
 
 
 @app.middleware("http")
 async def localization_middleware(request: Request, call_next):
     locale = request.query_params.get("lang") or "ko"
-    token = request.cookies.get("session")
+    token = auth_manager.extract_token(request)
     if token:
         try:
-            email = auth_manager.decode_token(token)
-            with session_context() as session:
-                user = session.exec(select(User).where(User.email == email)).first()
+            # 조회 결과는 request.state 에 남아 get_current_user 가 재사용
+            async with async_session_context() as session:
+                user = await resolve_request_user_async(request, session)
                 if user:
                     locale = user.locale
         except Exception as e:
@@ -145,6 +187,61 @@ async def localization_middleware(request: Request, call_next):
     return response
 
 
+# 나중에 등록한 미들웨어가 바깥쪽에서 실행되므로 localization 의 사용자 조회까지 측정에 포함됨
+@app.middleware("http")
+async def performance_monitoring_middleware(request: Request, call_next):
+    """요청 시간 / 쿼리 수 모니터링 미들웨어 (/metrics 히스토그램은 경로 대신 라우트 템플릿 기준)"""
+    start_time = time.perf_counter()
+    http_requests_in_flight.inc()
+    status_code = 500
+    with track_queries(request.scope) as query_stats:
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+        finally:
+            process_time = time.perf_counter() - start_time
+            http_requests_in_flight.dec()
+            http_request_duration.observe(
+                process_time,
+                method=request.method,
+                route=route_template(request.scope),
+                status=str(status_code),
+            )
+            record_query_stats(query_stats)
+
+    # 응답 헤더에 처리 시간 / DB 사용량 추가
+    response.headers["X-Process-Time"] = f"{process_time:.3f}s"
+    response.headers["X-DB-Queries"] = str(query_stats.count)
+    response.headers["X-DB-Time"] = f"{query_stats.total_seconds:.3f}s"
+
+    # 느린 요청만 로깅 (1초 이상)
+    if process_time > 1.0:
+        logger.warning(
+            f"Slow request: {request.method} {request.url.path} "
+            f"took {process_time:.2f}s ({query_stats.count} queries, {query_stats.total_seconds:.2f}s in DB)"
+        )
+
+    return response
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics(request: Request):
+    """Prometheus 수집용 지표 (METRICS_TOKEN 설정 시 Bearer 토큰 필요)
+
+    토큰이 없으면 production 에서는 METRICS_PUBLIC=true 로 명시한 경우에만 공개합니다.
+    """
+    from .config import get_settings
+
+    settings = get_settings()
+    token = settings.metrics_token
+    if token:
+        if not hmac.compare_digest(request.headers.get("authorization", ""), f"Bearer {token}"):
+            return Response(status_code=401)
+    elif settings.is_production and not settings.metrics_public:
+        return Response(status_code=403)
+    return Response(content=metrics_registry.render(), media_type="text/plain; version=0.0.4")
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint for Cloud Run with database connection check"""
@@ -262,7 +359,7 @@ async def profile(
     user: User = Depends(get_current_user),
     session=Depends(get_session),
 ):
-    db_user = session.exec(select(User).where(User.id == user.id)).first() or user
+    db_user = user
     social_accounts = session.exec(
         select(SocialAccount).where(SocialAccount.user_id == db_user.id)
     ).all()
@@ -310,3 +407,4 @@ app.include_router(channels.router)
 app.include_router(admin.router)
 app.include_router(subscriptions.router)
 app.include_router(ai_pd.router)
+app.include_router(reports.router)
@@ -2,7 +2,7 @@ import enum
 from datetime import datetime
 from typing import Any, Dict, Optional
 
-from sqlalchemy import Column, UniqueConstraint
+from sqlalchemy import Column, ForeignKey, Index, Integer, UniqueConstraint
 from sqlalchemy.types import JSON
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -33,7 +33,7 @@ class User(SQLModel, table=True):
     password_login_enabled: bool = Field(default=True)
     privacy_consent: bool = Field(default=False)
     guidance_consent: bool = Field(default=False)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)  # 가입순 목록(키셋 페이지네이션)용 인덱스
     password_set_at: Optional[datetime] = None
 
     channels: list["ChannelAccount"] = Relationship(
@@ -89,6 +89,31 @@ class ChannelAccount(SQLModel, table=True):
         back_populates="channel",
         sa_relationship_kwargs={"uselist": False, "cascade": "all, delete-orphan"},
     )
+    metric_history: list["ChannelMetricSnapshot"] = Relationship(
+        back_populates="channel",
+        # 채널 삭제 시 이력은 DB 의 ON DELETE CASCADE 로 삭제 (이력 행을 메모리로 불러오지 않음)
+        sa_relationship_kwargs={"cascade": "all, delete-orphan", "passive_deletes": True},
+    )
+
+
+class ChannelMetricSnapshot(SQLModel, table=True):
+    """채널 지표 시계열 이력 (커넥터 조회 성공 시마다 1행 적재)"""
+    __table_args__ = (
+        Index("ix_channelmetricsnapshot_channel_captured", "channel_id", "captured_at"),  # 채널별 기간 조회
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    channel_id: int = Field(
+        sa_column=Column(Integer, ForeignKey("channelaccount.id", ondelete="CASCADE"), nullable=False)
+    )
+    captured_at: datetime = Field(default_factory=datetime.utcnow, index=True)  # 기간별 내보내기용 인덱스
+    followers: int = 0
+    engagement_rate: float = 0.0
+    impressions: int = 0  # 최근 게시물 노출 합계
+    likes: int = 0  # 최근 게시물 좋아요 합계
+    comments: int = 0  # 최근 게시물 댓글 합계
+
+    channel: ChannelAccount = Relationship(back_populates="metric_history")
 
 
 class ManagerCreatorLink(SQLModel, table=True):
@@ -330,3 +355,31 @@ class CreatorInquiry(SQLModel, table=True):
     created_at: datetime = Field(default_factory=datetime.utcnow, index=True)  # 정렬용 인덱스
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     responded_at: Optional[datetime] = None
+
+
+class OutboundEmailStatus(str, enum.Enum):
+    """발송 대기열 상태"""
+    PENDING = "pending"  # 발송 대기 (재시도 대기 포함)
+    SENDING = "sending"  # 워커가 가져가 발송 중 (next_attempt_at 까지 임대, 지나면 다시 가져감)
+    SENT = "sent"
+    FAILED = "failed"  # 최대 재시도 초과
+
+
+class OutboundEmail(SQLModel, table=True):
+    """발송 대기열 - 요청 핸들러는 기록만 하고 워커가 발송"""
+    __table_args__ = (
+        Index("ix_outboundemail_status_next_attempt", "status", "next_attempt_at"),  # 발송 대상 조회
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    to_address: str
+    subject: str
+    body: str
+    html: bool = False
+    transport: str = Field(default="auto")  # auto: Gmail API 우선, smtp: 슈퍼관리자 계정 SMTP
+    status: OutboundEmailStatus = Field(default=OutboundEmailStatus.PENDING)
+    attempts: int = 0
+    last_error: Optional[str] = None
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    next_attempt_at: datetime = Field(default_factory=datetime.utcnow)
+    sent_at: Optional[datetime] = None
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime, time, timedelta
 
 from fastapi import APIRouter, Depends, Form, HTTPException, Request, status
 from fastapi.responses import RedirectResponse
@@ -23,13 +23,12 @@ from ..models import (
     UserRole,
 )
 from ..services.localization import translator
-from ..services.super_admin_email import (
-    EmailConfigurationError,
-    EmailServiceError,
-    EmailReceiveError,
-    EmailSendError,
-    SuperAdminEmailService,
-)
+from ..services.mail_queue import TRANSPORT_SMTP, enqueue_email
+from ..services.mailbox_poller import mailbox_poller
+from ..services.pagination import cached_count, keyset_page, parse_page
+from ..services.portfolio_loader import load_portfolio
+from ..services.rate_limiter import rate_limiter
+from ..services.super_admin_email import SuperAdminEmailService
 
 router = APIRouter()
 TEST_EMAIL_RECIPIENT = "k931103@gmail.com"
@@ -44,22 +43,25 @@ def super_admin_dashboard(
     locale = user.locale
     strings = translator.load_locale(locale)
 
-    # 페이지네이션 추가 (기본 50개씩)
-    page = int(request.query_params.get("page", 1))
+    # 키셋 페이지네이션 (기본 50개씩, ?cursor= 로 다음 페이지)
+    page = parse_page(request.query_params.get("page"))
+    cursor = request.query_params.get("cursor")
     per_page = 50
-    offset = (page - 1) * per_page
 
-    # 전체 사용자 수 조회
-    from sqlalchemy import func
-    total_users = session.exec(select(func.count(User.id))).first() or 0
-
-    # 페이지별 사용자 조회 (성능 최적화)
-    users = session.exec(
-        select(User)
-        .order_by(User.created_at.desc())
-        .limit(per_page)
-        .offset(offset)
-    ).all()
+    # 전체 사용자 수 (짧게 캐시한 값)
+    total_users = cached_count(session, "users", User.id)
+
+    # 페이지별 사용자 조회 (created_at 인덱스 사용)
+    user_page = keyset_page(
+        session,
+        select(User),
+        sort_column=User.created_at,
+        tie_column=User.id,
+        per_page=per_page,
+        cursor=cursor,
+        page=page,
+    )
+    users = user_page.items
 
     # 구독 정보는 현재 페이지 사용자만 조회
     user_ids = [u.id for u in users]
@@ -95,21 +97,21 @@ def super_admin_dashboard(
     from ..services.ai_pd_service import AIPDService
     ai_system_prompt = AIPDService.get_system_prompt()
 
-    email_inbox = []
-    email_sent = []
-    email_error = None
-    email_service_configured = False
-    email_last_refreshed = None
-
-    try:
-        email_service_configured = SuperAdminEmailService.is_configured(settings)
-        if email_service_configured:
-            email_service = SuperAdminEmailService(settings)
-            email_inbox = email_service.fetch_inbox(limit=10)
-            email_sent = email_service.fetch_sent(limit=10)
-            email_last_refreshed = datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
-    except (EmailConfigurationError, EmailReceiveError, EmailServiceError) as exc:
-        email_error = str(exc)
+    # 메일함은 백그라운드에서 갱신된 스냅샷만 사용 (IMAP 응답을 기다리지 않음)
+    email_service_configured = SuperAdminEmailService.is_configured(settings)
+    mailbox = mailbox_poller.snapshot()
+    email_refreshing = False
+    if email_service_configured:
+        if request.query_params.get("refresh_mailbox"):
+            # 새로고침 버튼 - 갱신 주기와 관계없이 바로 백그라운드 갱신
+            email_refreshing = mailbox_poller.refresh_in_background()
+        elif not settings.mailbox_poller_enabled:
+            email_refreshing = mailbox_poller.refresh_if_stale(settings.mailbox_refresh_seconds)
+        # 아직 한 번도 읽지 못한 경우 (첫 갱신 진행 중)
+        email_refreshing = email_refreshing or mailbox_poller.is_refreshing() or (
+            mailbox.refreshed_at is None and mailbox.error is None
+        )
+    email_last_refreshed = mailbox.refreshed_at.strftime("%Y-%m-%d %H:%M UTC") if mailbox.refreshed_at else None
 
     response = request.app.state.templates.TemplateResponse(
         "super_admin.html",
@@ -133,22 +135,34 @@ def super_admin_dashboard(
             "gemini_api_key_set": gemini_api_key_set,
             "ai_system_prompt": ai_system_prompt,
             "email_service_configured": email_service_configured,
-            "email_error": email_error,
-            "email_inbox": email_inbox,
-            "email_sent": email_sent,
+            "email_error": mailbox.error,
+            "email_inbox": mailbox.inbox,
+            "email_sent": mailbox.sent,
             "super_admin_email": settings.super_admin_email,
             # 페이지네이션 정보
             "page": page,
             "per_page": per_page,
             "total_users": total_users,
             "total_pages": total_pages,
+            "next_cursor": user_page.next_cursor,
             "email_last_refreshed": email_last_refreshed,
+            "email_refreshing": email_refreshing,
         },
     )
 
     return response
 
 
+@router.get("/super-admin/email/mailbox")
+def super_admin_mailbox(
+    refresh: bool = False,
+    user: User = Depends(require_roles(UserRole.ADMIN, UserRole.SUPER_ADMIN)),
+):
+    """메일함 스냅샷 JSON (refresh=true 면 IMAP 에서 다시 읽은 뒤 반환)"""
+    snapshot = mailbox_poller.refresh() if refresh else mailbox_poller.snapshot()
+    return snapshot.to_dict()
+
+
 @router.post("/super-admin/email/send")
 def send_super_admin_email(
     to_address: str = Form(...),
@@ -167,12 +181,8 @@ def send_super_admin_email(
     if not subject.strip():
         raise HTTPException(status_code=400, detail="Subject is required.")
 
-    try:
-        service = SuperAdminEmailService(settings)
-        service.send_email(to_address=to_address, subject=subject, body=body)
-    except (EmailSendError, EmailServiceError) as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-
+    # 발송은 대기열 워커가 처리 (SMTP 연결을 요청 안에서 열지 않음)
+    enqueue_email(session, to_address, subject, body, transport=TRANSPORT_SMTP)
     session.add(
         ActivityLog(
             user_id=user.id,
@@ -208,12 +218,7 @@ def send_super_admin_test_email(
     except Exception:
         body = body_template
 
-    try:
-        service = SuperAdminEmailService(settings)
-        service.send_email(to_address=TEST_EMAIL_RECIPIENT, subject=subject, body=body)
-    except (EmailSendError, EmailServiceError) as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-
+    enqueue_email(session, TEST_EMAIL_RECIPIENT, subject, body, transport=TRANSPORT_SMTP)
     session.add(
         ActivityLog(
             user_id=user.id,
@@ -398,6 +403,14 @@ def update_payment_status(
     return RedirectResponse(url="/super-admin", status_code=status.HTTP_303_SEE_OTHER)
 
 
+@router.get("/super-admin/connectors/rate-limits")
+def connector_rate_limits(
+    user: User = Depends(require_roles(UserRole.ADMIN, UserRole.SUPER_ADMIN)),
+):
+    """커넥터 호출 제한 버킷 상태 (토큰 잔량, 차단 시간, 429 횟수, 누적 대기)"""
+    return {"enabled": rate_limiter.enabled, "buckets": rate_limiter.stats()}
+
+
 @router.get("/manager/dashboard")
 def manager_dashboard(
     request: Request,
@@ -405,74 +418,51 @@ def manager_dashboard(
     session=Depends(get_session),
 ):
     """기업 관리자 전용 대시보드 - 페이지네이션 지원"""
-    from sqlalchemy.orm import selectinload
-    from sqlalchemy import func
-    from ..models import ChannelAccount
-    from ..services.social_fetcher import fetch_channel_snapshots
-
     locale = user.locale
     strings = translator.load_locale(locale)
 
-    # 페이지네이션 파라미터
-    page = int(request.query_params.get("page", 1))
+    # 키셋 페이지네이션 파라미터
+    page = parse_page(request.query_params.get("page"))
+    cursor = request.query_params.get("cursor")
     per_page = 20  # 페이지당 크리에이터 수
-    offset = (page - 1) * per_page
 
-    # 매니저와 연결된 링크 총 개수
-    total_links = session.exec(
-        select(func.count(ManagerCreatorLink.id))
-        .where(ManagerCreatorLink.manager_id == user.id)
-    ).first() or 0
+    # 매니저와 연결된 링크 총 개수 (짧게 캐시한 값)
+    total_links = cached_count(
+        session,
+        f"manager_links:{user.id}",
+        ManagerCreatorLink.creator_id,
+        ManagerCreatorLink.manager_id == user.id,
+    )
 
     total_pages = (total_links + per_page - 1) // per_page
 
-    # 매니저와 연결된 모든 링크 조회 (페이지네이션 적용)
-    all_links = session.exec(
-        select(ManagerCreatorLink)
-        .where(ManagerCreatorLink.manager_id == user.id)
-        .order_by(ManagerCreatorLink.connected_at.desc())
-        .limit(per_page)
-        .offset(offset)
-    ).all()
-
-    # 승인된 링크와 대기 중인 링크 분리
-    approved_creators = [link for link in all_links if link.approved]
-    pending_approvals = [link for link in all_links if not link.approved]
+    # 매니저와 연결된 링크 조회 (connected_at 인덱스 사용, 같은 시각은 creator_id 로 구분)
+    link_page = keyset_page(
+        session,
+        select(ManagerCreatorLink).where(ManagerCreatorLink.manager_id == user.id),
+        sort_column=ManagerCreatorLink.connected_at,
+        tie_column=ManagerCreatorLink.creator_id,
+        per_page=per_page,
+        cursor=cursor,
+        page=page,
+    )
+    all_links = link_page.items
 
-    # 크리에이터 정보 조회 (N+1 쿼리 방지)
-    creator_ids = [link.creator_id for link in all_links]
-    creators = session.exec(
-        select(User)
-        .where(User.id.in_(creator_ids))
-        .options(selectinload(User.social_accounts))  # 소셜 계정 미리 로드
-    ).all() if creator_ids else []
-    creator_lookup = {c.id: c for c in creators}
+    # 페이지의 크리에이터/채널/스냅샷 일괄 로드 (N+1 쿼리 방지)
+    portfolio = load_portfolio(session, user.id, links=all_links, with_social_accounts=True)
+    approved_creators = portfolio.approved_links
+    pending_approvals = portfolio.pending_links
+    creator_lookup = portfolio.creator_lookup
 
     # 크리에이터별 구독 정보
+    creator_ids = [link.creator_id for link in all_links]
     subscriptions = session.exec(select(Subscription).where(Subscription.user_id.in_(creator_ids))).all() if creator_ids else []
     creator_subscriptions = {s.user_id: s for s in subscriptions}
 
-    # 승인된 크리에이터의 채널 정보
-    approved_creator_ids = [link.creator_id for link in approved_creators]
-    creator_channels_list = session.exec(
-        select(ChannelAccount)
-        .where(ChannelAccount.owner_id.in_(approved_creator_ids))
-        .options(selectinload(ChannelAccount.credential))
-    ).all() if approved_creator_ids else []
-
-    # 크리에이터별로 채널 그룹화
-    creator_channels = {}
-    for channel in creator_channels_list:
-        if channel.owner_id not in creator_channels:
-            creator_channels[channel.owner_id] = []
-        creator_channels[channel.owner_id].append(channel)
-
-    # 채널 수 카운트
+    creator_channels = portfolio.creator_channels
     creator_channel_counts = {creator_id: len(channels) for creator_id, channels in creator_channels.items()}
     total_channels = sum(creator_channel_counts.values())
-
-    # 모든 채널의 스냅샷 가져오기
-    creator_snapshots = fetch_channel_snapshots(creator_channels_list)
+    creator_snapshots = portfolio.snapshots
 
     # API 키 존재 여부 확인
     api_key_record = session.exec(select(ManagerAPIKey).where(ManagerAPIKey.manager_id == user.id)).first()
@@ -507,64 +497,91 @@ def manager_dashboard(
             "per_page": per_page,
             "total_links": total_links,
             "total_pages": total_pages,
+            "next_cursor": link_page.next_cursor,
         },
     )
 
 
-@router.get("/manager/dashboard/export/pdf")
-def export_manager_dashboard_pdf(
-    user: User = Depends(require_roles(UserRole.MANAGER, UserRole.ADMIN, UserRole.SUPER_ADMIN)),
-    session=Depends(get_session),
-):
-    """매니저가 관리하는 크리에이터 포트폴리오를 PDF로 내보내기"""
-    from fastapi.responses import StreamingResponse
-    from datetime import datetime
+def _portfolio_report(session, user: User) -> dict:
+    """승인된 크리에이터 전체의 통합 리포트 입력"""
+    from ..services.report_jobs import manager_payload
+
+    portfolio = load_portfolio(session, user.id)
+    return manager_payload(user, portfolio.approved_creators, portfolio.creator_channels, portfolio.snapshots)
+
+
+def _creator_report(session, user: User, creator_id: int) -> dict:
+    """매니저가 승인받은 크리에이터 한 명의 리포트 입력 (권한 없으면 403)"""
     from sqlalchemy.orm import selectinload
     from ..models import ChannelAccount
+    from ..services.report_jobs import dashboard_payload
     from ..services.social_fetcher import fetch_channel_snapshots
-    from ..services.pdf_generator import generate_manager_pdf
 
-    # 승인된 크리에이터 조회
-    approved_links = session.exec(
+    link = session.exec(
         select(ManagerCreatorLink)
         .where(ManagerCreatorLink.manager_id == user.id)
-        .where(ManagerCreatorLink.approved == True)
+        .where(ManagerCreatorLink.creator_id == creator_id)
+        .where(ManagerCreatorLink.approved == True)  # noqa: E712
+    ).first()
+
+    if not link:
+        raise HTTPException(status_code=403, detail="접근 권한이 없습니다.")
+
+    creator = session.get(User, creator_id)
+    if not creator:
+        raise HTTPException(status_code=404, detail="크리에이터를 찾을 수 없습니다.")
+
+    channels = session.exec(
+        select(ChannelAccount)
+        .where(ChannelAccount.owner_id == creator_id)
+        .options(selectinload(ChannelAccount.credential))
     ).all()
+    snapshots = fetch_channel_snapshots(channels)
+    # 대시보드용 리포트 재사용
+    return dashboard_payload(creator, channels, snapshots)
 
-    creator_ids = [link.creator_id for link in approved_links]
-    creators = session.exec(
-        select(User).where(User.id.in_(creator_ids))
-    ).all() if creator_ids else []
 
-    # 크리에이터별 채널 정보
-    creator_channels = {}
-    if creator_ids:
-        channels = session.exec(
-            select(ChannelAccount)
-            .where(ChannelAccount.owner_id.in_(creator_ids))
-            .options(selectinload(ChannelAccount.credential))
-        ).all()
+def _pdf_response(pdf: bytes, filename: str):
+    from fastapi.responses import Response
 
-        for channel in channels:
-            if channel.owner_id not in creator_channels:
-                creator_channels[channel.owner_id] = []
-            creator_channels[channel.owner_id].append(channel)
+    return Response(
+        content=pdf,
+        media_type="application/pdf",
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
 
-    # 스냅샷 가져오기
-    all_channels = [ch for channels in creator_channels.values() for ch in channels]
-    creator_snapshots = fetch_channel_snapshots(all_channels)
 
-    # PDF 생성
-    pdf_buffer = generate_manager_pdf(user, creators, creator_channels, creator_snapshots)
+@router.get("/manager/dashboard/export/pdf")
+def export_manager_dashboard_pdf(
+    user: User = Depends(require_roles(UserRole.MANAGER, UserRole.ADMIN, UserRole.SUPER_ADMIN)),
+    session=Depends(get_session),
+):
+    """매니저가 관리하는 크리에이터 포트폴리오를 PDF로 내보내기"""
+    from ..services.report_jobs import report_queue
 
     timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
     filename = f"manager_portfolio_{timestamp}.pdf"
+    pdf = report_queue.render("manager", _portfolio_report(session, user), owner_id=user.id, filename=filename)
+    return _pdf_response(pdf, filename)
 
-    return StreamingResponse(
-        pdf_buffer,
-        media_type="application/pdf",
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
+
+@router.post("/manager/export/pdf/jobs", status_code=status.HTTP_202_ACCEPTED)
+def submit_manager_pdf_job(
+    user: User = Depends(require_roles(UserRole.MANAGER, UserRole.ADMIN, UserRole.SUPER_ADMIN)),
+    session=Depends(get_session),
+):
+    """통합 PDF 렌더링 작업 제출 - /reports/{job_id} 로 상태 확인 후 다운로드"""
+    from ..services.report_jobs import report_queue
+    from .reports import job_summary
+
+    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    job = report_queue.submit(
+        "manager",
+        _portfolio_report(session, user),
+        owner_id=user.id,
+        filename=f"manager_report_{timestamp}.pdf",
     )
+    return job_summary(job)
 
 
 @router.post("/manager/approve")
@@ -686,59 +703,17 @@ def view_creator_detail(
 
 
 @router.get("/manager/export/pdf")
-def export_manager_dashboard_pdf(
+def export_manager_report_pdf(
     user: User = Depends(require_roles(UserRole.MANAGER, UserRole.ADMIN, UserRole.SUPER_ADMIN)),
     session=Depends(get_session),
 ):
     """기업 관리자용 통합 PDF 리포트 다운로드"""
-    from fastapi.responses import StreamingResponse
-    from sqlalchemy.orm import selectinload
-    from ..models import ChannelAccount
-    from ..services.social_fetcher import fetch_channel_snapshots
-    from ..services.pdf_generator import generate_manager_pdf
-
-    # 승인된 크리에이터 정보 조회
-    approved_links = session.exec(
-        select(ManagerCreatorLink)
-        .where(ManagerCreatorLink.manager_id == user.id)
-        .where(ManagerCreatorLink.approved == True)  # noqa: E712
-    ).all()
-
-    creator_ids = [link.creator_id for link in approved_links]
-    # N+1 쿼리 방지: selectinload로 관련 데이터 미리 로드
-    creators = session.exec(
-        select(User)
-        .where(User.id.in_(creator_ids))
-        .options(selectinload(User.social_accounts))  # 소셜 계정 미리 로드
-    ).all() if creator_ids else []
-
-    # 크리에이터별 채널 정보
-    creator_channels_list = session.exec(
-        select(ChannelAccount)
-        .where(ChannelAccount.owner_id.in_(creator_ids))
-        .options(selectinload(ChannelAccount.credential))
-    ).all() if creator_ids else []
-
-    creator_channels = {}
-    for channel in creator_channels_list:
-        if channel.owner_id not in creator_channels:
-            creator_channels[channel.owner_id] = []
-        creator_channels[channel.owner_id].append(channel)
-
-    # 스냅샷 조회
-    creator_snapshots = fetch_channel_snapshots(creator_channels_list)
-
-    # PDF 생성
-    pdf_buffer = generate_manager_pdf(user, creators, creator_channels, creator_snapshots)
+    from ..services.report_jobs import report_queue
 
     timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
     filename = f"manager_report_{timestamp}.pdf"
-
-    return StreamingResponse(
-        pdf_buffer,
-        media_type="application/pdf",
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
-    )
+    pdf = report_queue.render("manager", _portfolio_report(session, user), owner_id=user.id, filename=filename)
+    return _pdf_response(pdf, filename)
 
 
 @router.get("/manager/creator/{creator_id}/export/csv")
@@ -748,12 +723,9 @@ def export_creator_csv(
     session=Depends(get_session),
 ):
     """특정 크리에이터의 데이터를 CSV로 내보내기"""
-    import csv
-    import io
-    from fastapi.responses import StreamingResponse
     from sqlalchemy.orm import selectinload
     from ..models import ChannelAccount
-    from ..services.social_fetcher import fetch_channel_snapshots
+    from ..services.csv_export import csv_response, iter_channel_snapshots
 
     # 권한 확인
     link = session.exec(
@@ -775,14 +747,24 @@ def export_creator_csv(
         .where(ChannelAccount.owner_id == creator_id)
         .options(selectinload(ChannelAccount.credential))
     ).all()
-    snapshots = fetch_channel_snapshots(channels)
 
-    # CSV 생성
-    output = io.StringIO()
-    writer = csv.writer(output)
+    def rows():
+        # 채널 묶음별로 스냅샷을 조회하며 바로 행을 내보냄
+        for channel, snapshot in iter_channel_snapshots(channels):
+            yield [
+                creator.email,
+                creator.name or "-",
+                channel.platform,
+                channel.account_name,
+                snapshot.get("followers", 0),
+                snapshot.get("growth_rate", 0),
+                snapshot.get("engagement_rate", 0),
+                snapshot.get("last_post_date", "")[:10] if snapshot.get("last_post_date") else "-",
+            ]
 
-    # 헤더
-    writer.writerow([
+    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    filename = f"creator_{creator_id}_report_{timestamp}.csv"
+    header = [
         "크리에이터 이메일",
         "크리에이터 이름",
         "플랫폼",
@@ -790,31 +772,40 @@ def export_creator_csv(
         "팔로워",
         "성장률(%)",
         "참여율(%)",
-        "최근 게시일"
-    ])
-
-    # 데이터
-    for channel in channels:
-        snapshot = snapshots.get(channel.id, {})
-        writer.writerow([
-            creator.email,
-            creator.name or "-",
-            channel.platform,
-            channel.account_name,
-            snapshot.get("followers", 0),
-            snapshot.get("growth_rate", 0),
-            snapshot.get("engagement_rate", 0),
-            snapshot.get("last_post_date", "")[:10] if snapshot.get("last_post_date") else "-"
-        ])
-
-    output.seek(0)
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    filename = f"creator_{creator_id}_report_{timestamp}.csv"
+        "최근 게시일",
+    ]
+    return csv_response(filename, header, rows())
+
 
+@router.get("/manager/export/portfolio")
+def export_manager_portfolio(
+    format: str = "csv",
+    since: date | None = None,
+    until: date | None = None,
+    user: User = Depends(require_roles(UserRole.MANAGER, UserRole.ADMIN, UserRole.SUPER_ADMIN)),
+):
+    """승인된 모든 크리에이터의 채널 지표 이력을 기간별로 일괄 내보내기 (CSV / NDJSON / Parquet)
+
+    기간 기본값은 최근 30일이며 until 당일까지 포함합니다.
+    """
+    from fastapi.responses import StreamingResponse
+    from ..services.portfolio_export import MEDIA_TYPES, PortfolioExportError, stream_portfolio_export
+
+    until_at = datetime.combine(until or datetime.utcnow().date(), time.min) + timedelta(days=1)
+    since_at = datetime.combine(since, time.min) if since else until_at - timedelta(days=30)
+    if since_at >= until_at:
+        raise HTTPException(status_code=400, detail="since 는 until 보다 이전이어야 합니다.")
+
+    try:
+        body = stream_portfolio_export(user.id, since_at, until_at, format)
+    except PortfolioExportError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    filename = f"portfolio_{since_at:%Y%m%d}_{(until_at - timedelta(days=1)):%Y%m%d}.{format}"
     return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
+        body,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
     )
 
 
@@ -825,45 +816,34 @@ def export_creator_pdf(
     session=Depends(get_session),
 ):
     """특정 크리에이터의 데이터를 PDF로 내보내기"""
-    from fastapi.responses import StreamingResponse
-    from sqlalchemy.orm import selectinload
-    from ..models import ChannelAccount
-    from ..services.social_fetcher import fetch_channel_snapshots
-    from ..services.pdf_generator import generate_dashboard_pdf
-
-    # 권한 확인
-    link = session.exec(
-        select(ManagerCreatorLink)
-        .where(ManagerCreatorLink.manager_id == user.id)
-        .where(ManagerCreatorLink.creator_id == creator_id)
-        .where(ManagerCreatorLink.approved == True)  # noqa: E712
-    ).first()
+    from ..services.report_jobs import report_queue
 
-    if not link:
-        raise HTTPException(status_code=403, detail="접근 권한이 없습니다.")
+    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    filename = f"creator_{creator_id}_report_{timestamp}.pdf"
+    pdf = report_queue.render(
+        "dashboard", _creator_report(session, user, creator_id), owner_id=user.id, filename=filename
+    )
+    return _pdf_response(pdf, filename)
 
-    creator = session.get(User, creator_id)
-    if not creator:
-        raise HTTPException(status_code=404, detail="크리에이터를 찾을 수 없습니다.")
 
-    channels = session.exec(
-        select(ChannelAccount)
-        .where(ChannelAccount.owner_id == creator_id)
-        .options(selectinload(ChannelAccount.credential))
-    ).all()
-    snapshots = fetch_channel_snapshots(channels)
-
-    # PDF 생성 (대시보드용 함수 재사용)
-    pdf_buffer = generate_dashboard_pdf(creator, channels, snapshots)
+@router.post("/manager/creator/{creator_id}/export/pdf/jobs", status_code=status.HTTP_202_ACCEPTED)
+def submit_creator_pdf_job(
+    creator_id: int,
+    user: User = Depends(require_roles(UserRole.MANAGER, UserRole.ADMIN, UserRole.SUPER_ADMIN)),
+    session=Depends(get_session),
+):
+    """크리에이터 PDF 렌더링 작업 제출 - /reports/{job_id} 로 상태 확인 후 다운로드"""
+    from ..services.report_jobs import report_queue
+    from .reports import job_summary
 
     timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    filename = f"creator_{creator_id}_report_{timestamp}.pdf"
-
-    return StreamingResponse(
-        pdf_buffer,
-        media_type="application/pdf",
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    job = report_queue.submit(
+        "dashboard",
+        _creator_report(session, user, creator_id),
+        owner_id=user.id,
+        filename=f"creator_{creator_id}_report_{timestamp}.pdf",
     )
+    return job_summary(job)
 
 
 # ==================== Gemini API 키 관리 ====================
@@ -962,46 +942,12 @@ def create_inquiry(
         status=InquiryStatus.PENDING
     )
     session.add(inquiry)
-    session.commit()
-
-    # 크리에이터에게 이메일 알림 전송
-    try:
-        from ..services.gmail_service import GmailService, send_notification_email
-
-        # Gmail API 사용 시도 (우선순위 1)
-        if GmailService.is_configured():
-            creator = session.get(User, creator_id)
-            if creator:
-                email_subject = f"[Creator Control Center] 새로운 문의: {subject}"
-                email_body = f"""안녕하세요 {creator.name or creator.email}님,
-
-관리자로부터 새로운 문의가 도착했습니다.
-
-[문의 정보]
-카테고리: {category.value}
-제목: {subject}
-
-{message}
 
-대시보드에서 확인하세요: https://creatorcontrol.center/dashboard
-
-감사합니다.
-Creator Control Center
-"""
-                send_notification_email(creator.email, email_subject, email_body)
-        else:
-            # Fallback to SMTP/IMAP
-            from ..services.super_admin_email import SuperAdminEmailService
-            from ..config import get_settings
-            settings = get_settings()
-
-            if SuperAdminEmailService.is_configured(settings):
-                email_service = SuperAdminEmailService(settings)
-                creator = session.get(User, creator_id)
-
-                if creator:
-                    email_subject = f"[Creator Control Center] 새로운 문의: {subject}"
-                    email_body = f"""안녕하세요 {creator.name or creator.email}님,
+    # 크리에이터에게 이메일 알림 (문의와 같은 트랜잭션으로 발송 예약)
+    creator = session.get(User, creator_id)
+    if creator:
+        email_subject = f"[Creator Control Center] 새로운 문의: {subject}"
+        email_body = f"""안녕하세요 {creator.name or creator.email}님,
 
 관리자로부터 새로운 문의가 도착했습니다.
 
@@ -1016,12 +962,8 @@ Creator Control Center
 감사합니다.
 Creator Control Center
 """
-                    email_service.send_email(creator.email, email_subject, email_body)
-    except Exception as e:
-        # 이메일 전송 실패해도 문의 생성은 성공
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.warning(f"Failed to send inquiry notification email: {e}")
+        enqueue_email(session, creator.email, email_subject, email_body)
+    session.commit()
 
     return RedirectResponse(
         url=f"/manager/inquiries?created=true",
@@ -1037,27 +979,31 @@ def view_inquiries(
 ):
     """모든 문의 조회 (페이지네이션 적용)"""
     from sqlalchemy.orm import selectinload
-    from sqlalchemy import func
 
-    # 페이지네이션
-    page = int(request.query_params.get("page", 1))
+    # 키셋 페이지네이션
+    page = parse_page(request.query_params.get("page"))
+    cursor = request.query_params.get("cursor")
     per_page = 30
-    offset = (page - 1) * per_page
 
-    # 전체 문의 수 조회
-    total_inquiries = session.exec(
-        select(func.count(CreatorInquiry.id))
-        .where(CreatorInquiry.manager_id == user.id)
-    ).first() or 0
+    # 전체 문의 수 (짧게 캐시한 값)
+    total_inquiries = cached_count(
+        session,
+        f"inquiries:{user.id}",
+        CreatorInquiry.id,
+        CreatorInquiry.manager_id == user.id,
+    )
 
-    # 페이지별 문의 조회 (성능 최적화)
-    inquiries = session.exec(
-        select(CreatorInquiry)
-        .where(CreatorInquiry.manager_id == user.id)
-        .order_by(CreatorInquiry.created_at.desc())
-        .limit(per_page)
-        .offset(offset)
-    ).all()
+    # 페이지별 문의 조회 (created_at 인덱스 사용)
+    inquiry_page = keyset_page(
+        session,
+        select(CreatorInquiry).where(CreatorInquiry.manager_id == user.id),
+        sort_column=CreatorInquiry.created_at,
+        tie_column=CreatorInquiry.id,
+        per_page=per_page,
+        cursor=cursor,
+        page=page,
+    )
+    inquiries = inquiry_page.items
 
     # 페이지 정보
     total_pages = (total_inquiries + per_page - 1) // per_page
@@ -1093,6 +1039,7 @@ def view_inquiries(
             "per_page": per_page,
             "total_inquiries": total_inquiries,
             "total_pages": total_pages,
+            "next_cursor": inquiry_page.next_cursor,
         },
     )
 
@@ -1220,18 +1167,11 @@ def send_inquiry_response(
             details=f"문의 #{inquiry_id} 답변 완료"
         )
     )
-    session.commit()
-
-    # 크리에이터에게 답변 이메일 알림 전송
-    try:
-        from ..services.gmail_service import GmailService, send_notification_email
-
-        # Gmail API 사용 시도 (우선순위 1)
-        if GmailService.is_configured():
-            creator = session.get(User, inquiry.creator_id)
-            if creator:
-                email_subject = f"[Creator Control Center] 문의 답변: {inquiry.subject}"
-                email_body = f"""안녕하세요 {creator.name or creator.email}님,
+    # 크리에이터에게 답변 이메일 알림 (답변과 같은 트랜잭션으로 발송 예약)
+    creator = session.get(User, inquiry.creator_id)
+    if creator:
+        email_subject = f"[Creator Control Center] 문의 답변: {inquiry.subject}"
+        email_body = f"""안녕하세요 {creator.name or creator.email}님,
 
 귀하의 문의에 대한 답변이 도착했습니다.
 
@@ -1247,41 +1187,9 @@ def send_inquiry_response(
 감사합니다.
 Creator Control Center
 """
-                send_notification_email(creator.email, email_subject, email_body)
-        else:
-            # Fallback to SMTP/IMAP
-            from ..services.super_admin_email import SuperAdminEmailService
-            from ..config import get_settings
-            settings = get_settings()
-
-            if SuperAdminEmailService.is_configured(settings):
-                email_service = SuperAdminEmailService(settings)
-                creator = session.get(User, inquiry.creator_id)
-
-                if creator:
-                    email_subject = f"[Creator Control Center] 문의 답변: {inquiry.subject}"
-                    email_body = f"""안녕하세요 {creator.name or creator.email}님,
-
-귀하의 문의에 대한 답변이 도착했습니다.
-
-[원래 문의]
-제목: {inquiry.subject}
-내용: {inquiry.message[:200]}{"..." if len(inquiry.message) > 200 else ""}
-
-[답변]
-{final_response}
-
-대시보드에서 확인하세요: https://creatorcontrol.center/dashboard
+        enqueue_email(session, creator.email, email_subject, email_body)
+    session.commit()
 
-감사합니다.
-Creator Control Center
-"""
-                    email_service.send_email(creator.email, email_subject, email_body)
-    except Exception as e:
-        # 이메일 전송 실패해도 답변 저장은 성공
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.warning(f"Failed to send inquiry response notification email: {e}")
 
     return RedirectResponse(
         url=f"/manager/inquiries?answered={inquiry_id}",
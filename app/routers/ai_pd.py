@@ -6,8 +6,6 @@ This is a PREMIUM feature that requires PRO or ENTERPRISE subscription.
 Note: The /ai-pd dashboard route has been removed.
 AI PD features are now fully integrated into the creator and manager dashboards.
 """
-from typing import Dict, List
-
 from fastapi import APIRouter, Depends, Form, HTTPException, Request
 from sqlalchemy.orm import selectinload
 from sqlmodel import select
@@ -16,7 +14,6 @@ from ..database import get_session
 from ..dependencies import get_current_user, check_feature_access
 from ..models import (
     ChannelAccount,
-    ManagerCreatorLink,
     User,
     UserRole,
 )
@@ -25,6 +22,7 @@ from ..services.ai_pd_service import (
     APIKeyNotConfiguredError,
     AIGenerationError,
 )
+from ..services.portfolio_loader import load_portfolio
 from ..services.social_fetcher import fetch_channel_snapshots
 
 router = APIRouter()
@@ -66,38 +64,15 @@ def ask_ai_pd(
             )
 
         elif user.role in [UserRole.MANAGER, UserRole.ADMIN]:
-            # Manager asking about their portfolio
-            links = session.exec(
-                select(ManagerCreatorLink)
-                .where(ManagerCreatorLink.manager_id == user.id)
-                .where(ManagerCreatorLink.approved == True)
-            ).all()
-
-            creator_ids = [link.creator_id for link in links]
-            creators = session.exec(
-                select(User).where(User.id.in_(creator_ids))
-            ).all() if creator_ids else []
-
-            # Get all channels and snapshots
-            all_channels: Dict[int, List[ChannelAccount]] = {}
-            all_snapshots: Dict[int, Dict[int, Dict]] = {}
-
-            for creator in creators:
-                channels = session.exec(
-                    select(ChannelAccount)
-                    .where(ChannelAccount.owner_id == creator.id)
-                    .options(selectinload(ChannelAccount.credential))
-                ).all()
-                all_channels[creator.id] = list(channels)
-                snapshots = fetch_channel_snapshots(channels)
-                all_snapshots[creator.id] = snapshots
+            # Manager asking about their portfolio (고정 쿼리 수 + 스냅샷 일괄 조회)
+            portfolio = load_portfolio(session, user.id)
 
             response = ai_pd_service.analyze_manager_portfolio(
                 session=session,
                 manager=user,
-                creators=list(creators),
-                all_channels=all_channels,
-                all_snapshots=all_snapshots,
+                creators=portfolio.approved_creators,
+                all_channels=portfolio.creator_channels,
+                all_snapshots=portfolio.snapshots_by_creator(),
                 question=question
             )
 
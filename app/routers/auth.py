@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import secrets
@@ -17,8 +18,8 @@ from ..auth import auth_manager
 
 logger = logging.getLogger(__name__)
 from ..config import get_settings
-from ..database import get_session
-from ..dependencies import get_current_user
+from ..database import get_async_session, get_session
+from ..dependencies import get_current_user, get_current_user_async
 from ..models import (
     ActivityLog,
     SocialAccount,
@@ -132,9 +133,9 @@ async def _fetch_social_profile(
     raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="unsupported_provider")
 
 
-def _upsert_social_user(
+async def _upsert_social_user(
     *,
-    session: Session,
+    session,
     provider: SocialProvider,
     provider_user_id: str,
     email: str,
@@ -142,23 +143,25 @@ def _upsert_social_user(
     role: UserRole,
     locale: str,
 ) -> User:
-    social_account = session.exec(
-        select(SocialAccount)
-        .where(SocialAccount.provider == provider)
-        .where(SocialAccount.provider_user_id == provider_user_id)
+    social_account = (
+        await session.exec(
+            select(SocialAccount)
+            .where(SocialAccount.provider == provider)
+            .where(SocialAccount.provider_user_id == provider_user_id)
+        )
     ).first()
 
     if social_account:
-        user = session.get(User, social_account.user_id)
+        user = await session.get(User, social_account.user_id)
         if user:
             return user
-        session.delete(social_account)
-        session.commit()
+        await session.delete(social_account)
+        await session.commit()
 
-    user = session.exec(select(User).where(User.email == email)).first()
+    user = (await session.exec(select(User).where(User.email == email))).first()
     created_now = False
     if not user:
-        hashed_password = auth_manager.hash_password(secrets.token_urlsafe(32))
+        hashed_password = await auth_manager.hash_password_async(secrets.token_urlsafe(32))
         user = User(
             email=email,
             hashed_password=hashed_password,
@@ -174,8 +177,8 @@ def _upsert_social_user(
             password_set_at=datetime.utcnow(),
         )
         session.add(user)
-        session.commit()
-        session.refresh(user)
+        await session.commit()
+        await session.refresh(user)
 
         subscription = Subscription(
             user_id=user.id,
@@ -185,7 +188,7 @@ def _upsert_social_user(
         )
         session.add(subscription)
         session.add(ActivityLog(user_id=user.id, action=f"signup_social_{provider.value}"))
-        session.commit()
+        await session.commit()
         created_now = True
     else:
         if not user.name and name:
@@ -194,12 +197,14 @@ def _upsert_social_user(
         if not user.is_email_verified:
             user.is_email_verified = True
             session.add(user)
-        session.commit()
+        await session.commit()
 
-    existing_link = session.exec(
-        select(SocialAccount)
-        .where(SocialAccount.provider == provider)
-        .where(SocialAccount.user_id == user.id)
+    existing_link = (
+        await session.exec(
+            select(SocialAccount)
+            .where(SocialAccount.provider == provider)
+            .where(SocialAccount.user_id == user.id)
+        )
     ).first()
     if not existing_link:
         social_account = SocialAccount(
@@ -211,11 +216,25 @@ def _upsert_social_user(
         session.add(social_account)
         action = "signup" if created_now else "link"
         session.add(ActivityLog(user_id=user.id, action=f"{action}_{provider.value}"))
-        session.commit()
+        await session.commit()
 
     return user
 
 
+async def _link_social_account(
+    session, user: User, provider: SocialProvider, provider_user_id: str
+) -> SocialAccount:
+    """async 세션에서 social_auth_service.link_account 실행"""
+    return await session.run_sync(
+        lambda sync_session: social_auth_service.link_account(
+            session=sync_session,
+            user=user,
+            provider=provider,
+            provider_user_id=provider_user_id,
+        )
+    )
+
+
 @router.get("/oauth/{provider}")
 async def start_social_oauth(provider: str, request: Request):
     locale = _determine_locale(request)
@@ -262,7 +281,7 @@ async def start_social_oauth(provider: str, request: Request):
 async def social_oauth_callback(
     provider: str,
     request: Request,
-    session: Session = Depends(get_session),
+    session=Depends(get_async_session),
 ):
     form_data: Optional[Dict[str, Any]] = None
     if request.method == "POST":
@@ -333,7 +352,7 @@ async def social_oauth_callback(
     except ValueError:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="unsupported_provider")
 
-    user = _upsert_social_user(
+    user = await _upsert_social_user(
         session=session,
         provider=provider_enum,
         provider_user_id=str(provider_user_id),
@@ -342,18 +361,18 @@ async def social_oauth_callback(
         role=role,
         locale=locale,
     )
-
     session.add(ActivityLog(user_id=user.id, action=f"login_social_{provider_enum.value}"))
-    session.commit()
+    await session.commit()
+    user_email, user_role = user.email, user.role
 
-    auth_token = auth_manager.create_access_token(user.email)
+    auth_token = auth_manager.create_access_token(user_email)
 
     # Role별 자동 리다이렉트
     # SUPER_ADMIN은 /dashboard로 이동 (모든 페이지 접근 가능)
     # /super-admin은 수동으로 접속해야 함
     if next_url:
         redirect_target = next_url
-    elif user.role == UserRole.MANAGER:
+    elif user_role == UserRole.MANAGER:
         redirect_target = "/manager/dashboard"
     else:
         # CREATOR, SUPER_ADMIN 등은 모두 /dashboard로
@@ -394,19 +413,19 @@ def login_page(request: Request):
 
 
 @router.post("/login")
-def login(
+async def login(
     request: Request,
     email: str = Form(...),
     password: str = Form(...),
     origin: str | None = Form(None),
-    session: Session = Depends(get_session),
+    session=Depends(get_async_session),
 ):
     locale = _determine_locale(request)
     strings = translator.load_locale(locale)
 
     # 데이터베이스 연결 확인
     try:
-        user = session.exec(select(User).where(User.email == email)).first()
+        user = (await session.exec(select(User).where(User.email == email))).first()
     except Exception as e:
         # 데이터베이스 연결 실패
         import logging
@@ -426,7 +445,8 @@ def login(
             ),
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         )
-    if not user or not auth_manager.verify_password(password, user.hashed_password):
+    # bcrypt 검증은 전용 실행기에서 - 로그인 폭주에도 이벤트 루프를 막지 않음
+    if not user or not await auth_manager.verify_password_async(password, user.hashed_password):
         if origin == "landing":
             redirect_url = f"/?lang={locale}&login_error=invalid_credentials"
             return RedirectResponse(url=redirect_url, status_code=status.HTTP_303_SEE_OTHER)
@@ -491,7 +511,7 @@ def login(
 
     token = auth_manager.create_access_token(user.email)
     session.add(ActivityLog(user_id=user.id, action="login"))
-    session.commit()
+    await session.commit()
 
     # 역할별 리다이렉트
     # SUPER_ADMIN은 /dashboard로 이동 (모든 페이지 접근 가능)
@@ -597,7 +617,7 @@ def request_signup_code(
 
 
 @router.post("/signup")
-def signup(
+async def signup(
     request: Request,
     email: EmailStr = Form(...),
     password: str = Form(...),
@@ -608,7 +628,7 @@ def signup(
     privacy_agreement: str | None = Form(None),
     guidance_agreement: str | None = Form(None),
     origin: str | None = Form(None),
-    session: Session = Depends(get_session),
+    session=Depends(get_async_session),
 ):
     strings = translator.load_locale(locale)
     if privacy_agreement != "on" or guidance_agreement != "on":
@@ -642,7 +662,7 @@ def signup(
             status_code=status.HTTP_400_BAD_REQUEST,
         )
 
-    existing = session.exec(select(User).where(User.email == email)).first()
+    existing = (await session.exec(select(User).where(User.email == email))).first()
     if existing:
         if origin == "landing":
             redirect_url = f"/?lang={locale}&signup_error=email_exists&role={role.value}"
@@ -661,7 +681,8 @@ def signup(
             status_code=status.HTTP_400_BAD_REQUEST,
         )
 
-    hashed_password = auth_manager.hash_password(password)
+    # bcrypt 해싱은 전용 실행기에서 - 가입 폭주에도 이벤트 루프를 막지 않음
+    hashed_password = await auth_manager.hash_password_async(password)
     user = User(
         email=email,
         hashed_password=hashed_password,
@@ -676,13 +697,13 @@ def signup(
         password_set_at=datetime.utcnow(),
     )
     session.add(user)
-    session.commit()
-    session.refresh(user)
+    await session.commit()
+    await session.refresh(user)
     subscription = Subscription(user_id=user.id, tier=SubscriptionTier.FREE, max_accounts=1)
     session.add(subscription)
     session.add(ActivityLog(user_id=user.id, action="signup"))
-    session.commit()
-    email_verification_service.clear_code(email)
+    await session.commit()
+    await asyncio.to_thread(email_verification_service.clear_code, email)
     success_key = "signup_success"
     if origin == "landing":
         redirect_url = f"/?lang={locale}&signup_success={success_key}"
@@ -692,7 +713,7 @@ def signup(
 
 
 @router.post("/signup/social")
-def social_signup(
+async def social_signup(
     request: Request,
     provider: str = Form(...),
     provider_user_id: str | None = Form(None),
@@ -706,7 +727,7 @@ def social_signup(
     privacy_agreement: str | None = Form(None),
     guidance_agreement: str | None = Form(None),
     origin: str | None = Form(None),
-    session: Session = Depends(get_session),
+    session=Depends(get_async_session),
 ):
     strings = translator.load_locale(locale)
     try:
@@ -748,7 +769,7 @@ def social_signup(
             status_code=status.HTTP_400_BAD_REQUEST,
         )
 
-    if not email_verification_service.verify_code(email, verification_code):
+    if not await asyncio.to_thread(email_verification_service.verify_code, email, verification_code):
         return request.app.state.templates.TemplateResponse(
             "signup.html",
             _template_context(
@@ -769,15 +790,10 @@ def social_signup(
         else f"{provider_enum.value}:{email.strip().lower()}"
     )
 
-    existing_user = session.exec(select(User).where(User.email == email)).first()
+    existing_user = (await session.exec(select(User).where(User.email == email))).first()
     if existing_user:
         try:
-            social_auth_service.link_account(
-                session=session,
-                user=existing_user,
-                provider=provider_enum,
-                provider_user_id=derived_provider_user_id,
-            )
+            await _link_social_account(session, existing_user, provider_enum, derived_provider_user_id)
         except ValueError:
             return request.app.state.templates.TemplateResponse(
                 "signup.html",
@@ -797,17 +813,17 @@ def social_signup(
         existing_user.privacy_consent = True
         existing_user.guidance_consent = True
         if password:
-            existing_user.hashed_password = auth_manager.hash_password(password)
+            existing_user.hashed_password = await auth_manager.hash_password_async(password)
             existing_user.password_login_enabled = True
             existing_user.password_set_at = datetime.utcnow()
         session.add(ActivityLog(user_id=existing_user.id, action="social_link_signup"))
-        session.commit()
-        email_verification_service.clear_code(email)
+        await session.commit()
+        await asyncio.to_thread(email_verification_service.clear_code, email)
         redirect_url = f"/login?lang={locale}&social_success=social_signup_linked"
         return RedirectResponse(url=redirect_url, status_code=status.HTTP_303_SEE_OTHER)
 
     generated_password = password or secrets.token_urlsafe(12)
-    hashed_password = auth_manager.hash_password(generated_password)
+    hashed_password = await auth_manager.hash_password_async(generated_password)
     password_enabled = bool(password)
     user = User(
         email=email,
@@ -823,19 +839,14 @@ def social_signup(
         password_set_at=datetime.utcnow() if password_enabled else None,
     )
     session.add(user)
-    session.commit()
-    session.refresh(user)
-    social_auth_service.link_account(
-        session=session,
-        user=user,
-        provider=provider_enum,
-        provider_user_id=derived_provider_user_id,
-    )
+    await session.commit()
+    await session.refresh(user)
+    await _link_social_account(session, user, provider_enum, derived_provider_user_id)
     subscription = Subscription(user_id=user.id, tier=SubscriptionTier.FREE, max_accounts=1)
     session.add(subscription)
     session.add(ActivityLog(user_id=user.id, action="social_signup"))
-    session.commit()
-    email_verification_service.clear_code(email)
+    await session.commit()
+    await asyncio.to_thread(email_verification_service.clear_code, email)
 
     if origin == "landing":
         redirect_url = f"/?lang={locale}&signup_success=social_signup"
@@ -909,30 +920,28 @@ def confirm_password_reset(
 
 
 @router.post("/credentials/set-password")
-def set_password(
-    user: User = Depends(get_current_user),
+async def set_password(
+    user: User = Depends(get_current_user_async),
     new_password: str = Form(...),
     verification_code: str = Form(...),
-    session: Session = Depends(get_session),
+    session=Depends(get_async_session),
 ):
     locale = user.locale
-    if not email_verification_service.verify_code(user.email, verification_code):
+    if not await asyncio.to_thread(email_verification_service.verify_code, user.email, verification_code):
         redirect = RedirectResponse(
             url="/profile?credentials_error=invalid_verification_code", status_code=status.HTTP_303_SEE_OTHER
         )
         return redirect
 
-    db_user = session.exec(select(User).where(User.id == user.id)).first()
-    if not db_user:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="user_not_found")
+    db_user = user
 
-    db_user.hashed_password = auth_manager.hash_password(new_password)
+    db_user.hashed_password = await auth_manager.hash_password_async(new_password)
     db_user.password_login_enabled = True
     db_user.password_set_at = datetime.utcnow()
     session.add(ActivityLog(user_id=db_user.id, action="password_set"))
     session.add(db_user)
-    session.commit()
-    email_verification_service.clear_code(user.email)
+    await session.commit()
+    await asyncio.to_thread(email_verification_service.clear_code, user.email)
     redirect = RedirectResponse(url="/profile?credentials=updated", status_code=status.HTTP_303_SEE_OTHER)
     return redirect
 
@@ -952,9 +961,7 @@ def link_social(
     if provider_enum not in social_auth_service.get_supported_providers():
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="unsupported_provider")
 
-    db_user = session.exec(select(User).where(User.id == user.id)).first()
-    if not db_user:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="user_not_found")
+    db_user = user
 
     try:
         social_auth_service.link_account(
@@ -1,20 +1,23 @@
 """채널 관리 및 OAuth 인증 라우터"""
+import asyncio
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
 from urllib.parse import urlencode, quote
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.responses import HTMLResponse, RedirectResponse
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
 
 from ..auth import create_access_token
-from ..database import get_session
-from ..dependencies import get_current_user, require_roles
+from ..database import get_async_session, get_session
+from ..dependencies import get_current_user, get_current_user_async, require_roles
 from ..models import (
     AuthType,
     ChannelAccount,
     ChannelCredential,
     Subscription,
+    SubscriptionTier,
     User,
     UserRole,
 )
@@ -83,35 +86,41 @@ def get_oauth_configs():
 @router.get("/manage", response_class=HTMLResponse)
 async def manage_channels(
     request: Request,
-    user: User = Depends(get_current_user),
-    session: Session = Depends(get_session),
+    user: User = Depends(get_current_user_async),
+    session=Depends(get_async_session),
 ):
     """채널 관리 페이지"""
-    # 사용자의 현재 채널들 가져오기
-    channels = session.exec(
-        select(ChannelAccount).where(ChannelAccount.owner_id == user.id)
+    # 사용자의 현재 채널들 가져오기 (자격 증명은 미리 로드 - async 세션은 지연 로딩 불가)
+    channels = (
+        await session.exec(
+            select(ChannelAccount)
+            .where(ChannelAccount.owner_id == user.id)
+            .options(selectinload(ChannelAccount.credential))
+        )
     ).all()
 
     # 구독 정보 가져오기
-    subscription = session.exec(
-        select(Subscription).where(
-            Subscription.user_id == user.id,
-            Subscription.active == True
+    subscription = (
+        await session.exec(
+            select(Subscription).where(
+                Subscription.user_id == user.id,
+                Subscription.active == True
+            )
         )
     ).first()
 
     if not subscription:
         subscription = Subscription(
             user_id=user.id,
-            tier="free",
+            tier=SubscriptionTier.FREE,
             max_accounts=1
         )
         session.add(subscription)
-        session.commit()
+        await session.commit()
 
-    # 번역 로드 및 실시간 스냅샷 준비
+    # 번역 로드 및 실시간 스냅샷 준비 (커넥터 호출은 이벤트 루프 밖에서)
     strings = load_translations(user.locale)
-    channel_snapshots = fetch_channel_snapshots(channels)
+    channel_snapshots = await asyncio.to_thread(fetch_channel_snapshots, channels)
 
     platform_section = strings.get("channels_manage", {}).get("platforms", {})
     platform_items = platform_section.get("items", {})
@@ -1,16 +1,15 @@
-import csv
-import io
+import asyncio
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from fastapi import APIRouter, Depends, Form, HTTPException, Request, status
-from fastapi.responses import RedirectResponse, Response, StreamingResponse
+from fastapi.responses import RedirectResponse, Response
 from pydantic import EmailStr
 from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
-from ..database import get_session
-from ..dependencies import get_active_subscription, get_current_user, require_roles
+from ..database import get_async_session, get_session
+from ..dependencies import get_active_subscription, get_current_user, get_current_user_async, require_roles
 from ..models import (
     AuthType,
     ChannelAccount,
@@ -22,23 +21,33 @@ from ..models import (
     UserRole,
 )
 from ..services.ai_recommendations import generate_ad_recommendations
+from ..services.csv_export import HISTORY_HEADER, csv_response, iter_channel_snapshots, iter_history_rows
 from ..services.localization import translator
+from ..services.report_jobs import dashboard_payload, report_queue
 from ..services.social_fetcher import fetch_channel_snapshots
+from .reports import job_summary
 
 router = APIRouter()
 
 
 @router.get("/dashboard")
-def dashboard(request: Request, user: User = Depends(get_current_user), session=Depends(get_session)):
+async def dashboard(
+    request: Request,
+    user: User = Depends(get_current_user_async),
+    session=Depends(get_async_session),
+):
     locale = user.locale
     strings = translator.load_locale(locale)
 
-    accounts = session.exec(
-        select(ChannelAccount)
-        .where(ChannelAccount.owner_id == user.id)
-        .options(selectinload(ChannelAccount.credential))
+    accounts = (
+        await session.exec(
+            select(ChannelAccount)
+            .where(ChannelAccount.owner_id == user.id)
+            .options(selectinload(ChannelAccount.credential))
+        )
     ).all()
-    snapshots = fetch_channel_snapshots(accounts)
+    # 커넥터 호출은 블로킹 I/O 이므로 이벤트 루프 밖에서 실행
+    snapshots = await asyncio.to_thread(fetch_channel_snapshots, accounts)
 
     # AI 추천 생성
     ai_recommendations = {}
@@ -47,25 +56,29 @@ def dashboard(request: Request, user: User = Depends(get_current_user), session=
         if recommendations:
             ai_recommendations[platform] = recommendations
 
-    subscription = session.exec(select(Subscription).where(Subscription.user_id == user.id)).first()
+    subscription = (await session.exec(select(Subscription).where(Subscription.user_id == user.id))).first()
     if not subscription:
         subscription = Subscription(user_id=user.id, tier=SubscriptionTier.FREE, max_accounts=1)
         session.add(subscription)
-        session.commit()
-        session.refresh(subscription)
+        await session.commit()
+        await session.refresh(subscription)
 
     manager_links = []
     if user.role == UserRole.CREATOR:
-        manager_links = session.exec(
-            select(ManagerCreatorLink)
-            .where(ManagerCreatorLink.creator_id == user.id)
-            .options(selectinload(ManagerCreatorLink.manager))
+        manager_links = (
+            await session.exec(
+                select(ManagerCreatorLink)
+                .where(ManagerCreatorLink.creator_id == user.id)
+                .options(selectinload(ManagerCreatorLink.manager))
+            )
         ).all()
     elif user.role == UserRole.MANAGER:
-        manager_links = session.exec(
-            select(ManagerCreatorLink)
-            .where(ManagerCreatorLink.manager_id == user.id)
-            .options(selectinload(ManagerCreatorLink.creator))
+        manager_links = (
+            await session.exec(
+                select(ManagerCreatorLink)
+                .where(ManagerCreatorLink.manager_id == user.id)
+                .options(selectinload(ManagerCreatorLink.creator))
+            )
         ).all()
 
     manager_request_status = request.query_params.get("manager_request")
@@ -242,14 +255,24 @@ def export_dashboard_csv(
         .where(ChannelAccount.owner_id == user.id)
         .options(selectinload(ChannelAccount.credential))
     ).all()
-    snapshots = fetch_channel_snapshots(accounts)
 
-    # CSV 생성
-    output = io.StringIO()
-    writer = csv.writer(output)
+    def rows():
+        # 채널 묶음별로 스냅샷을 조회하며 바로 행을 내보냄
+        for account, snapshot in iter_channel_snapshots(accounts):
+            yield [
+                account.platform,
+                account.account_name,
+                snapshot.get("followers", 0),
+                snapshot.get("growth_rate", 0),
+                snapshot.get("engagement_rate", 0),
+                snapshot.get("last_post_date", "")[:10] if snapshot.get("last_post_date") else "-",
+                snapshot.get("last_post_title", "-"),
+                snapshot.get("source", "mock"),
+            ]
 
-    # 헤더
-    writer.writerow([
+    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    filename = f"dashboard_report_{timestamp}.csv"
+    header = [
         "플랫폼",
         "계정명",
         "구독자/팔로워",
@@ -257,33 +280,24 @@ def export_dashboard_csv(
         "참여율(%)",
         "최근 게시일",
         "최근 게시물 제목",
-        "데이터 출처"
-    ])
+        "데이터 출처",
+    ]
+    return csv_response(filename, header, rows())
 
-    # 데이터 행
-    for account in accounts:
-        snapshot = snapshots.get(account.platform, {})
-        writer.writerow([
-            account.platform,
-            account.account_name,
-            snapshot.get("followers", 0),
-            snapshot.get("growth_rate", 0),
-            snapshot.get("engagement_rate", 0),
-            snapshot.get("last_post_date", "")[:10] if snapshot.get("last_post_date") else "-",
-            snapshot.get("last_post_title", "-"),
-            snapshot.get("source", "mock")
-        ])
-
-    # CSV 파일 반환
-    output.seek(0)
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    filename = f"dashboard_report_{timestamp}.csv"
 
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
-    )
+@router.get("/dashboard/export/history/csv")
+def export_dashboard_history_csv(
+    days: int = 30,
+    user: User = Depends(get_current_user),
+    session=Depends(get_session),
+):
+    """채널 지표 이력을 CSV 로 내보내기 (이력 테이블에서 묶음 단위로 스트리밍)"""
+    accounts = session.exec(select(ChannelAccount).where(ChannelAccount.owner_id == user.id)).all()
+    since = datetime.utcnow() - timedelta(days=max(days, 1))
+
+    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    filename = f"dashboard_history_{timestamp}.csv"
+    return csv_response(filename, HISTORY_HEADER, iter_history_rows(accounts, since=since))
 
 
 @router.get("/dashboard/export/json")
@@ -340,29 +354,44 @@ def export_dashboard_json(
     )
 
 
-@router.get("/dashboard/export/pdf")
-def export_dashboard_pdf(
-    user: User = Depends(get_current_user),
-    session=Depends(get_session),
-):
-    """대시보드 데이터를 PDF 형식으로 내보내기"""
-    from ..services.pdf_generator import generate_dashboard_pdf
-
+def _dashboard_report(session, user: User) -> dict:
     accounts = session.exec(
         select(ChannelAccount)
         .where(ChannelAccount.owner_id == user.id)
         .options(selectinload(ChannelAccount.credential))
     ).all()
     snapshots = fetch_channel_snapshots(accounts)
+    return dashboard_payload(user, accounts, snapshots)
 
-    # PDF 생성
-    pdf_buffer = generate_dashboard_pdf(user, accounts, snapshots)
 
+@router.get("/dashboard/export/pdf")
+def export_dashboard_pdf(
+    user: User = Depends(get_current_user),
+    session=Depends(get_session),
+):
+    """대시보드 데이터를 PDF 형식으로 내보내기 (같은 데이터면 캐시된 PDF 재사용)"""
     timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
     filename = f"dashboard_report_{timestamp}.pdf"
+    pdf = report_queue.render("dashboard", _dashboard_report(session, user), owner_id=user.id, filename=filename)
 
-    return StreamingResponse(
-        pdf_buffer,
+    return Response(
+        content=pdf,
         media_type="application/pdf",
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
+
+
+@router.post("/dashboard/export/pdf/jobs", status_code=status.HTTP_202_ACCEPTED)
+def submit_dashboard_pdf_job(
+    user: User = Depends(get_current_user),
+    session=Depends(get_session),
+):
+    """대시보드 PDF 렌더링 작업 제출 - /reports/{job_id} 로 상태 확인 후 다운로드"""
+    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    job = report_queue.submit(
+        "dashboard",
+        _dashboard_report(session, user),
+        owner_id=user.id,
+        filename=f"dashboard_report_{timestamp}.pdf",
+    )
+    return job_summary(job)
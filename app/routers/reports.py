@@ -0,0 +1,50 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import Response
+
+from ..dependencies import get_current_user
+from ..models import User
+from ..services.report_jobs import ReportJob, report_queue
+
+router = APIRouter()
+
+
+def job_summary(job: ReportJob) -> dict:
+    return {
+        "job_id": job.id,
+        "status": report_queue.status(job),
+        "status_url": f"/reports/{job.id}",
+        "download_url": f"/reports/{job.id}/download",
+    }
+
+
+def _owned_job(job_id: str, user: User) -> ReportJob:
+    job = report_queue.get(job_id, user.id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="리포트 작업을 찾을 수 없습니다.")
+    return job
+
+
+@router.get("/reports/{job_id}")
+def report_job_status(job_id: str, user: User = Depends(get_current_user)):
+    """리포트 작업 상태 (pending / done / failed / expired)"""
+    return job_summary(_owned_job(job_id, user))
+
+
+@router.get("/reports/{job_id}/download")
+def download_report(job_id: str, user: User = Depends(get_current_user)):
+    """완료된 리포트 PDF 다운로드 (렌더링 중이면 202)"""
+    job = _owned_job(job_id, user)
+    job_status = report_queue.status(job)
+    if job_status == "failed":
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="리포트 생성에 실패했습니다.")
+    pdf = report_queue.result(job) if job_status == "done" else None
+    if pdf is None:
+        if job_status in ("done", "expired"):
+            # 캐시에서 밀려난 결과는 보관하지 않으므로 다시 제출해야 함
+            raise HTTPException(status_code=status.HTTP_410_GONE, detail="리포트가 만료되었습니다. 다시 요청해 주세요.")
+        return Response(status_code=status.HTTP_202_ACCEPTED, headers={"Retry-After": "2"})
+    return Response(
+        content=pdf,
+        media_type="application/pdf",
+        headers={"Content-Disposition": f"attachment; filename={job.filename}"},
+    )
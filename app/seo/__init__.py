@@ -9,12 +9,13 @@ SEO & AEO Optimization Package
 - Sitemap.xml & robots.txt
 """
 
-from .seo_service import SEOService, get_seo_service
+from .seo_service import SEOService, get_seo_service, preload_seo_services
 from .sitemap_generator import SitemapGenerator, get_sitemap_generator, generate_robots_txt
 
 __all__ = [
     "SEOService",
     "get_seo_service",
+    "preload_seo_services",
     "SitemapGenerator",
     "get_sitemap_generator",
     "generate_robots_txt",
@@ -9,14 +9,43 @@ SEO 및 AEO 최적화 서비스
 - Multilingual Support (ko, en, ja)
 """
 
+import functools
 import json
 import logging
+import threading
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, FrozenSet, Optional, List, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+SEO_LOCALE_DIR = Path(__file__).parent / "locales"
+DEFAULT_SEO_LOCALE = "ko"
+RELOAD_CHECK_SECONDS = 5  # 로케일 JSON 수정 여부(mtime) 확인 간격
+MEMO_MAX_ENTRIES = 256  # 인스턴스별 생성 결과 캐시 상한 (임의 경로로 늘어나지 않도록)
+
+
+def _memoized(method):
+    """같은 인자의 생성 결과 재사용 (SEO 데이터는 인스턴스 생성 후 바뀌지 않음)"""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            return self._memo[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # 리스트 등 해시할 수 없는 인자는 캐시하지 않음
+            return method(self, *args, **kwargs)
+        value = method(self, *args, **kwargs)
+        if len(self._memo) < MEMO_MAX_ENTRIES:
+            self._memo[key] = value
+        return value
+
+    return wrapper
+
 
 class SEOService:
     """SEO 및 AEO 최적화를 위한 서비스"""
@@ -28,19 +57,14 @@ class SEOService:
         """
         self.locale = locale
         self.seo_data = self._load_seo_data(locale)
+        self._memo: Dict[Tuple, Any] = {}
 
     def _load_seo_data(self, locale: str) -> Dict[str, Any]:
         """언어별 SEO 메타데이터 로드"""
-        seo_dir = Path(__file__).parent / "locales"
-        file_path = seo_dir / f"{locale}.json"
-
-        if not file_path.exists():
-            # Fallback to Korean
-            file_path = seo_dir / "ko.json"
-
-        with open(file_path, "r", encoding="utf-8") as f:
+        with open(_locale_file(locale), "r", encoding="utf-8") as f:
             return json.load(f)
 
+    @_memoized
     def get_page_metadata(self, page: str = "home") -> Dict[str, str]:
         """페이지별 메타데이터 반환"""
         page_data = self.seo_data.get("pages", {}).get(page, self.seo_data["pages"]["home"])
@@ -57,6 +81,7 @@ class SEOService:
             "image": site_data.get("image", ""),
         }
 
+    @_memoized
     def generate_meta_tags(self, page: str = "home") -> str:
         """HTML meta tags 생성"""
         meta = self.get_page_metadata(page)
@@ -73,6 +98,7 @@ class SEOService:
 
         return "\n    ".join(tags)
 
+    @_memoized
     def generate_hreflang_tags(self, page_path: str = "/") -> str:
         """hreflang 태그 생성 (다국어 SEO 최적화)"""
         base_url = self.seo_data["site"]["url"]
@@ -98,6 +124,7 @@ class SEOService:
 
         return "\n    ".join(tags)
 
+    @_memoized
     def generate_opengraph_tags(self, page: str = "home", image_url: Optional[str] = None) -> str:
         """OpenGraph meta tags 생성 (소셜 미디어 공유 최적화)"""
         meta = self.get_page_metadata(page)
@@ -135,6 +162,7 @@ class SEOService:
 
         return "\n    ".join(tags)
 
+    @_memoized
     def generate_twitter_cards(self, page: str = "home", image_url: Optional[str] = None) -> str:
         """Twitter Card meta tags 생성"""
         meta = self.get_page_metadata(page)
@@ -150,6 +178,7 @@ class SEOService:
 
         return "\n    ".join(tags)
 
+    @_memoized
     def generate_organization_schema(self) -> str:
         """Organization structured data (JSON-LD) 생성"""
         org = self.seo_data.get("organization", {})
@@ -175,6 +204,7 @@ class SEOService:
 
         return self._json_ld_script(schema)
 
+    @_memoized
     def generate_website_schema(self) -> str:
         """WebSite structured data (JSON-LD) 생성"""
         site = self.seo_data.get("site", {})
@@ -198,6 +228,7 @@ class SEOService:
 
         return self._json_ld_script(schema)
 
+    @_memoized
     def generate_webpage_schema(self, page: str = "home") -> str:
         """WebPage structured data (JSON-LD) 생성"""
         meta = self.get_page_metadata(page)
@@ -218,6 +249,7 @@ class SEOService:
 
         return self._json_ld_script(schema)
 
+    @_memoized
     def generate_faq_schema(self) -> str:
         """FAQPage structured data (JSON-LD) 생성 - AEO 최적화"""
         faq_items = self.seo_data.get("faq", [])
@@ -244,6 +276,7 @@ class SEOService:
 
         return self._json_ld_script(schema)
 
+    @_memoized
     def generate_software_application_schema(self) -> str:
         """SoftwareApplication structured data (JSON-LD) 생성"""
         site = self.seo_data.get("site", {})
@@ -298,6 +331,7 @@ class SEOService:
         json_str = json.dumps(schema, ensure_ascii=False, indent=2)
         return f'<script type="application/ld+json">\n{json_str}\n</script>'
 
+    @_memoized
     def generate_all_schemas(self, page: str = "home", include_faq: bool = False) -> str:
         """모든 structured data 생성"""
         schemas = [
@@ -316,6 +350,7 @@ class SEOService:
 
         return "\n    ".join(schemas)
 
+    @_memoized
     def generate_video_object_schema(self) -> str:
         """VideoObject structured data (JSON-LD) 생성 - 크리에이터 플랫폼용"""
         site = self.seo_data.get("site", {})
@@ -382,6 +417,7 @@ class SEOService:
 
         return self._json_ld_script(schema)
 
+    @_memoized
     def generate_howto_schema(self) -> str:
         """HowTo structured data (JSON-LD) 생성 - AEO 최적화"""
         howto_data = self.seo_data.get("howto", {})
@@ -425,6 +461,7 @@ class SEOService:
 
         return self._json_ld_script(schema)
 
+    @_memoized
     def generate_complete_seo_head(
         self,
         page: str = "home",
@@ -444,6 +481,58 @@ class SEOService:
         return "\n    ".join(components)
 
 
+def _locale_file(locale: str) -> Path:
+    file_path = SEO_LOCALE_DIR / f"{locale}.json"
+    if not file_path.exists():
+        # Fallback to Korean
+        file_path = SEO_LOCALE_DIR / f"{DEFAULT_SEO_LOCALE}.json"
+    return file_path
+
+
+# 로케일별 (서비스, 로드한 파일 mtime, 마지막 확인 시각)
+_seo_services: Dict[str, Tuple[SEOService, float, float]] = {}
+_seo_services_lock = threading.Lock()
+_supported_locales: Optional[FrozenSet[str]] = None  # 로케일 JSON 목록 (처음 한 번 또는 preload 시 계산)
+
+
+def supported_seo_locales(*, reload: bool = False) -> FrozenSet[str]:
+    """로케일 JSON 이 있는 로케일 집합 (요청마다 파일 시스템을 확인하지 않도록 한 번만 계산)"""
+    global _supported_locales
+    if _supported_locales is None or reload:
+        _supported_locales = frozenset(file_path.stem for file_path in SEO_LOCALE_DIR.glob("*.json"))
+    return _supported_locales
+
+
 def get_seo_service(locale: str = "ko") -> SEOService:
-    """SEO 서비스 인스턴스 반환"""
-    return SEOService(locale=locale)
+    """로케일별 SEO 서비스 (한 번 만들어 재사용, 로케일 JSON 이 수정되면 다시 로드)"""
+    if locale not in supported_seo_locales():
+        # 지원하지 않는 로케일은 기본 로케일 인스턴스를 공유
+        locale = DEFAULT_SEO_LOCALE
+
+    now = time.monotonic()
+    entry = _seo_services.get(locale)
+    if entry is not None and now - entry[2] < RELOAD_CHECK_SECONDS:
+        return entry[0]
+
+    with _seo_services_lock:
+        entry = _seo_services.get(locale)
+        mtime = _locale_file(locale).stat().st_mtime
+        if entry is not None and entry[1] == mtime:
+            service = entry[0]
+        else:
+            service = SEOService(locale=locale)
+        _seo_services[locale] = (service, mtime, now)
+        return service
+
+
+def preload_seo_services(pages: Dict[str, str]) -> None:
+    """시작 시 지원 로케일 × 페이지의 head 조각을 미리 생성 (pages: {페이지: 경로})"""
+    for locale in sorted(supported_seo_locales(reload=True)):
+        service = get_seo_service(locale)
+        for page, page_path in pages.items():
+            service.get_page_metadata(page)
+            service.generate_hreflang_tags(page_path)
+            service.generate_meta_tags(page)
+            service.generate_opengraph_tags(page)
+            service.generate_twitter_cards(page)
+            service.generate_all_schemas(page, include_faq=(page == "support"))
@@ -2,15 +2,27 @@
 from __future__ import annotations
 
 import json
+import logging
 import re
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Any, Dict, List, Optional
-
-import requests
-from requests import Response
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlencode
 
+from ..config import get_settings
 from ..models import ChannelAccount, ChannelCredential
+from .connector_transport import (
+    ConnectorTransport,
+    ConnectorTransportError,
+    TransportResponse,
+    get_transport,
+)
+from .metrics import connector_request_duration, connector_requests, status_outcome
+from .rate_limiter import RateLimitExceeded, backoff_delay, credential_key, rate_limiter
+
+logger = logging.getLogger(__name__)
 
 USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -26,9 +38,59 @@ class ChannelConnectorConfigError(ChannelConnectorError):
     """Raised when a connector is missing mandatory configuration."""
 
 
+class ChannelConnectorRateLimitError(ChannelConnectorError):
+    """Raised when the platform (or the local limiter) throttles the call."""
+
+    def __init__(self, message: str, *, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+RETRYABLE_STATUS_CODES = {500, 502, 503, 504}
+
+
+def _retry_after_seconds(response: TransportResponse) -> Optional[float]:
+    """Retry-After(초 또는 HTTP 날짜) / x-rate-limit-reset(epoch) 헤더를 대기 초로 변환"""
+    headers = response.headers
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+            except (TypeError, ValueError):
+                pass
+    reset_at = headers.get("x-rate-limit-reset")
+    if reset_at and headers.get("x-rate-limit-remaining") == "0":
+        try:
+            return max(float(reset_at) - time.time(), 0.0)
+        except ValueError:
+            pass
+    return None
+
+
+def _request_credential_key(
+    params: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]]
+) -> Optional[str]:
+    # 요청에 실린 토큰(access_token / API key / Authorization)으로 자격 증명 버킷을 구분
+    token = None
+    if params:
+        token = params.get("access_token") or params.get("key")
+    if not token and headers:
+        token = headers.get("Authorization")
+    return credential_key(token)
+
+
 class BaseConnector(ABC):
     platform: str
 
+    @property
+    def transport(self) -> ConnectorTransport:
+        """모든 커넥터 인스턴스가 공유하는 풀링된 HTTP transport"""
+        return get_transport()
+
     @abstractmethod
     def fetch(self, account: ChannelAccount) -> Dict[str, Any]:
         """Fetch live metrics from the platform."""
@@ -55,16 +117,88 @@ class BaseConnector(ABC):
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
         timeout: int = 10,
-    ) -> Response:
-        try:
-            response = requests.get(url, params=params, headers=headers, timeout=timeout)
-        except requests.RequestException as exc:  # pragma: no cover - network failure
-            raise ChannelConnectorError(str(exc)) from exc
-        if response.status_code >= 400:
-            raise ChannelConnectorError(
-                f"HTTP {response.status_code} 오류 - {response.text[:200]}"
-            )
-        return response
+    ) -> TransportResponse:
+        return self._http_request("GET", url, params=params, headers=headers, timeout=timeout)
+
+    def _http_request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: int = 10,
+        acquire_token: bool = True,
+    ) -> TransportResponse:
+        """호출 제한(토큰 버킷)을 지켜 HTTP 요청
+
+        429(또는 플랫폼별 제한 응답)는 Retry-After 만큼 해당 토큰 버킷을 막고,
+        5xx 는 지수 백오프 + jitter 로 재시도합니다. 기다려야 할 시간이
+        ``connector_max_wait_seconds`` 를 넘으면 바로 ``ChannelConnectorRateLimitError`` 를 올립니다.
+        ``acquire_token=False`` 는 호출 한도를 이미 차지한 요청(Graph batch 봉투)용입니다.
+        """
+        settings = get_settings()
+        max_wait = settings.connector_max_wait_seconds
+        bucket_key = _request_credential_key(params or data, headers)
+        attempt = 0
+        while True:
+            try:
+                if acquire_token:
+                    rate_limiter.acquire(self.platform, bucket_key, max_wait=max_wait)
+            except RateLimitExceeded as exc:
+                connector_requests.inc(platform=self.platform, outcome="rate_limited")
+                raise ChannelConnectorRateLimitError(
+                    f"{self.platform} 호출 한도 초과 - {exc.retry_after:.0f}초 후 다시 시도합니다.",
+                    retry_after=exc.retry_after,
+                ) from exc
+            started = time.perf_counter()
+            try:
+                response = self.transport.request(
+                    method, url, params=params, data=data, headers=headers, timeout=timeout
+                )
+            except ConnectorTransportError as exc:  # pragma: no cover - network failure
+                connector_requests.inc(platform=self.platform, outcome="error")
+                raise ChannelConnectorError(str(exc)) from exc
+            finally:
+                connector_request_duration.observe(time.perf_counter() - started, platform=self.platform)
+            connector_requests.inc(platform=self.platform, outcome=status_outcome(response.status_code))
+
+            throttled = self._is_throttled(response)
+            if not throttled and response.status_code < 400:
+                return response
+            if not throttled and response.status_code not in RETRYABLE_STATUS_CODES:
+                raise ChannelConnectorError(
+                    f"HTTP {response.status_code} 오류 - {response.text[:200]}"
+                )
+
+            delay = _retry_after_seconds(response)
+            if delay is None:
+                delay = backoff_delay(
+                    attempt,
+                    settings.connector_backoff_base_seconds,
+                    settings.connector_backoff_max_seconds,
+                )
+            if throttled:
+                # 같은 토큰을 쓰는 다른 요청도 함께 기다리도록 버킷 차단
+                rate_limiter.penalize(self.platform, bucket_key, delay)
+                logger.warning(f"{self.platform} throttled (HTTP {response.status_code}), backing off {delay:.1f}s")
+            if attempt >= settings.connector_max_retries or delay > max_wait:
+                if throttled:
+                    raise ChannelConnectorRateLimitError(
+                        f"{self.platform} 호출 한도 초과 (HTTP {response.status_code})",
+                        retry_after=delay,
+                    )
+                raise ChannelConnectorError(
+                    f"HTTP {response.status_code} 오류 - {response.text[:200]}"
+                )
+            if not throttled or not acquire_token:
+                # 제한 응답은 다음 acquire 에서 차단 시간만큼 대기 (acquire 하지 않는 요청은 직접 대기)
+                time.sleep(delay)
+            attempt += 1
+
+    def _is_throttled(self, response: TransportResponse) -> bool:
+        return response.status_code == 429
 
     def _get_json(
         self,
@@ -81,12 +215,53 @@ class BaseConnector(ABC):
 
 
 class GraphConnector(BaseConnector):
+    """Meta Graph API 커넥터 공통 기반
+
+    하위 클래스는 ``build_request`` (경로/필드 확장 파라미터/토큰)와 ``parse_response`` 만 구현하며,
+    ``fetch`` 는 단건 GET, ``fetch_batch`` 는 여러 채널을 Graph batch 요청 한 번으로 조회합니다.
+    """
+
     api_version = "v20.0"
+    BATCH_LIMIT = 50  # Graph batch 요청 한 번에 담을 수 있는 최대 요청 수
+
+    # Graph API 는 호출 제한을 HTTP 400/403 + error.code 로 알려줌
+    THROTTLE_ERROR_CODES = {4, 17, 32, 613, 80001, 80002, 80004, 80005, 80006, 80008, 80014}
 
     @property
     def base_url(self) -> str:
         return f"https://graph.facebook.com/{self.api_version}"
 
+    @abstractmethod
+    def build_request(self, account: ChannelAccount) -> Tuple[str, Dict[str, Any], str]:
+        """채널 조회용 (경로, 쿼리 파라미터, access token) 반환"""
+        pass
+
+    @abstractmethod
+    def parse_response(self, account: ChannelAccount, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Graph 응답을 스냅샷 지표로 변환"""
+        pass
+
+    def fetch(self, account: ChannelAccount) -> Dict[str, Any]:
+        path, params, token = self.build_request(account)
+        return self.parse_response(account, self._graph_get(path, token, params=params))
+
+    @classmethod
+    def _is_throttle_error(cls, payload: Any) -> bool:
+        if not isinstance(payload, dict):
+            return False
+        error = payload.get("error") or {}
+        return isinstance(error, dict) and error.get("code") in cls.THROTTLE_ERROR_CODES
+
+    def _is_throttled(self, response: TransportResponse) -> bool:
+        if response.status_code == 429:
+            return True
+        if response.status_code not in (400, 403):
+            return False
+        try:
+            return self._is_throttle_error(response.json())
+        except ValueError:
+            return False
+
     def _graph_get(
         self,
         path: str,
@@ -99,28 +274,124 @@ class GraphConnector(BaseConnector):
         url = f"{self.base_url}/{path}"
         return self._get_json(url, params=params)
 
+    def fetch_batch(
+        self, accounts: List[ChannelAccount]
+    ) -> Dict[int, Union[Dict[str, Any], ChannelConnectorError]]:
+        """Graph 채널(Instagram/Facebook/Meta Ads 혼합 가능) 여러 개를 batch 요청으로 조회
+
+        요청마다 자기 access token 을 relative_url 에 실어 보내므로 서로 다른 토큰의 채널도
+        한 번에 묶을 수 있습니다. 채널별 결과는 지표 dict 또는 ``ChannelConnectorError`` 입니다.
+        """
+        settings = get_settings()
+        results: Dict[int, Union[Dict[str, Any], ChannelConnectorError]] = {}
+        entries: List[Tuple[ChannelAccount, "GraphConnector", Optional[str], Dict[str, str]]] = []
+        for account in accounts:
+            connector = CONNECTOR_REGISTRY.get(account.platform)
+            if not isinstance(connector, GraphConnector):
+                results[account.id] = ChannelConnectorError(f"{account.platform} 는 Graph 채널이 아닙니다.")
+                continue
+            try:
+                path, params, token = connector.build_request(account)
+            except ChannelConnectorError as exc:
+                results[account.id] = exc
+                continue
+            bucket_key = credential_key(token)
+            try:
+                # batch 안의 요청도 플랫폼 호출 한도를 하나씩 차지함
+                rate_limiter.acquire(account.platform, bucket_key, max_wait=settings.connector_max_wait_seconds)
+            except RateLimitExceeded as exc:
+                results[account.id] = ChannelConnectorRateLimitError(
+                    f"{account.platform} 호출 한도 초과 - {exc.retry_after:.0f}초 후 다시 시도합니다.",
+                    retry_after=exc.retry_after,
+                )
+                continue
+            query = urlencode({**params, "access_token": token})
+            entries.append((account, connector, bucket_key, {"method": "GET", "relative_url": f"{path}?{query}"}))
+
+        for start in range(0, len(entries), self.BATCH_LIMIT):
+            chunk = entries[start:start + self.BATCH_LIMIT]
+            try:
+                items = self._post_batch([request for _, _, _, request in chunk])
+            except ChannelConnectorError as exc:
+                for account, _, _, _ in chunk:
+                    results[account.id] = exc
+                continue
+            for (account, connector, bucket_key, _), item in zip(chunk, items):
+                results[account.id] = connector._parse_batch_item(account, bucket_key, item)
+        return results
+
+    def _post_batch(self, requests: List[Dict[str, str]]) -> List[Optional[Dict[str, Any]]]:
+        # 최상위 access_token 은 필수이므로 첫 요청의 토큰을 사용 (각 요청은 자기 토큰으로 실행됨)
+        first_query = parse_qs(requests[0]["relative_url"].split("?", 1)[1])
+        response = self._http_request(
+            "POST",
+            self.base_url,
+            data={
+                "access_token": first_query["access_token"][0],
+                "batch": json.dumps(requests),
+                "include_headers": "false",
+            },
+            # 호출 한도는 batch 안의 요청마다 이미 차지했으므로 봉투 요청은 따로 차지하지 않음
+            acquire_token=False,
+        )
+        try:
+            items = response.json()
+        except ValueError as exc:
+            raise ChannelConnectorError("Graph batch 응답을 파싱할 수 없습니다.") from exc
+        if not isinstance(items, list) or len(items) != len(requests):
+            raise ChannelConnectorError("Graph batch 응답 형식이 올바르지 않습니다.")
+        return items
+
+    def _parse_batch_item(
+        self,
+        account: ChannelAccount,
+        bucket_key: Optional[str],
+        item: Optional[Dict[str, Any]],
+    ) -> Union[Dict[str, Any], ChannelConnectorError]:
+        if item is None:
+            # Graph 가 시간 내에 처리하지 못한 요청은 null 로 돌아옴
+            return ChannelConnectorError("Graph batch 요청 시간이 초과되었습니다.")
+        code = int(item.get("code") or 0)
+        try:
+            body = json.loads(item.get("body") or "{}")
+        except (TypeError, ValueError):
+            return ChannelConnectorError("JSON 응답을 파싱할 수 없습니다.")
+        if code == 429 or self._is_throttle_error(body):
+            settings = get_settings()
+            delay = backoff_delay(0, settings.connector_backoff_base_seconds, settings.connector_backoff_max_seconds)
+            rate_limiter.penalize(self.platform, bucket_key, delay)
+            return ChannelConnectorRateLimitError(
+                f"{self.platform} 호출 한도 초과 (HTTP {code})", retry_after=delay
+            )
+        if code >= 400:
+            return ChannelConnectorError(f"HTTP {code} 오류 - {str(item.get('body'))[:200]}")
+        try:
+            return self.parse_response(account, body)
+        except ChannelConnectorError as exc:
+            return exc
+
 
 class InstagramConnector(GraphConnector):
     platform = "instagram"
 
-    def fetch(self, account: ChannelAccount) -> Dict[str, Any]:
+    def build_request(self, account: ChannelAccount) -> Tuple[str, Dict[str, Any], str]:
         credential = self._ensure_credential(account, require_token=True)
         ig_business_id = credential.metadata_json.get("business_id") or credential.identifier
         if not ig_business_id:
             raise ChannelConnectorConfigError("Instagram Business ID가 필요합니다.")
-        profile = self._graph_get(
+        # 필드 확장으로 프로필과 최근 미디어를 한 번에 조회
+        return (
             ig_business_id,
-            credential.access_token or "",
-            params={"fields": "username,followers_count"},
-        )
-        media = self._graph_get(
-            f"{ig_business_id}/media",
-            credential.access_token or "",
-            params={
-                "fields": "id,caption,like_count,comments_count,timestamp",
-                "limit": 3,
+            {
+                "fields": "username,followers_count,"
+                "media.limit(3){id,caption,like_count,comments_count,timestamp}",
             },
+            credential.access_token or "",
         )
+
+    def parse_response(self, account: ChannelAccount, profile: Dict[str, Any]) -> Dict[str, Any]:
+        credential = account.credential
+        media = profile.get("media") or {}
         followers = int(profile.get("followers_count", 0))
         posts = []
         for item in media.get("data", []):
@@ -391,21 +662,21 @@ class TikTokConnector(BaseConnector):
 class FacebookConnector(GraphConnector):
     platform = "facebook"
 
-    def fetch(self, account: ChannelAccount) -> Dict[str, Any]:
+    def build_request(self, account: ChannelAccount) -> Tuple[str, Dict[str, Any], str]:
         credential = self._ensure_credential(account, require_token=True)
         page_id = credential.metadata_json.get("page_id") or credential.identifier
         if not page_id:
             raise ChannelConnectorConfigError("Facebook 페이지 ID가 필요합니다.")
-        page = self._graph_get(
+        # 필드 확장으로 페이지 정보와 최근 게시물을 한 번에 조회
+        return (
             page_id,
+            {"fields": "name,followers_count,fan_count,posts.limit(3){message,created_time}"},
             credential.access_token or "",
-            params={"fields": "name,followers_count,fan_count"},
-        )
-        posts = self._graph_get(
-            f"{page_id}/posts",
-            credential.access_token or "",
-            params={"fields": "message,created_time", "limit": 3},
         )
+
+    def parse_response(self, account: ChannelAccount, page: Dict[str, Any]) -> Dict[str, Any]:
+        credential = account.credential
+        posts = page.get("posts") or {}
         followers = int(page.get("followers_count") or page.get("fan_count") or 0)
         recent_posts: List[Dict[str, Any]] = []
         for post in posts.get("data", []):
@@ -433,16 +704,20 @@ class FacebookConnector(GraphConnector):
 class MetaAdsConnector(GraphConnector):
     platform = "meta_ads"
 
-    def fetch(self, account: ChannelAccount) -> Dict[str, Any]:
+    def build_request(self, account: ChannelAccount) -> Tuple[str, Dict[str, Any], str]:
         credential = self._ensure_credential(account, require_token=True)
         ad_account_id = credential.metadata_json.get("ad_account_id") or credential.identifier
         if not ad_account_id:
             raise ChannelConnectorConfigError("Meta Ads 계정 ID가 필요합니다.")
-        insights = self._graph_get(
+        return (
             f"act_{ad_account_id}/insights",
+            {"fields": "spend,impressions,clicks", "date_preset": "last_7d"},
             credential.access_token or "",
-            params={"fields": "spend,impressions,clicks", "date_preset": "last_7d"},
         )
+
+    def parse_response(self, account: ChannelAccount, insights: Dict[str, Any]) -> Dict[str, Any]:
+        credential = account.credential
+        ad_account_id = credential.metadata_json.get("ad_account_id") or credential.identifier
         data = insights.get("data", [{}])
         summary = data[0] if data else {}
         spend = float(summary.get("spend", 0.0))
@@ -484,3 +759,19 @@ CONNECTOR_REGISTRY: Dict[str, BaseConnector] = {
 
 def get_connector(platform: str) -> Optional[BaseConnector]:
     return CONNECTOR_REGISTRY.get(platform)
+
+
+def is_graph_platform(platform: str) -> bool:
+    return isinstance(CONNECTOR_REGISTRY.get(platform), GraphConnector)
+
+
+def fetch_graph_batch(
+    accounts: List[ChannelAccount],
+) -> Dict[int, Union[Dict[str, Any], ChannelConnectorError]]:
+    """Instagram/Facebook/Meta Ads 채널을 Graph batch 요청으로 한 번에 조회"""
+    if not accounts:
+        return {}
+    connector = CONNECTOR_REGISTRY.get(accounts[0].platform)
+    if not isinstance(connector, GraphConnector):
+        connector = CONNECTOR_REGISTRY["instagram"]
+    return connector.fetch_batch(accounts)
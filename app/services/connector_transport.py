@@ -0,0 +1,139 @@
+"""Shared pooled HTTP transport used by every channel connector.
+
+커넥터마다 ``requests.get`` 을 새로 호출하면 매번 TCP+TLS 핸드셰이크가 발생합니다.
+이 모듈은 프로세스 전역에서 하나의 세션(호스트별 커넥션 풀 + keep-alive)을 공유하며,
+``h2`` 패키지가 설치되어 있고 설정이 켜져 있으면 httpx 기반 HTTP/2 클라이언트를 사용합니다.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Any, Dict, Optional, Union
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..config import get_settings
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+TransportResponse = Union[requests.Response, httpx.Response]
+
+
+class ConnectorTransportError(Exception):
+    """Raised when the underlying HTTP client fails (DNS, connect, timeout...)."""
+
+
+def _cookieless_jar() -> CookieJar:
+    # 여러 계정의 스크래핑 요청이 같은 세션을 공유하므로 쿠키는 저장하지 않음
+    return CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+
+
+class ConnectorTransport:
+    """호스트별 커넥션 풀을 공유하는 스레드 안전 HTTP 클라이언트"""
+
+    def __init__(
+        self,
+        *,
+        pool_connections: int = 20,
+        pool_maxsize: int = 20,
+        http2: bool = False,
+    ) -> None:
+        if http2 and not HTTP2_AVAILABLE:
+            logger.warning("HTTP/2 requested for connectors but 'h2' is not installed; using HTTP/1.1")
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+
+        self._client: Optional[httpx.Client] = None
+        self._session: Optional[requests.Session] = None
+        if self.http2:
+            self._client = httpx.Client(
+                http2=True,
+                follow_redirects=True,  # requests.Session 과 동일하게 리다이렉트 추적
+                cookies=_cookieless_jar(),
+                limits=httpx.Limits(
+                    max_connections=pool_connections * pool_maxsize,
+                    max_keepalive_connections=pool_maxsize,
+                ),
+            )
+        else:
+            session = requests.Session()
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10,
+    ) -> TransportResponse:
+        try:
+            if self._client is not None:
+                return self._client.request(
+                    method, url, params=params, data=data, headers=headers, timeout=timeout
+                )
+            return self._session.request(
+                method, url, params=params, data=data, headers=headers, timeout=timeout
+            )
+        except (requests.RequestException, httpx.HTTPError) as exc:
+            raise ConnectorTransportError(str(exc)) from exc
+
+    def get(
+        self,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10,
+    ) -> TransportResponse:
+        return self.request("GET", url, params=params, headers=headers, timeout=timeout)
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+        if self._session is not None:
+            self._session.close()
+
+
+_transport: Optional[ConnectorTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> ConnectorTransport:
+    """모든 커넥터가 공유하는 전역 transport 반환 (최초 호출 시 생성)"""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                settings = get_settings()
+                _transport = ConnectorTransport(
+                    pool_connections=settings.connector_http_pool_connections,
+                    pool_maxsize=settings.connector_http_pool_maxsize,
+                    http2=settings.connector_http2_enabled,
+                )
+    return _transport
+
+
+def close_transport() -> None:
+    """애플리케이션 종료 시 커넥션 풀 정리"""
+    global _transport
+    with _transport_lock:
+        if _transport is not None:
+            _transport.close()
+            _transport = None
@@ -4,8 +4,11 @@ from __future__ import annotations
 import base64
 import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
 from functools import lru_cache
-from typing import Optional
+from typing import Iterable, List, Optional, Tuple
 
 from cryptography.fernet import Fernet, InvalidToken
 
@@ -27,13 +30,90 @@ def _get_fernet() -> Fernet:
     return Fernet(fernet_key)
 
 
+class PlaintextCache:
+    """Short-lived LRU of decrypted values keyed by the ciphertext hash.
+
+    Fernet tokens are immutable, so a given ciphertext always decrypts to the
+    same plaintext; entries only expire to bound how long secrets stay in memory.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    @staticmethod
+    def key(ciphertext: str) -> str:
+        return hashlib.sha256(ciphertext.encode("utf-8")).hexdigest()
+
+    def get(self, ciphertext: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        key = self.key(ciphertext)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, ciphertext: str, plaintext: str) -> None:
+        if not self.enabled:
+            return
+        key = self.key(ciphertext)
+        with self._lock:
+            self._entries[key] = (plaintext, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+def _build_plaintext_cache() -> PlaintextCache:
+    settings = get_settings()
+    return PlaintextCache(
+        max_entries=settings.credential_decrypt_cache_size,
+        ttl_seconds=settings.credential_decrypt_cache_ttl_seconds,
+    )
+
+
+plaintext_cache = _build_plaintext_cache()
+
+
 def encrypt(value: Optional[str]) -> Optional[str]:
     """Encrypt *value* using Fernet symmetric encryption."""
     if value is None:
         return None
     fernet = _get_fernet()
-    token = fernet.encrypt(value.encode("utf-8"))
-    return token.decode("utf-8")
+    token = fernet.encrypt(value.encode("utf-8")).decode("utf-8")
+    # The caller usually reads the value back right away (e.g. connector test after save)
+    plaintext_cache.set(token, value)
+    return token
 
 
 def decrypt(value: Optional[str]) -> Optional[str]:
@@ -51,11 +131,53 @@ def decrypt(value: Optional[str]) -> Optional[str]:
     """
     if value is None:
         return None
+    cached = plaintext_cache.get(value)
+    if cached is not None:
+        return cached
     fernet = _get_fernet()
     try:
-        decrypted = fernet.decrypt(value.encode("utf-8"))
-        return decrypted.decode("utf-8")
+        decrypted = fernet.decrypt(value.encode("utf-8")).decode("utf-8")
     except InvalidToken as e:
         # Decryption failed - could be wrong key, corrupted data, or tampered value
         logger.error(f"Decryption failed - possible data corruption or wrong key: {e}")
         raise DecryptionError(f"Failed to decrypt value: {e}") from e
+    plaintext_cache.set(value, decrypted)
+    return decrypted
+
+
+def decrypt_many(values: Iterable[Optional[str]]) -> List[Optional[str]]:
+    """Decrypt a batch of values, decrypting each distinct ciphertext once.
+
+    Values that fail to decrypt come back as None (and are logged) so that one
+    corrupted credential does not fail a whole portfolio load.
+    """
+    values = list(values)
+    results: dict = {}
+    for value in values:
+        if value is None or value in results:
+            continue
+        try:
+            results[value] = decrypt(value)
+        except DecryptionError:
+            results[value] = None
+    return [results.get(value) if value is not None else None for value in values]
+
+
+def preload_credentials(credentials: Iterable[object]) -> None:
+    """Warm the plaintext cache for every secret/token on the given ChannelCredentials.
+
+    Call this once after loading a portfolio so connector worker threads hit the
+    cache instead of repeating Fernet work per property access.
+    """
+    ciphertexts: List[Optional[str]] = []
+    for credential in credentials:
+        if credential is None:
+            continue
+        ciphertexts.extend(
+            (
+                credential.secret_encrypted,
+                credential.access_token_encrypted,
+                credential.refresh_token_encrypted,
+            )
+        )
+    decrypt_many(ciphertexts)
@@ -0,0 +1,125 @@
+"""스트리밍 CSV 내보내기
+
+전체 CSV 를 메모리에 만든 뒤 한 번에 보내지 않고, 채널 스냅샷/지표 이력을
+조금씩 만들면서 바로 행 단위로 내려보냅니다. 포트폴리오가 커져도 메모리 사용량은
+일정하고 첫 바이트는 첫 묶음이 준비되는 즉시 전송됩니다.
+
+스트리밍은 요청 DB 세션이 닫힌 뒤에도 계속되므로, 이력 조회는
+생성기 안에서 별도 세션(session_context)을 열어 사용합니다.
+"""
+from __future__ import annotations
+
+import csv
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from fastapi.responses import StreamingResponse
+from sqlmodel import select
+
+from ..database import session_context
+from ..models import ChannelAccount, ChannelMetricSnapshot
+
+CSV_FLUSH_ROWS = 100  # 이 행 수만큼 모아서 한 청크로 전송
+SNAPSHOT_CHUNK_SIZE = 20  # 스냅샷을 한 번에 조회할 채널 수
+HISTORY_CHUNK_SIZE = 1000  # 지표 이력을 한 번에 읽을 행 수
+
+HISTORY_HEADER = [
+    "channel_id",
+    "플랫폼",
+    "계정명",
+    "기록 시각",
+    "팔로워",
+    "참여율(%)",
+    "노출",
+    "좋아요",
+    "댓글",
+]
+
+
+class _LineBuffer:
+    """csv.writer 가 쓴 내용을 그대로 돌려주는 가짜 파일 (행마다 새 버퍼를 만들지 않음)"""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def iter_csv(header: Sequence[Any], rows: Iterable[Sequence[Any]], *, flush_rows: int = CSV_FLUSH_ROWS) -> Iterator[str]:
+    """헤더와 행 iterable 을 CSV 텍스트 청크로 변환 (flush_rows 행마다 yield)"""
+    writer = csv.writer(_LineBuffer())
+    yield writer.writerow(header)
+    chunk: List[str] = []
+    for row in rows:
+        chunk.append(writer.writerow(row))
+        if len(chunk) >= flush_rows:
+            yield "".join(chunk)
+            chunk = []
+    if chunk:
+        yield "".join(chunk)
+
+
+def csv_response(filename: str, header: Sequence[Any], rows: Iterable[Sequence[Any]]) -> StreamingResponse:
+    return StreamingResponse(
+        iter_csv(header, rows),
+        media_type="text/csv",
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+
+def iter_channel_snapshots(
+    accounts: Sequence[ChannelAccount],
+    *,
+    chunk_size: int = SNAPSHOT_CHUNK_SIZE,
+    fetch: Optional[Callable[[List[ChannelAccount]], Dict[int, Dict[str, Any]]]] = None,
+) -> Iterator[tuple]:
+    """채널을 chunk_size 개씩 조회하며 (채널, 스냅샷) 을 차례로 yield"""
+    if fetch is None:
+        from .social_fetcher import fetch_channel_snapshots as fetch
+
+    for start in range(0, len(accounts), chunk_size):
+        chunk = list(accounts[start:start + chunk_size])
+        snapshots = fetch(chunk)
+        for account in chunk:
+            yield account, snapshots.get(account.id, {})
+
+
+def iter_history_rows(
+    channels: Sequence[ChannelAccount],
+    *,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    chunk_size: int = HISTORY_CHUNK_SIZE,
+) -> Iterator[List[Any]]:
+    """지표 이력 테이블을 id 키셋으로 chunk_size 행씩 읽어 CSV 행으로 yield"""
+    channel_lookup = {channel.id: channel for channel in channels if channel.id is not None}
+    if not channel_lookup:
+        return
+    statement = select(ChannelMetricSnapshot).where(ChannelMetricSnapshot.channel_id.in_(list(channel_lookup)))
+    if since is not None:
+        statement = statement.where(ChannelMetricSnapshot.captured_at >= since)
+    if until is not None:
+        statement = statement.where(ChannelMetricSnapshot.captured_at < until)
+
+    last_id = 0
+    while True:
+        with session_context() as session:
+            rows = session.exec(
+                statement.where(ChannelMetricSnapshot.id > last_id)
+                .order_by(ChannelMetricSnapshot.id)
+                .limit(chunk_size)
+            ).all()
+        for row in rows:
+            channel = channel_lookup[row.channel_id]
+            yield [
+                row.channel_id,
+                channel.platform,
+                channel.account_name,
+                row.captured_at.isoformat(timespec="seconds"),
+                row.followers,
+                row.engagement_rate,
+                row.impressions,
+                row.likes,
+                row.comments,
+            ]
+        if len(rows) < chunk_size:
+            return
+        last_id = rows[-1].id
@@ -7,6 +7,7 @@ Gmail API를 사용한 이메일 전송 및 수신 서비스
 """
 import base64
 import logging
+import threading
 from typing import List, Optional, Dict, Any
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -55,6 +56,61 @@ class EmailMessage:
     body: str = ""
 
 
+SUMMARY_HEADERS = ['Subject', 'From', 'To', 'Date']
+BATCH_SIZE = 50  # Gmail 권장 배치 크기 (최대 100)
+
+_credentials_lock = threading.Lock()
+_cached_credentials: Optional[tuple] = None  # (설정 키, 인증 정보)
+_thread_local = threading.local()
+
+
+def _load_credentials():
+    """설정에서 Gmail 인증 정보 생성"""
+    # Service Account 방식 (서버 간 통신)
+    if hasattr(settings, 'google_service_account_file') and settings.google_service_account_file:
+        try:
+            credentials = service_account.Credentials.from_service_account_file(
+                settings.google_service_account_file,
+                scopes=['https://www.googleapis.com/auth/gmail.send',
+                       'https://www.googleapis.com/auth/gmail.readonly']
+            )
+            # Domain-wide delegation이 필요한 경우
+            if hasattr(settings, 'gmail_delegated_email') and settings.gmail_delegated_email:
+                credentials = credentials.with_subject(settings.gmail_delegated_email)
+            return credentials
+        except Exception as e:
+            logger.warning(f"Service account initialization failed, falling back to OAuth2: {e}")
+
+    # OAuth2 방식 (사용자 인증)
+    if hasattr(settings, 'gmail_credentials_json') and settings.gmail_credentials_json:
+        try:
+            import json
+            creds_dict = json.loads(settings.gmail_credentials_json)
+            return Credentials.from_authorized_user_info(creds_dict)
+        except Exception as e:
+            logger.error(f"OAuth2 credentials initialization failed: {e}")
+            raise GmailServiceError(f"Gmail 인증 실패: {e}") from e
+
+    raise GmailServiceError(
+        "Gmail 인증 정보가 설정되지 않았습니다. "
+        "GOOGLE_SERVICE_ACCOUNT_FILE 또는 GMAIL_CREDENTIALS_JSON을 설정하세요."
+    )
+
+
+def _get_credentials():
+    """인증 정보 캐시 (발급받은 액세스 토큰을 만료 전까지 재사용)"""
+    global _cached_credentials
+    key = (
+        settings.google_service_account_file,
+        settings.gmail_delegated_email,
+        settings.gmail_credentials_json,
+    )
+    with _credentials_lock:
+        if _cached_credentials is None or _cached_credentials[0] != key:
+            _cached_credentials = (key, _load_credentials())
+        return _cached_credentials[1]
+
+
 class GmailService:
     """Gmail API 서비스"""
 
@@ -67,41 +123,26 @@ class GmailService:
             )
 
         self.sender_email = settings.gmail_sender_email
-        self.service = self._get_gmail_service()
+        # 인증 정보가 잘못되었으면 생성 시점에 바로 실패
+        self._get_gmail_service()
+
+    @property
+    def service(self):
+        return self._get_gmail_service()
 
     def _get_gmail_service(self):
-        """Gmail API 서비스 객체 생성"""
-        # Service Account 방식 (서버 간 통신)
-        if hasattr(settings, 'google_service_account_file') and settings.google_service_account_file:
-            try:
-                credentials = service_account.Credentials.from_service_account_file(
-                    settings.google_service_account_file,
-                    scopes=['https://www.googleapis.com/auth/gmail.send',
-                           'https://www.googleapis.com/auth/gmail.readonly']
-                )
-                # Domain-wide delegation이 필요한 경우
-                if hasattr(settings, 'gmail_delegated_email') and settings.gmail_delegated_email:
-                    credentials = credentials.with_subject(settings.gmail_delegated_email)
-
-                return build('gmail', 'v1', credentials=credentials)
-            except Exception as e:
-                logger.warning(f"Service account initialization failed, falling back to OAuth2: {e}")
-
-        # OAuth2 방식 (사용자 인증)
-        if hasattr(settings, 'gmail_credentials_json') and settings.gmail_credentials_json:
-            try:
-                import json
-                creds_dict = json.loads(settings.gmail_credentials_json)
-                credentials = Credentials.from_authorized_user_info(creds_dict)
-                return build('gmail', 'v1', credentials=credentials)
-            except Exception as e:
-                logger.error(f"OAuth2 credentials initialization failed: {e}")
-                raise GmailServiceError(f"Gmail 인증 실패: {e}") from e
-
-        raise GmailServiceError(
-            "Gmail 인증 정보가 설정되지 않았습니다. "
-            "GOOGLE_SERVICE_ACCOUNT_FILE 또는 GMAIL_CREDENTIALS_JSON을 설정하세요."
-        )
+        """Gmail API 서비스 객체 (스레드별로 한 번 생성해 재사용)
+
+        httplib2 기반 서비스 객체는 스레드 간에 공유할 수 없으므로 스레드마다 만들고,
+        액세스 토큰을 가진 인증 정보는 프로세스 전체에서 공유합니다.
+        """
+        credentials = _get_credentials()
+        cached = getattr(_thread_local, "gmail_service", None)
+        if cached is not None and cached[0] is credentials:
+            return cached[1]
+        service = build('gmail', 'v1', credentials=credentials, cache_discovery=False)
+        _thread_local.gmail_service = (credentials, service)
+        return service
 
     def send_email(
         self,
@@ -229,15 +270,19 @@ class GmailService:
         self,
         max_results: int = 10,
         query: str = "",
-        label_ids: Optional[List[str]] = None
+        label_ids: Optional[List[str]] = None,
+        summary_only: bool = False
     ) -> List[EmailMessage]:
         """
         메일함의 메시지 목록 조회
 
+        목록 조회 1회 + 배치 요청(최대 BATCH_SIZE 개씩)으로 상세 정보를 가져옵니다.
+
         Args:
             max_results: 최대 결과 수
             query: Gmail 검색 쿼리 (예: "is:unread", "from:example@gmail.com")
             label_ids: 라벨 ID 목록 (예: ["INBOX", "UNREAD"])
+            summary_only: True 면 본문 없이 제목/발신자/수신자/날짜 헤더와 snippet 만 조회
 
         Returns:
             이메일 메시지 목록
@@ -256,28 +301,43 @@ class GmailService:
             if label_ids:
                 params['labelIds'] = label_ids
 
+            service = self.service
+
             # 메시지 ID 목록 가져오기
-            results = self.service.users().messages().list(**params).execute()
+            results = service.users().messages().list(**params).execute()
             messages = results.get('messages', [])
 
             if not messages:
                 return []
 
-            # 각 메시지의 상세 정보 가져오기
+            get_params: Dict[str, Any] = {'userId': 'me', 'format': 'full'}
+            if summary_only:
+                get_params = {'userId': 'me', 'format': 'metadata', 'metadataHeaders': SUMMARY_HEADERS}
+
+            # 각 메시지의 상세 정보를 배치 요청으로 가져오기
+            details: Dict[str, Dict[str, Any]] = {}
+
+            def collect(request_id, response, exception):
+                if exception is not None:
+                    logger.warning(f"Failed to fetch message {request_id}: {exception}")
+                    return
+                details[request_id] = response
+
+            for start in range(0, len(messages), BATCH_SIZE):
+                batch = service.new_batch_http_request(callback=collect)
+                for msg in messages[start:start + BATCH_SIZE]:
+                    batch.add(service.users().messages().get(id=msg['id'], **get_params), request_id=msg['id'])
+                batch.execute()
+
             email_messages = []
             for msg in messages:
+                message_detail = details.get(msg['id'])
+                if message_detail is None:
+                    continue
                 try:
-                    message_detail = self.service.users().messages().get(
-                        userId='me',
-                        id=msg['id'],
-                        format='full'
-                    ).execute()
-
-                    email_msg = self._parse_message(message_detail)
-                    email_messages.append(email_msg)
+                    email_messages.append(self._parse_message(message_detail))
                 except Exception as e:
-                    logger.warning(f"Failed to fetch message {msg['id']}: {e}")
-                    continue
+                    logger.warning(f"Failed to parse message {msg['id']}: {e}")
 
             return email_messages
 
@@ -292,14 +352,14 @@ class GmailService:
 
     def _parse_message(self, message: Dict[str, Any]) -> EmailMessage:
         """Gmail API 메시지를 EmailMessage 객체로 변환"""
-        headers = {h['name'].lower(): h['value'] for h in message['payload']['headers']}
+        headers = {h['name'].lower(): h['value'] for h in message['payload'].get('headers', [])}
 
-        # 본문 추출
+        # 본문 추출 (format='metadata' 응답에는 본문 데이터가 없음)
         body = ""
         if 'parts' in message['payload']:
             for part in message['payload']['parts']:
-                if part['mimeType'] == 'text/plain':
-                    if 'data' in part['body']:
+                if part.get('mimeType') == 'text/plain':
+                    if 'data' in part.get('body', {}):
                         body = base64.urlsafe_b64decode(part['body']['data']).decode('utf-8')
                         break
         elif 'body' in message['payload'] and 'data' in message['payload']['body']:
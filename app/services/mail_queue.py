@@ -0,0 +1,305 @@
+"""발송 메일 대기열
+
+요청 핸들러는 ``enqueue_email`` 로 ``OutboundEmail`` 행만 기록하고 바로 응답합니다.
+행은 호출한 세션의 트랜잭션에 함께 커밋되므로, 문의 저장 등 본 작업과
+발송 예약이 함께 성공하거나 함께 롤백됩니다.
+
+워커는 발송 대상을 짧은 트랜잭션으로 가져가 SENDING 으로 표시(임대)한 뒤,
+트랜잭션 밖에서 열어 둔 SMTP 세션 / Gmail API 클라이언트를 재사용해 보내고
+결과를 다시 짧은 트랜잭션으로 기록합니다. 실패한 메일은 지수 백오프로 재시도합니다
+(``MAIL_QUEUE_MAX_ATTEMPTS`` 회 실패하면 FAILED). 워커가 발송 도중 죽으면 임대가
+끝난 뒤 다른 워커가 다시 가져가므로 드물게 중복 발송될 수 있습니다 (at-least-once).
+가져가기는 조건부 UPDATE 이므로 웹 프로세스마다 워커가 떠 있어도 (SQLite 포함)
+같은 메일을 두 워커가 동시에 보내지는 않습니다.
+
+실행 방법:
+- 웹 프로세스 내 asyncio 작업: ``MAIL_QUEUE_WORKER_ENABLED=true`` (기본값, main.py startup 에서 시작)
+- 별도 워커 프로세스: ``python -m app.services.mail_queue``
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import smtplib
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event, update
+from sqlmodel import Session, select
+
+from ..config import get_settings
+from ..database import session_context
+from ..models import OutboundEmail, OutboundEmailStatus
+from .gmail_service import GmailService, get_gmail_service
+from .super_admin_email import SuperAdminEmailService
+
+logger = logging.getLogger(__name__)
+
+TRANSPORT_AUTO = "auto"  # Gmail API 우선, 없으면 슈퍼관리자 SMTP
+TRANSPORT_SMTP = "smtp"  # 슈퍼관리자 계정 SMTP 로만 발송
+SMTP_IDLE_SECONDS = 120  # 이보다 오래 쉰 SMTP 세션은 NOOP 으로 확인 후 재사용
+CLAIM_LEASE_SECONDS = 600  # 가져간 메일의 결과가 기록되지 않으면 이 시간 뒤 다시 발송 대상
+
+
+def _resolve_transport(transport: str) -> Optional[str]:
+    """실제 발송 수단 (gmail / smtp), 설정된 수단이 없으면 None"""
+    settings = get_settings()
+    if transport == TRANSPORT_AUTO and GmailService.is_configured():
+        return "gmail"
+    if SuperAdminEmailService.is_configured(settings):
+        return "smtp"
+    return None
+
+
+def enqueue_email(
+    session: Session,
+    to_address: str,
+    subject: str,
+    body: str,
+    *,
+    html: bool = False,
+    transport: str = TRANSPORT_AUTO,
+) -> Optional[OutboundEmail]:
+    """발송 예약 (호출한 쪽에서 커밋) - 발송 수단이 설정되어 있지 않으면 None"""
+    if _resolve_transport(transport) is None:
+        logger.warning("Email transport not configured, skipping email")
+        return None
+
+    email = OutboundEmail(to_address=to_address, subject=subject, body=body, html=html, transport=transport)
+    session.add(email)
+    # 커밋되면 워커가 다음 주기를 기다리지 않고 바로 발송
+    event.listen(session, "after_commit", lambda _session: mail_worker.wake(), once=True)
+    return email
+
+
+class _SMTPTransport:
+    """슈퍼관리자 계정 SMTP 세션을 열어 두고 재사용"""
+
+    def __init__(self):
+        self._server: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+
+    def _connection(self) -> smtplib.SMTP:
+        if self._server is not None and time.monotonic() - self._last_used > SMTP_IDLE_SECONDS:
+            try:
+                self._server.noop()
+            except (smtplib.SMTPException, OSError):
+                self.close()
+        if self._server is None:
+            self._server = SuperAdminEmailService(get_settings()).connect_smtp()
+        return self._server
+
+    def send(self, email: OutboundEmail) -> None:
+        message = SuperAdminEmailService(get_settings()).build_message(
+            email.to_address, email.subject, email.body, html=email.html
+        )
+        try:
+            self._connection().send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            # 서버가 유휴 세션을 끊은 경우 한 번만 다시 연결
+            self.close()
+            self._connection().send_message(message)
+        self._last_used = time.monotonic()
+
+    def close(self) -> None:
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except Exception:
+                self._server.close()
+            self._server = None
+
+
+class _GmailTransport:
+    def send(self, email: OutboundEmail) -> None:
+        # 인증 정보와 API 클라이언트는 gmail_service 에서 캐시됨
+        get_gmail_service().send_email(email.to_address, email.subject, email.body, html=email.html)
+
+    def close(self) -> None:
+        pass
+
+
+class MailQueueWorker:
+    """대기열에서 발송 대상을 묶음 단위로 가져와 발송"""
+
+    def __init__(
+        self,
+        *,
+        batch_size: int = 50,
+        max_attempts: int = 5,
+        backoff_seconds: int = 30,
+        backoff_max_seconds: int = 3600,
+    ):
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self._transports: Dict[str, object] = {}
+        self._run_lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake_event: Optional[asyncio.Event] = None
+        self.sent = 0
+        self.failed = 0
+
+    def _transport(self, name: str):
+        if name not in self._transports:
+            self._transports[name] = _GmailTransport() if name == "gmail" else _SMTPTransport()
+        return self._transports[name]
+
+    def _retry_delay(self, attempts: int) -> timedelta:
+        return timedelta(seconds=min(self.backoff_seconds * 2 ** (attempts - 1), self.backoff_max_seconds))
+
+    def _deliver(self, email: OutboundEmail, now: datetime) -> None:
+        transport_name = _resolve_transport(email.transport)
+        try:
+            if transport_name is None:
+                raise RuntimeError("Email transport not configured")
+            self._transport(transport_name).send(email)
+        except Exception as exc:
+            email.attempts += 1
+            email.last_error = str(exc)[:500]
+            if email.attempts >= self.max_attempts:
+                email.status = OutboundEmailStatus.FAILED
+                self.failed += 1
+                logger.error(f"Giving up on email #{email.id} to {email.to_address}: {exc}")
+            else:
+                email.status = OutboundEmailStatus.PENDING
+                email.next_attempt_at = now + self._retry_delay(email.attempts)
+                logger.warning(f"Email #{email.id} failed (attempt {email.attempts}), retrying: {exc}")
+            if transport_name == "smtp":
+                # 세션 상태를 알 수 없으므로 다음 메일은 새 연결로
+                self._transport(transport_name).close()
+            return
+
+        email.attempts += 1
+        email.status = OutboundEmailStatus.SENT
+        email.sent_at = now
+        email.last_error = None
+        self.sent += 1
+
+    def _claim_candidates(self, session: Session, now: datetime) -> List[Tuple[int, OutboundEmailStatus]]:
+        """발송 시점이 된 메일의 (id, 현재 상태) 목록"""
+        return session.exec(
+            select(OutboundEmail.id, OutboundEmail.status)
+            .where(OutboundEmail.status.in_([OutboundEmailStatus.PENDING, OutboundEmailStatus.SENDING]))
+            .where(OutboundEmail.next_attempt_at <= now)
+            .order_by(OutboundEmail.next_attempt_at, OutboundEmail.id)
+            .limit(self.batch_size)
+            # PostgreSQL 에서는 다른 워커가 잡고 있는 행을 건너뜀 (SQLite 는 무시)
+            .with_for_update(skip_locked=True)
+        ).all()
+
+    def _claim(self, now: datetime) -> List[OutboundEmail]:
+        """발송 대상을 SENDING 으로 표시하고 바로 커밋 (행 잠금은 이 짧은 트랜잭션 동안만 유지)
+
+        행 잠금이 없는 SQLite 에서도 여러 웹 프로세스의 워커가 같은 메일을 보내지 않도록
+        조건부 UPDATE 로 가져가고, 실제로 갱신된 행(rowcount == 1)만 발송합니다.
+        """
+        lease_until = now + timedelta(seconds=CLAIM_LEASE_SECONDS)
+        with session_context() as session:
+            claimed_ids: List[int] = []
+            for email_id, status in self._claim_candidates(session, now):
+                # 그 사이 다른 워커가 가져갔으면 상태/발송 시각이 바뀌어 0행 갱신
+                result = session.execute(
+                    update(OutboundEmail)
+                    .where(OutboundEmail.id == email_id)
+                    .where(OutboundEmail.status == status)
+                    .where(OutboundEmail.next_attempt_at <= now)
+                    .values(status=OutboundEmailStatus.SENDING, next_attempt_at=lease_until)
+                )
+                if result.rowcount == 1:
+                    claimed_ids.append(email_id)
+            emails: List[OutboundEmail] = []
+            if claimed_ids:
+                emails = session.exec(
+                    select(OutboundEmail)
+                    .where(OutboundEmail.id.in_(claimed_ids))
+                    .order_by(OutboundEmail.next_attempt_at, OutboundEmail.id)
+                ).all()
+            # 커밋 후에도 발송 중에 속성을 읽을 수 있도록 세션에서 분리
+            session.expunge_all()
+            session.commit()
+        return list(emails)
+
+    def _record(self, emails: List[OutboundEmail]) -> None:
+        """발송 결과를 한 번에 기록"""
+        with session_context() as session:
+            for email in emails:
+                session.add(email)
+            session.commit()
+
+    def run_once(self) -> int:
+        """발송 시점이 된 메일을 최대 batch_size 개 발송, 처리한 개수 반환"""
+        with self._run_lock:
+            emails = self._claim(datetime.utcnow())
+            if not emails:
+                return 0
+
+            # 네트워크 발송은 트랜잭션 밖에서
+            for email in emails:
+                self._deliver(email, datetime.utcnow())
+            sent_smtp = any(
+                email.transport == TRANSPORT_SMTP and email.status == OutboundEmailStatus.SENT
+                for email in emails
+            )
+            self._record(emails)
+
+            if sent_smtp:
+                # 보낸편지함 스냅샷 갱신
+                from .mailbox_poller import mailbox_poller
+
+                mailbox_poller.refresh_in_background()
+            return len(emails)
+
+    def wake(self) -> None:
+        """새 메일이 커밋되면 대기 중인 워커를 바로 깨움 (어느 스레드에서나 호출 가능)"""
+        if self._loop is not None and self._wake_event is not None:
+            self._loop.call_soon_threadsafe(self._wake_event.set)
+
+    async def run_forever(self, poll_seconds: int) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wake_event = asyncio.Event()
+        while True:
+            self._wake_event.clear()
+            try:
+                processed = await asyncio.to_thread(self.run_once)
+            except Exception as exc:
+                logger.error(f"Mail queue run failed: {exc}")
+                processed = 0
+            if processed >= self.batch_size:
+                continue
+            try:
+                await asyncio.wait_for(self._wake_event.wait(), timeout=poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    def close(self) -> None:
+        for transport in self._transports.values():
+            transport.close()
+        self._transports.clear()
+
+
+def build_worker() -> MailQueueWorker:
+    settings = get_settings()
+    return MailQueueWorker(
+        batch_size=settings.mail_queue_batch_size,
+        max_attempts=settings.mail_queue_max_attempts,
+        backoff_seconds=settings.mail_queue_backoff_seconds,
+    )
+
+
+mail_worker = build_worker()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(mail_worker.run_forever(get_settings().mail_queue_poll_seconds))
+    finally:
+        mail_worker.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""슈퍼관리자 메일함 스냅샷
+
+슈퍼관리자 대시보드가 렌더링 중에 IMAP 서버를 기다리지 않도록
+받은편지함/보낸편지함 요약을 백그라운드에서 갱신해 두고 마지막 스냅샷만 읽습니다.
+
+- ``MAILBOX_POLLER_ENABLED=true``: main.py startup 에서 ``MAILBOX_REFRESH_SECONDS`` 마다 갱신
+- 비활성: 대시보드 조회 시 스냅샷이 ``MAILBOX_REFRESH_SECONDS`` 보다 오래됐으면
+  백그라운드 스레드로 한 번 갱신하고, 이번 응답은 기존 스냅샷으로 렌더링
+- 대시보드 새로고침 버튼(``/super-admin?refresh_mailbox=1``): 주기와 관계없이 백그라운드 갱신 시작
+- ``GET /super-admin/email/mailbox``: 스냅샷 JSON (``?refresh=true`` 면 즉시 갱신 후 반환)
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from ..config import get_settings
+from .super_admin_email import (
+    EmailServiceError,
+    EmailSummary,
+    SuperAdminEmailService,
+)
+
+logger = logging.getLogger(__name__)
+
+MAILBOX_LIMIT = 10  # 대시보드에 표시하는 폴더별 메일 수
+
+
+@dataclass
+class MailboxSnapshot:
+    configured: bool = False
+    inbox: List[EmailSummary] = field(default_factory=list)
+    sent: List[EmailSummary] = field(default_factory=list)
+    error: Optional[str] = None
+    refreshed_at: Optional[datetime] = None  # 마지막으로 성공한 조회 시각
+    checked_at: Optional[datetime] = None  # 마지막 조회 시도 시각 (실패 포함)
+
+    def age_seconds(self) -> Optional[float]:
+        if self.checked_at is None:
+            return None
+        return (datetime.utcnow() - self.checked_at).total_seconds()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "configured": self.configured,
+            "inbox": [asdict(summary) for summary in self.inbox],
+            "sent": [asdict(summary) for summary in self.sent],
+            "error": self.error,
+            "refreshed_at": self.refreshed_at.isoformat(timespec="seconds") if self.refreshed_at else None,
+        }
+
+
+class MailboxPoller:
+    """메일함 스냅샷 보관 및 갱신 (동시에 한 번만 IMAP 조회)"""
+
+    def __init__(self, limit: int = MAILBOX_LIMIT):
+        self.limit = limit
+        self._snapshot = MailboxSnapshot()
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def snapshot(self) -> MailboxSnapshot:
+        with self._lock:
+            return self._snapshot
+
+    def refresh(self) -> MailboxSnapshot:
+        """IMAP 에서 다시 읽어 스냅샷 교체 (다른 갱신이 진행 중이면 끝날 때까지 대기 후 그 결과 반환)"""
+        if not self._refresh_lock.acquire(blocking=False):
+            with self._refresh_lock:
+                return self.snapshot()
+        try:
+            settings = get_settings()
+            previous = self.snapshot()
+            now = datetime.utcnow()
+            if not SuperAdminEmailService.is_configured(settings):
+                snapshot = MailboxSnapshot(configured=False, checked_at=now)
+            else:
+                try:
+                    service = SuperAdminEmailService(settings)
+                    snapshot = MailboxSnapshot(
+                        configured=True,
+                        inbox=service.fetch_inbox(limit=self.limit),
+                        sent=service.fetch_sent(limit=self.limit),
+                        refreshed_at=now,
+                        checked_at=now,
+                    )
+                except Exception as exc:
+                    # 백그라운드 스레드이므로 IMAP 응답 파싱 오류 등도 스냅샷 오류로 기록
+                    if not isinstance(exc, EmailServiceError):
+                        logger.exception("Unexpected mailbox refresh error")
+                    logger.warning(f"Mailbox refresh failed: {exc}")
+                    # 실패해도 마지막으로 읽은 목록은 유지
+                    snapshot = MailboxSnapshot(
+                        configured=True,
+                        inbox=previous.inbox,
+                        sent=previous.sent,
+                        error=str(exc),
+                        refreshed_at=previous.refreshed_at,
+                        checked_at=now,
+                    )
+            with self._lock:
+                self._snapshot = snapshot
+            return snapshot
+        finally:
+            self._refresh_lock.release()
+
+    def is_refreshing(self) -> bool:
+        return self._refresh_lock.locked()
+
+    def refresh_in_background(self) -> bool:
+        """요청을 막지 않고 갱신 시작 (이미 갱신 중이면 False)"""
+        if self._refresh_lock.locked():
+            return False
+        threading.Thread(target=self.refresh, name="mailbox-refresh", daemon=True).start()
+        return True
+
+    def refresh_if_stale(self, max_age_seconds: float) -> bool:
+        """스냅샷이 오래됐으면 백그라운드 갱신 시작 (시작했으면 True)"""
+        age = self.snapshot().age_seconds()
+        if age is None or age >= max_age_seconds:
+            return self.refresh_in_background()
+        return False
+
+    async def run_forever(self, interval_seconds: int) -> None:
+        while True:
+            await asyncio.to_thread(self.refresh)
+            await asyncio.sleep(interval_seconds)
+
+
+mailbox_poller = MailboxPoller()
@@ -0,0 +1,187 @@
+"""채널 지표 시계열 이력 저장/조회 서비스
+
+커넥터 조회에 성공할 때마다 ``ChannelMetricSnapshot`` 한 행을 버퍼에 쌓고,
+일정 개수마다 또는 주기적으로 한 번의 bulk INSERT 로 기록합니다.
+성장률/추이/내보내기는 플랫폼 API 를 다시 호출하지 않고 이 이력으로 계산합니다.
+스냅샷의 ``growth_rate`` 도 이력이 쌓인 채널은 ``history_growth_rates`` 값으로 채웁니다.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import func, insert
+from sqlmodel import Session, select
+
+from ..cache import cache
+from ..config import get_settings
+from ..database import session_context
+from ..models import ChannelMetricSnapshot
+
+logger = logging.getLogger(__name__)
+
+GROWTH_CACHE_PREFIX = "metric:growth:"
+GROWTH_CACHE_TTL_SECONDS = 600  # 이력 기반 성장률은 천천히 바뀌므로 10분 캐싱
+GROWTH_WINDOW_DAYS = 7
+
+
+def _snapshot_row(channel_id: int, snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """스냅샷 dict 를 이력 테이블 행으로 변환"""
+    posts = snapshot.get("recent_posts") or []
+    try:
+        captured_at = datetime.fromisoformat(snapshot["fetched_at"])
+    except (KeyError, TypeError, ValueError):
+        captured_at = datetime.utcnow()
+    return {
+        "channel_id": channel_id,
+        "captured_at": captured_at,
+        "followers": int(snapshot.get("followers") or 0),
+        "engagement_rate": float(snapshot.get("engagement_rate") or 0.0),
+        "impressions": sum(int(post.get("impressions") or 0) for post in posts),
+        "likes": sum(int(post.get("likes") or 0) for post in posts),
+        "comments": sum(int(post.get("comments") or 0) for post in posts),
+    }
+
+
+class MetricHistoryWriter:
+    """스레드 안전 버퍼 + bulk INSERT 이력 기록기"""
+
+    def __init__(self, batch_size: int = 200):
+        self.batch_size = batch_size
+        self._buffer: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def record(self, channel_id: int, snapshot: Dict[str, Any]) -> None:
+        """조회 성공한 스냅샷을 버퍼에 추가 (배치 크기에 도달하면 즉시 기록)"""
+        with self._lock:
+            self._buffer.append(_snapshot_row(channel_id, snapshot))
+            should_flush = len(self._buffer) >= self.batch_size
+        if should_flush:
+            self.flush()
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._buffer)
+
+    def flush(self) -> int:
+        """버퍼에 쌓인 행을 한 번의 INSERT 로 기록하고 기록한 행 수를 반환"""
+        with self._lock:
+            rows, self._buffer = self._buffer, []
+        if not rows:
+            return 0
+        try:
+            with session_context() as session:
+                session.execute(insert(ChannelMetricSnapshot), rows)
+                session.commit()
+        except Exception as exc:
+            # 이력 기록 실패가 대시보드 응답에 영향을 주지 않도록 로그만 남김
+            logger.error(f"Failed to write {len(rows)} channel metric snapshots: {exc}")
+            return 0
+        return len(rows)
+
+
+history_writer = MetricHistoryWriter(batch_size=get_settings().metric_history_batch_size)
+
+
+def load_history(
+    session: Session,
+    channel_ids: Iterable[int],
+    *,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> Dict[int, List[ChannelMetricSnapshot]]:
+    """채널별 지표 이력을 시간순으로 조회"""
+    channel_ids = list(channel_ids)
+    if not channel_ids:
+        return {}
+    statement = select(ChannelMetricSnapshot).where(ChannelMetricSnapshot.channel_id.in_(channel_ids))
+    if since is not None:
+        statement = statement.where(ChannelMetricSnapshot.captured_at >= since)
+    if until is not None:
+        statement = statement.where(ChannelMetricSnapshot.captured_at < until)
+    statement = statement.order_by(ChannelMetricSnapshot.channel_id, ChannelMetricSnapshot.captured_at)
+
+    history: Dict[int, List[ChannelMetricSnapshot]] = {channel_id: [] for channel_id in channel_ids}
+    for row in session.exec(statement):
+        history[row.channel_id].append(row)
+    return history
+
+
+def compute_growth_rates(
+    session: Session,
+    channel_ids: Iterable[int],
+    *,
+    days: int = 7,
+) -> Dict[int, float]:
+    """기간 내 첫 기록 대비 최신 팔로워 증감률(%)을 채널별로 계산
+
+    이력이 2건 미만인 채널은 결과에 포함하지 않습니다.
+    """
+    channel_ids = list(channel_ids)
+    if not channel_ids:
+        return {}
+    since = datetime.utcnow() - timedelta(days=days)
+    bounds = session.exec(
+        select(
+            ChannelMetricSnapshot.channel_id,
+            func.min(ChannelMetricSnapshot.captured_at),
+            func.max(ChannelMetricSnapshot.captured_at),
+        )
+        .where(ChannelMetricSnapshot.channel_id.in_(channel_ids))
+        .where(ChannelMetricSnapshot.captured_at >= since)
+        .group_by(ChannelMetricSnapshot.channel_id)
+    ).all()
+
+    edges = {(channel_id, first) for channel_id, first, last in bounds if first != last}
+    edges |= {(channel_id, last) for channel_id, first, last in bounds if first != last}
+    if not edges:
+        return {}
+    rows = session.exec(
+        select(ChannelMetricSnapshot)
+        .where(ChannelMetricSnapshot.channel_id.in_({channel_id for channel_id, _ in edges}))
+        .where(ChannelMetricSnapshot.captured_at.in_({captured_at for _, captured_at in edges}))
+    ).all()
+    followers_at = {(row.channel_id, row.captured_at): row.followers for row in rows}
+
+    growth: Dict[int, float] = {}
+    for channel_id, first, last in bounds:
+        if first == last:
+            continue
+        start = followers_at.get((channel_id, first))
+        end = followers_at.get((channel_id, last))
+        if start and end is not None:
+            growth[channel_id] = round((end - start) / start * 100, 2)
+    return growth
+
+
+def history_growth_rates(channel_ids: Iterable[int]) -> Dict[int, float]:
+    """저장된 이력 기준 최근 7일 성장률 (채널별 캐시, 미스 채널만 한 번에 조회)
+
+    이력이 부족한 채널은 결과에 포함하지 않으므로 호출한 쪽의 기존 값이 유지됩니다.
+    """
+    growth: Dict[int, float] = {}
+    missing: List[int] = []
+    for channel_id in channel_ids:
+        # 이력 없음도 캐시하기 위해 (값,) 튜플로 저장
+        entry = cache.get(f"{GROWTH_CACHE_PREFIX}{channel_id}")
+        if entry is None:
+            missing.append(channel_id)
+        elif entry[0] is not None:
+            growth[channel_id] = entry[0]
+    if not missing:
+        return growth
+
+    try:
+        with session_context() as session:
+            computed = compute_growth_rates(session, missing, days=GROWTH_WINDOW_DAYS)
+    except Exception as exc:
+        logger.warning(f"Failed to compute growth rates from metric history: {exc}")
+        return growth
+    for channel_id in missing:
+        value = computed.get(channel_id)
+        cache.set(f"{GROWTH_CACHE_PREFIX}{channel_id}", (value,), GROWTH_CACHE_TTL_SECONDS)
+        if value is not None:
+            growth[channel_id] = value
+    return growth
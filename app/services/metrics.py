@@ -0,0 +1,281 @@
+"""Prometheus 텍스트 형식 지표 수집기
+
+외부 의존성 없이 카운터/게이지/히스토그램을 프로세스 메모리에 집계하고
+``/metrics`` 에서 Prometheus exposition 형식으로 내보냅니다.
+히스토그램은 누적 bucket 으로 기록하므로 Prometheus 의 ``histogram_quantile`` 로
+p50/p95/p99 를 계산할 수 있습니다. 값은 워커 프로세스별로 집계됩니다.
+"""
+from __future__ import annotations
+
+import bisect
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Sample = Tuple[str, Dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_sample(name: str, labels: Dict[str, str], value: float) -> str:
+    if labels:
+        rendered = ",".join(f'{key}="{_escape(label)}"' for key, label in labels.items())
+        name = f"{name}{{{rendered}}}"
+    if isinstance(value, int):
+        return f"{name} {value}"
+    return f"{name} {float(value)!r}"
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> List[Sample]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> List[Sample]:
+        with self._lock:
+            return [(self.name, dict(zip(self.labelnames, key)), value) for key, value in self._values.items()]
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def samples(self) -> List[Sample]:
+        with self._lock:
+            return [(self.name, dict(zip(self.labelnames, key)), value) for key, value in self._values.items()]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 조합별 [bucket 별 개수..., 합계]
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def samples(self) -> List[Sample]:
+        with self._lock:
+            snapshot = {key: list(series) for key, series in self._series.items()}
+        samples: List[Sample] = []
+        for key, series in snapshot.items():
+            labels = dict(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series[:-1]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                samples.append((f"{self.name}_bucket", {**labels, "le": le}, cumulative))
+            samples.append((f"{self.name}_count", labels, cumulative))
+            samples.append((f"{self.name}_sum", labels, series[-1]))
+        return samples
+
+
+class MetricsRegistry:
+    """지표 등록 및 exposition 텍스트 생성
+
+    collector 는 호출 시점의 값을 (이름, 종류, 설명, 샘플 목록) 으로 돌려주는 함수로,
+    캐시/DB 풀처럼 다른 모듈이 이미 집계하고 있는 값을 렌더링 시점에 읽을 때 사용합니다.
+    """
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], Iterable[Tuple[str, str, str, List[Sample]]]]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector: Callable[[], Iterable[Tuple[str, str, str, List[Sample]]]]) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        families = [(metric.name, metric.kind, metric.help_text, metric.samples()) for metric in self._metrics]
+        for collector in self._collectors:
+            families.extend(collector())
+        lines: List[str] = []
+        for name, kind, help_text, samples in families:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(_format_sample(sample_name, labels, value) for sample_name, labels, value in samples)
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_request_duration = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency by route template",
+        ("method", "route", "status"),
+    )
+)
+http_requests_in_flight = registry.register(
+    Gauge("http_requests_in_flight", "HTTP requests currently being processed")
+)
+connector_request_duration = registry.register(
+    Histogram(
+        "connector_request_duration_seconds",
+        "Platform API call latency per HTTP attempt",
+        ("platform",),
+    )
+)
+connector_requests = registry.register(
+    Counter(
+        "connector_requests_total",
+        "Platform API calls by outcome (2xx, 4xx, 429, 5xx, error, rate_limited)",
+        ("platform", "outcome"),
+    )
+)
+
+
+def route_template(scope) -> str:
+    """/creator/123 이 아닌 /creator/{creator_id} 처럼 라우트 템플릿으로 라벨링 (마운트는 마운트 경로)"""
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    return scope.get("root_path") or "<unmatched>"
+
+
+def status_outcome(status_code: Optional[int]) -> str:
+    if status_code is None:
+        return "error"
+    if status_code == 429:
+        return "429"
+    return f"{status_code // 100}xx"
+
+
+def _gauge_family(name: str, help_text: str, values: Dict[str, float], label: str):
+    return (name, "gauge", help_text, [(name, {label: key}, value) for key, value in values.items()])
+
+
+def _runtime_families():
+    """다른 모듈이 집계 중인 값 (DB 풀, 캐시, 비밀번호 해시 풀, 리포트 큐)"""
+    from ..auth import auth_manager
+    from ..cache import cache
+    from ..database import engine
+    from .crypto import plaintext_cache
+    from .report_jobs import report_queue
+
+    families = []
+    pool = engine.pool
+    if hasattr(pool, "checkedout"):
+        families.append(
+            _gauge_family(
+                "db_pool_connections",
+                "SQLAlchemy QueuePool connections by state",
+                {
+                    "size": pool.size(),
+                    "checked_out": pool.checkedout(),
+                    "checked_in": pool.checkedin(),
+                    "overflow": max(pool.overflow(), 0),
+                },
+                label="state",
+            )
+        )
+
+    cache_stats = cache.stats()
+    families.append(
+        ("cache_requests_total", "counter", "In-memory cache lookups by result", [
+            ("cache_requests_total", {"cache": "app", "result": "hit"}, cache_stats["hits"]),
+            ("cache_requests_total", {"cache": "app", "result": "miss"}, cache_stats["misses"]),
+            ("cache_requests_total", {"cache": "credentials", "result": "hit"}, plaintext_cache.hits),
+            ("cache_requests_total", {"cache": "credentials", "result": "miss"}, plaintext_cache.misses),
+        ])
+    )
+    families.append(_gauge_family("cache_hit_ratio", "In-memory cache hit ratio", {"app": cache_stats["hit_ratio"]}, label="cache"))
+    families.append(
+        _gauge_family(
+            "cache_usage",
+            "In-memory cache size",
+            {"entries": cache_stats["entries"], "bytes": cache_stats["bytes"]},
+            label="unit",
+        )
+    )
+    families.append(
+        ("cache_evictions_total", "counter", "In-memory cache evictions", [
+            ("cache_evictions_total", {}, cache_stats["evictions"]),
+        ])
+    )
+
+    hash_stats = auth_manager.hash_executor.stats()
+    families.append(
+        _gauge_family(
+            "password_hash_jobs",
+            "bcrypt executor jobs by state",
+            {"active": hash_stats["active"], "queued": hash_stats["queued"]},
+            label="state",
+        )
+    )
+    families.append(
+        ("password_hash_rejected_total", "counter", "bcrypt jobs rejected with 503", [
+            ("password_hash_rejected_total", {}, hash_stats["rejected"]),
+        ])
+    )
+
+    report_stats = report_queue.stats()
+    families.append(
+        ("report_jobs_in_flight", "gauge", "PDF reports currently rendering", [
+            ("report_jobs_in_flight", {}, report_stats["in_flight"]),
+        ])
+    )
+    return families
+
+
+registry.register_collector(_runtime_families)
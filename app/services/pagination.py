@@ -0,0 +1,128 @@
+"""키셋(커서) 페이지네이션 도우미
+
+LIMIT/OFFSET 은 깊은 페이지일수록 앞의 행을 모두 읽고 버리므로 느려집니다.
+키셋 방식은 마지막으로 본 행의 (정렬 컬럼, id) 를 커서로 넘겨
+``WHERE (sort, id) < (:sort, :id) ORDER BY sort DESC, id DESC LIMIT n`` 으로 조회하므로
+정렬 컬럼 인덱스를 타고 몇 번째 페이지든 첫 페이지와 같은 비용이 듭니다.
+전체 개수는 페이지마다 COUNT(*) 하지 않고 짧게 캐시한 값을 사용합니다.
+"""
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Generic, List, Optional, Tuple, TypeVar
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, func, or_
+from sqlmodel import Session, select
+
+from ..cache import cache
+from ..config import get_settings
+
+T = TypeVar("T")
+
+COUNT_CACHE_PREFIX = "pagination:count:"
+
+
+class KeysetPage(Generic[T]):
+    """한 페이지 조회 결과 (next_cursor 가 None 이면 마지막 페이지)"""
+
+    __slots__ = ("items", "next_cursor")
+
+    def __init__(self, items: List[T], next_cursor: Optional[str]):
+        self.items = items
+        self.next_cursor = next_cursor
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+def encode_cursor(sort_value: Any, tie_value: Any) -> str:
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    raw = json.dumps([sort_value, tie_value], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, Any]:
+    """커서를 (정렬 시각, id) 로 해석 - 잘못된 커서는 400"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, tie_value = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(sort_value), tie_value
+    except (ValueError, TypeError, binascii.Error) as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from exc
+
+
+def parse_page(value: Optional[str]) -> int:
+    """``?page=N`` 쿼리 값 해석 - 숫자가 아니거나 1 미만이면 400"""
+    if value is None:
+        return 1
+    try:
+        page = int(value)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid page") from exc
+    if page < 1:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid page")
+    return page
+
+
+def keyset_page(
+    session: Session,
+    statement,
+    *,
+    sort_column,
+    tie_column,
+    per_page: int,
+    cursor: Optional[str] = None,
+    page: int = 1,
+) -> KeysetPage:
+    """최신순(sort_column DESC, tie_column DESC) 키셋 페이지 조회
+
+    Args:
+        statement: WHERE 조건까지 적용된 select (정렬/LIMIT 은 여기서 추가)
+        sort_column: 인덱스가 걸린 정렬 컬럼 (created_at / connected_at)
+        tie_column: 같은 시각의 행을 구분할 고유 컬럼 (보통 id)
+        cursor: 이전 페이지의 next_cursor (없으면 첫 페이지)
+        page: 커서 없이 들어온 기존 ``?page=N`` 링크 호환용 - OFFSET 으로 한 번 조회하고
+            다음 페이지부터는 next_cursor 로 이어감
+    """
+    offset = 0
+    if cursor:
+        sort_value, tie_value = decode_cursor(cursor)
+        statement = statement.where(
+            or_(
+                sort_column < sort_value,
+                and_(sort_column == sort_value, tie_column < tie_value),
+            )
+        )
+    elif page > 1:
+        offset = (page - 1) * per_page
+    rows = session.exec(
+        statement.order_by(sort_column.desc(), tie_column.desc()).offset(offset).limit(per_page + 1)
+    ).all()
+
+    items = list(rows[:per_page])
+    next_cursor = None
+    if len(rows) > per_page:
+        last = items[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), getattr(last, tie_column.key))
+    return KeysetPage(items, next_cursor)
+
+
+def cached_count(session: Session, key: str, count_column, *criteria) -> int:
+    """COUNT(*) 결과를 PAGINATION_COUNT_CACHE_SECONDS 동안 캐시 (페이지 이동마다 재계산하지 않음)"""
+
+    def load() -> int:
+        statement = select(func.count(count_column))
+        if criteria:
+            statement = statement.where(*criteria)
+        return session.exec(statement).first() or 0
+
+    ttl = get_settings().pagination_count_cache_seconds
+    if ttl <= 0:
+        return load()
+    return cache.get_or_compute(f"{COUNT_CACHE_PREFIX}{key}", load, ttl)
@@ -1,6 +1,8 @@
 """PDF 리포트 생성 서비스"""
 import io
 from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Dict
 
 try:
     from reportlab.lib import colors
@@ -249,3 +251,29 @@ def generate_manager_pdf(manager, creators, creator_channels, creator_snapshots)
     doc.build(elements)
     buffer.seek(0)
     return buffer
+
+
+def render_report(kind: str, payload: Dict[str, Any]) -> bytes:
+    """리포트 작업 워커 진입점 - 직렬화된 입력(dict)으로 PDF 를 만들어 bytes 로 반환
+
+    별도 프로세스에서 실행되므로 ORM 객체 대신 report_jobs 가 만든 평범한 dict 를 받습니다.
+    """
+    if kind == "dashboard":
+        buffer = generate_dashboard_pdf(
+            SimpleNamespace(**payload["user"]),
+            [SimpleNamespace(**account) for account in payload["accounts"]],
+            payload["snapshots"],
+        )
+    elif kind == "manager":
+        buffer = generate_manager_pdf(
+            SimpleNamespace(**payload["manager"]),
+            [SimpleNamespace(**creator) for creator in payload["creators"]],
+            {
+                creator_id: [SimpleNamespace(**channel) for channel in channels]
+                for creator_id, channels in payload["creator_channels"].items()
+            },
+            payload["creator_snapshots"],
+        )
+    else:
+        raise ValueError(f"Unknown report kind: {kind}")
+    return buffer.getvalue()
@@ -0,0 +1,184 @@
+"""매니저 포트폴리오 전체 지표 이력 일괄 내보내기
+
+승인된 모든 크리에이터의 채널 지표 이력을 기간 단위로 CSV / NDJSON / Parquet 로 스트리밍합니다.
+채널/이력을 메모리에 모두 올리지 않고 서버 측 커서(yield_per)로 묶음 단위로 읽으며,
+응답 스트리밍 동안 별도 DB 세션을 유지합니다 (요청 세션은 응답 전에 닫힘).
+"""
+from __future__ import annotations
+
+import io
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterator, List
+
+from sqlmodel import select
+
+from ..database import session_context
+from ..models import ChannelAccount, ChannelMetricSnapshot, ManagerCreatorLink, User
+from .csv_export import iter_csv
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+EXPORT_FORMATS = ("csv", "ndjson", "parquet")
+FETCH_CHUNK_SIZE = 1000  # 서버 측 커서에서 한 번에 가져올 행 수
+
+COLUMNS = [
+    "creator_id",
+    "creator_email",
+    "channel_id",
+    "platform",
+    "account_name",
+    "captured_at",
+    "followers",
+    "engagement_rate",
+    "impressions",
+    "likes",
+    "comments",
+]
+
+MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+class PortfolioExportError(Exception):
+    """지원하지 않는 형식 등 내보내기를 시작할 수 없을 때"""
+
+
+def iter_portfolio_rows(
+    manager_id: int,
+    since: datetime,
+    until: datetime,
+    *,
+    chunk_size: int = FETCH_CHUNK_SIZE,
+) -> Iterator[List[Any]]:
+    """승인된 크리에이터의 채널 지표 이력을 (크리에이터, 채널, 시각) 순으로 yield"""
+    statement = (
+        select(
+            User.id,
+            User.email,
+            ChannelAccount.id,
+            ChannelAccount.platform,
+            ChannelAccount.account_name,
+            ChannelMetricSnapshot.captured_at,
+            ChannelMetricSnapshot.followers,
+            ChannelMetricSnapshot.engagement_rate,
+            ChannelMetricSnapshot.impressions,
+            ChannelMetricSnapshot.likes,
+            ChannelMetricSnapshot.comments,
+        )
+        .join(ManagerCreatorLink, ManagerCreatorLink.creator_id == User.id)
+        .join(ChannelAccount, ChannelAccount.owner_id == User.id)
+        # 기간 내 이력이 없는 채널도 지표가 빈 행 하나로 남도록 기간 조건은 ON 절에 둠
+        .outerjoin(
+            ChannelMetricSnapshot,
+            (ChannelMetricSnapshot.channel_id == ChannelAccount.id)
+            & (ChannelMetricSnapshot.captured_at >= since)
+            & (ChannelMetricSnapshot.captured_at < until),
+        )
+        .where(ManagerCreatorLink.manager_id == manager_id)
+        .where(ManagerCreatorLink.approved == True)  # noqa: E712
+        .order_by(User.id, ChannelAccount.id, ChannelMetricSnapshot.captured_at)
+        # PostgreSQL 에서는 이름 있는 커서로 chunk_size 행씩 가져옴
+        .execution_options(yield_per=chunk_size)
+    )
+    with session_context() as session:
+        for row in session.exec(statement):
+            values = list(row)
+            if values[5] is not None:
+                values[5] = values[5].isoformat(timespec="seconds")
+            yield values
+
+
+def iter_ndjson(rows: Iterator[List[Any]], *, flush_rows: int = 100) -> Iterator[str]:
+    chunk: List[str] = []
+    for row in rows:
+        chunk.append(json.dumps(dict(zip(COLUMNS, row)), ensure_ascii=False) + "\n")
+        if len(chunk) >= flush_rows:
+            yield "".join(chunk)
+            chunk = []
+    if chunk:
+        yield "".join(chunk)
+
+
+class _ChunkSink(io.RawIOBase):
+    """ParquetWriter 가 쓴 바이트를 모아 두었다가 row group 단위로 내보내는 출력 스트림"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data, self._chunks = b"".join(self._chunks), []
+        return data
+
+
+def iter_parquet(rows: Iterator[List[Any]], *, row_group_size: int = FETCH_CHUNK_SIZE) -> Iterator[bytes]:
+    """row_group_size 행마다 Parquet row group 하나를 기록해 바로 내보냄"""
+    schema = pa.schema(
+        [
+            ("creator_id", pa.int64()),
+            ("creator_email", pa.string()),
+            ("channel_id", pa.int64()),
+            ("platform", pa.string()),
+            ("account_name", pa.string()),
+            ("captured_at", pa.string()),
+            ("followers", pa.int64()),
+            ("engagement_rate", pa.float64()),
+            ("impressions", pa.int64()),
+            ("likes", pa.int64()),
+            ("comments", pa.int64()),
+        ]
+    )
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+
+    def write_group(batch: List[List[Any]]) -> None:
+        columns: Dict[str, List[Any]] = {name: [row[index] for row in batch] for index, name in enumerate(COLUMNS)}
+        writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+
+    batch: List[List[Any]] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= row_group_size:
+            write_group(batch)
+            batch = []
+            yield sink.drain()
+    if batch:
+        write_group(batch)
+    writer.close()
+    yield sink.drain()
+
+
+def stream_portfolio_export(manager_id: int, since: datetime, until: datetime, export_format: str) -> Iterator:
+    """형식별 스트리밍 본문 생성기 (형식 검증은 스트리밍 시작 전에 수행)"""
+    if export_format not in EXPORT_FORMATS:
+        raise PortfolioExportError(f"Unsupported export format: {export_format}")
+    if export_format == "parquet" and not PYARROW_AVAILABLE:
+        raise PortfolioExportError("Parquet export requires pyarrow")
+
+    rows = iter_portfolio_rows(manager_id, since, until)
+    if export_format == "csv":
+        return iter_csv(COLUMNS, rows)
+    if export_format == "ndjson":
+        return iter_ndjson(rows)
+    return iter_parquet(rows)
@@ -0,0 +1,112 @@
+"""매니저 포트폴리오 일괄 로더
+
+매니저 대시보드, AI PD 포트폴리오 분석, 통합 PDF 리포트가 같은 데이터를 씁니다:
+연결 링크 → 크리에이터 → 채널(+자격 증명) → 스냅샷.
+크리에이터 수와 무관하게 고정된 쿼리 수로 읽고, 스냅샷은 모든 채널을
+``fetch_channel_snapshots`` 한 번으로 동시에 가져옵니다.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy.orm import selectinload
+from sqlmodel import select
+
+from ..models import ChannelAccount, ManagerCreatorLink, User
+from .social_fetcher import fetch_channel_snapshots
+
+
+class Portfolio:
+    """링크/크리에이터/채널/스냅샷 묶음
+
+    - ``creator_channels``: {크리에이터 id: [채널]} (승인된 크리에이터만)
+    - ``snapshots``: {채널 id: 스냅샷}
+    """
+
+    def __init__(
+        self,
+        links: List[ManagerCreatorLink],
+        creators: List[User],
+        channels: List[ChannelAccount],
+        snapshots: Dict[int, Dict[str, Any]],
+    ):
+        self.links = links
+        self.creators = creators
+        self.creator_lookup: Dict[int, User] = {creator.id: creator for creator in creators}
+        self.channels = channels
+        self.creator_channels: Dict[int, List[ChannelAccount]] = {}
+        for channel in channels:
+            self.creator_channels.setdefault(channel.owner_id, []).append(channel)
+        self.snapshots = snapshots
+
+    @property
+    def approved_links(self) -> List[ManagerCreatorLink]:
+        return [link for link in self.links if link.approved]
+
+    @property
+    def pending_links(self) -> List[ManagerCreatorLink]:
+        return [link for link in self.links if not link.approved]
+
+    @property
+    def approved_creators(self) -> List[User]:
+        """승인 순서대로의 크리에이터 (계정이 삭제된 링크는 제외)"""
+        return [
+            self.creator_lookup[link.creator_id]
+            for link in self.approved_links
+            if link.creator_id in self.creator_lookup
+        ]
+
+    def snapshots_by_creator(self) -> Dict[int, Dict[int, Dict[str, Any]]]:
+        """{크리에이터 id: {채널 id: 스냅샷}} - AIPDService.analyze_manager_portfolio 형식"""
+        return {
+            creator_id: {channel.id: self.snapshots.get(channel.id, {}) for channel in channels}
+            for creator_id, channels in self.creator_channels.items()
+        }
+
+
+def load_portfolio(
+    session,
+    manager_id: int,
+    *,
+    links: Optional[Sequence[ManagerCreatorLink]] = None,
+    with_social_accounts: bool = False,
+    with_snapshots: bool = True,
+) -> Portfolio:
+    """매니저 포트폴리오 로드 (링크를 넘기지 않으면 승인된 링크 전체)
+
+    쿼리: 링크 1 + 크리에이터 1 (+ 소셜 계정 1) + 채널 1 + 자격 증명 1.
+    대시보드처럼 링크를 페이지 단위로 읽는 경우 해당 페이지의 링크를 넘기며,
+    채널/스냅샷은 그중 승인된 크리에이터 것만 로드합니다.
+    """
+    if links is None:
+        links = session.exec(
+            select(ManagerCreatorLink)
+            .where(ManagerCreatorLink.manager_id == manager_id)
+            .where(ManagerCreatorLink.approved == True)  # noqa: E712
+            .order_by(ManagerCreatorLink.connected_at, ManagerCreatorLink.creator_id)
+        ).all()
+    links = list(links)
+
+    creator_ids = [link.creator_id for link in links]
+    creators: List[User] = []
+    if creator_ids:
+        statement = select(User).where(User.id.in_(creator_ids))
+        if with_social_accounts:
+            statement = statement.options(selectinload(User.social_accounts))
+        creators = list(session.exec(statement).all())
+
+    approved_ids = [link.creator_id for link in links if link.approved]
+    channels: List[ChannelAccount] = []
+    if approved_ids:
+        channels = list(
+            session.exec(
+                select(ChannelAccount)
+                .where(ChannelAccount.owner_id.in_(approved_ids))
+                .options(selectinload(ChannelAccount.credential))
+                .order_by(ChannelAccount.owner_id, ChannelAccount.id)
+            ).all()
+        )
+
+    # 자격 증명 복호화와 플랫폼 호출은 fetch_channel_snapshots 가 한 번에 병렬 처리
+    snapshots = fetch_channel_snapshots(channels) if with_snapshots and channels else {}
+    return Portfolio(links, creators, channels, snapshots)
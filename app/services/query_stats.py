@@ -0,0 +1,125 @@
+"""요청별 SQL 쿼리 수 / DB 시간 집계
+
+엔진의 cursor 실행 이벤트로 모든 쿼리를 측정하고, 현재 요청의 ``QueryStats``
+(contextvar) 에 누적합니다. 미들웨어가 요청마다 ``track_queries`` 를 열어
+응답 헤더(``X-DB-Queries`` / ``X-DB-Time``)와 /metrics 에 반영하며,
+``SLOW_QUERY_THRESHOLD_MS`` 를 넘는 쿼리는 라우트와 함께 경고 로그로 남깁니다.
+
+테스트에서는 ``assert_max_queries`` 로 코드 블록의 쿼리 예산을,
+``assert_query_budget`` 으로 라우트 응답의 쿼리 예산을 검사합니다.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, List, MutableMapping, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from ..config import get_settings
+from .metrics import Counter, Histogram, registry, route_template
+
+logger = logging.getLogger(__name__)
+
+db_query_duration = registry.register(
+    Histogram("db_query_duration_seconds", "SQL statement execution time")
+)
+db_queries_per_request = registry.register(
+    Histogram(
+        "http_request_db_queries",
+        "SQL statements executed per request by route template",
+        ("route",),
+        buckets=(1, 2, 5, 10, 20, 50, 100, 200),
+    )
+)
+db_slow_queries = registry.register(
+    Counter("db_slow_queries_total", "SQL statements over SLOW_QUERY_THRESHOLD_MS", ("route",))
+)
+
+
+class QueryStats:
+    __slots__ = ("count", "total_seconds", "scope", "statements")
+
+    def __init__(self, scope: Optional[MutableMapping[str, Any]] = None, *, record_statements: bool = False):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.scope = scope
+        self.statements: Optional[List[str]] = [] if record_statements else None
+
+    @property
+    def route(self) -> str:
+        return route_template(self.scope) if self.scope is not None else "<none>"
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries(
+    scope: Optional[MutableMapping[str, Any]] = None,
+    *,
+    record_statements: bool = False,
+) -> Iterator[QueryStats]:
+    """블록 안(같은 컨텍스트의 to_thread 포함)에서 실행된 쿼리를 집계"""
+    stats = QueryStats(scope, record_statements=record_statements)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context._query_started_at
+    db_query_duration.observe(elapsed)
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.total_seconds += elapsed
+        if stats.statements is not None:
+            stats.statements.append(statement)
+
+    threshold_ms = get_settings().slow_query_threshold_ms
+    if threshold_ms > 0 and elapsed * 1000 >= threshold_ms:
+        route = stats.route if stats is not None else "<background>"
+        db_slow_queries.inc(route=route)
+        logger.warning(f"Slow query ({elapsed * 1000:.0f}ms) on {route}: {' '.join(statement.split())[:500]}")
+
+
+def instrument_engine(engine: Engine) -> None:
+    """엔진에 쿼리 측정 이벤트 등록 (여러 번 호출해도 한 번만 등록)"""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def record_request(stats: QueryStats) -> None:
+    db_queries_per_request.observe(stats.count, route=stats.route)
+
+
+@contextmanager
+def assert_max_queries(limit: int, engine: Optional[Engine] = None) -> Iterator[QueryStats]:
+    """테스트용 - 블록 안에서 실행된 쿼리가 limit 개를 넘으면 실행된 SQL 과 함께 실패"""
+    if engine is not None:
+        instrument_engine(engine)
+    with track_queries(record_statements=True) as stats:
+        yield stats
+    if stats.count > limit:
+        executed = "\n".join(f"  {' '.join(statement.split())[:200]}" for statement in stats.statements)
+        raise AssertionError(f"{stats.count} queries executed, budget was {limit}:\n{executed}")
+
+
+def assert_query_budget(response, limit: int) -> None:
+    """테스트용 - 라우트 응답의 X-DB-Queries 헤더가 limit 를 넘으면 실패"""
+    count = int(response.headers["X-DB-Queries"])
+    if count > limit:
+        raise AssertionError(f"{response.request.url.path} executed {count} queries, budget was {limit}")
@@ -0,0 +1,178 @@
+"""플랫폼/자격 증명별 토큰 버킷 호출 제한기
+
+커넥터는 요청 전에 ``acquire`` 로 플랫폼 버킷과 자격 증명(토큰) 버킷에서 토큰을 하나씩 받습니다.
+플랫폼이 429 / Retry-After 로 제한을 알려오면 ``penalize`` 로 해당 버킷을 일정 시간 막아
+같은 토큰을 쓰는 다른 스레드도 함께 기다리게 합니다.
+"""
+from __future__ import annotations
+
+import hashlib
+import random
+import threading
+import time
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from ..config import get_settings
+
+
+class RateLimit(NamedTuple):
+    rate: float  # 초당 토큰 보충량
+    burst: int  # 버킷 최대 토큰 수
+
+
+# 플랫폼 전체(앱 단위) 제한과 자격 증명(사용자 토큰) 단위 제한
+PLATFORM_RATE_LIMITS: Dict[str, Tuple[RateLimit, RateLimit]] = {
+    "instagram": (RateLimit(5.0, 20), RateLimit(1.0, 10)),
+    "facebook": (RateLimit(5.0, 20), RateLimit(1.0, 10)),
+    "meta_ads": (RateLimit(2.0, 10), RateLimit(0.5, 5)),
+    "youtube": (RateLimit(10.0, 20), RateLimit(2.0, 10)),
+    "twitter": (RateLimit(1.0, 10), RateLimit(0.3, 5)),
+    "threads": (RateLimit(1.0, 3), RateLimit(1.0, 3)),
+    "tiktok": (RateLimit(1.0, 3), RateLimit(1.0, 3)),
+}
+DEFAULT_RATE_LIMITS = (RateLimit(5.0, 10), RateLimit(1.0, 5))
+
+
+class RateLimitExceeded(Exception):
+    """허용 대기 시간 안에 토큰을 받을 수 없을 때 발생"""
+
+    def __init__(self, key: str, retry_after: float):
+        super().__init__(f"{key} rate limited for {retry_after:.1f}s")
+        self.key = key
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """토큰 버킷 (잠금은 RateLimiter 가 담당)"""
+
+    def __init__(self, limit: RateLimit):
+        self.rate = limit.rate
+        self.capacity = float(limit.burst)
+        self.tokens = float(limit.burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.acquired = 0
+        self.rejected = 0
+        self.throttled = 0
+        self.waited_seconds = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated = now
+
+    def delay(self, now: float) -> float:
+        """토큰 하나를 받기까지 기다려야 하는 시간"""
+        self._refill(now)
+        wait = max(self.blocked_until - now, 0.0)
+        if self.tokens < 1:
+            wait = max(wait, (1 - self.tokens) / self.rate)
+        return wait
+
+    def consume(self, wait: float) -> None:
+        # 대기 후 사용할 토큰을 미리 예약 (음수 토큰 = 뒤에 줄 선 요청)
+        self.tokens -= 1
+        self.acquired += 1
+        self.waited_seconds += wait
+
+    def block(self, now: float, seconds: float) -> None:
+        self.blocked_until = max(self.blocked_until, now + seconds)
+        self.tokens = min(self.tokens, 0.0)
+        self.throttled += 1
+
+    def snapshot(self, now: float) -> Dict[str, Any]:
+        self._refill(now)
+        return {
+            "tokens": round(self.tokens, 2),
+            "capacity": self.capacity,
+            "rate": self.rate,
+            "blocked_for": round(max(self.blocked_until - now, 0.0), 2),
+            "acquired": self.acquired,
+            "rejected": self.rejected,
+            "throttled": self.throttled,
+            "waited_seconds": round(self.waited_seconds, 3),
+        }
+
+
+def credential_key(token: Optional[str]) -> Optional[str]:
+    """토큰 원문 대신 짧은 해시를 버킷 키로 사용"""
+    if not token:
+        return None
+    return hashlib.sha256(token.encode()).hexdigest()[:12]
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """지수 백오프 + jitter (최소 절반은 기다리고 나머지를 무작위로)"""
+    ceiling = min(cap, base * (2 ** attempt))
+    return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+
+class RateLimiter:
+    """플랫폼/자격 증명별 토큰 버킷 묶음 (스레드 안전)"""
+
+    def __init__(self, *, enabled: bool = True):
+        self.enabled = enabled
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, key: str, limit: RateLimit) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(limit)
+            self._buckets[key] = bucket
+        return bucket
+
+    def _buckets_for(self, platform: str, credential: Optional[str]) -> Tuple[TokenBucket, ...]:
+        platform_limit, credential_limit = PLATFORM_RATE_LIMITS.get(platform, DEFAULT_RATE_LIMITS)
+        buckets = [self._bucket(platform, platform_limit)]
+        if credential:
+            buckets.append(self._bucket(f"{platform}:{credential}", credential_limit))
+        return tuple(buckets)
+
+    def acquire(self, platform: str, credential: Optional[str] = None, *, max_wait: float = 5.0) -> float:
+        """토큰을 받을 때까지 대기하고 대기한 시간을 반환
+
+        Raises:
+            RateLimitExceeded: 필요한 대기 시간이 max_wait 를 넘는 경우 (토큰은 소비하지 않음)
+        """
+        if not self.enabled:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            buckets = self._buckets_for(platform, credential)
+            wait = max(bucket.delay(now) for bucket in buckets)
+            if wait > max_wait:
+                for bucket in buckets:
+                    bucket.rejected += 1
+                raise RateLimitExceeded(platform, wait)
+            for bucket in buckets:
+                bucket.consume(wait)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def penalize(self, platform: str, credential: Optional[str], seconds: float) -> None:
+        """플랫폼이 호출 제한을 알려온 경우 해당 버킷을 seconds 동안 막음
+
+        자격 증명이 있으면 그 토큰만, 없으면(스크래핑 등) 플랫폼 전체를 막습니다.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            now = time.monotonic()
+            buckets = self._buckets_for(platform, credential)
+            buckets[-1].block(now, seconds)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """버킷별 토큰/차단/대기 상태 (자격 증명 키는 해시)"""
+        with self._lock:
+            now = time.monotonic()
+            return {key: bucket.snapshot(now) for key, bucket in self._buckets.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+rate_limiter = RateLimiter(enabled=get_settings().connector_rate_limit_enabled)
@@ -0,0 +1,176 @@
+"""채널 스냅샷 백그라운드 갱신 스케줄러
+
+요청 핸들러가 플랫폼 API 를 직접 기다리지 않도록, ``ChannelAccount`` 를 id 순으로
+배치 단위로 훑으며 플랫폼별 주기가 지난 채널을 미리 갱신합니다.
+한 틱(tick)에 플랫폼별로 갱신할 수 있는 채널 수(rate budget)를 넘지 않으며,
+남은 채널은 다음 틱에 이어서 처리합니다.
+
+실행 방법:
+- 웹 프로세스 내 asyncio 작업: ``REFRESH_SCHEDULER_ENABLED=true`` (main.py startup 에서 시작)
+- 별도 워커 프로세스: ``python -m app.services.refresh_scheduler``
+  (별도 프로세스는 웹 워커의 메모리 캐시를 공유하지 않으므로 지표 이력 테이블을 채우는 용도)
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, select
+
+from ..config import get_settings
+from ..database import session_context
+from ..models import ChannelAccount
+from .social_fetcher import refresh_channel_snapshots
+
+logger = logging.getLogger(__name__)
+
+# 플랫폼별 갱신 주기 (초)
+PLATFORM_REFRESH_INTERVALS: Dict[str, int] = {
+    "instagram": 15 * 60,
+    "facebook": 15 * 60,
+    "meta_ads": 60 * 60,
+    "youtube": 30 * 60,
+    "twitter": 15 * 60,
+    "threads": 30 * 60,
+    "tiktok": 30 * 60,
+}
+DEFAULT_REFRESH_INTERVAL = 30 * 60
+
+# 플랫폼별 틱당 최대 갱신 채널 수
+PLATFORM_RATE_BUDGETS: Dict[str, int] = {
+    "instagram": 60,
+    "facebook": 60,
+    "meta_ads": 30,
+    "youtube": 60,
+    "twitter": 15,
+    "threads": 10,
+    "tiktok": 10,
+}
+DEFAULT_RATE_BUDGET = 10
+
+
+class SnapshotRefreshScheduler:
+    """플랫폼별 주기와 예산에 맞춰 채널 스냅샷을 미리 갱신"""
+
+    def __init__(
+        self,
+        *,
+        batch_size: int = 200,
+        intervals: Optional[Dict[str, int]] = None,
+        budgets: Optional[Dict[str, int]] = None,
+    ):
+        self.batch_size = batch_size
+        self.intervals = intervals or PLATFORM_REFRESH_INTERVALS
+        self.budgets = budgets or PLATFORM_RATE_BUDGETS
+        self._last_refreshed: Dict[int, float] = {}
+        self._cursor = 0  # 다음 틱에 이어서 훑을 채널 id
+
+    def _is_due(self, account: ChannelAccount, now: float) -> bool:
+        last = self._last_refreshed.get(account.id)
+        if last is None:
+            return True
+        interval = self.intervals.get(account.platform, DEFAULT_REFRESH_INTERVAL)
+        return now - last >= interval
+
+    def _iter_batches(self, session: Session, after_id: int, until_id: Optional[int]) -> Iterator[List[ChannelAccount]]:
+        """id 기준 keyset 방식으로 채널을 배치 단위 조회"""
+        while True:
+            statement = (
+                select(ChannelAccount)
+                .where(ChannelAccount.id > after_id)
+                .options(selectinload(ChannelAccount.credential))
+                .order_by(ChannelAccount.id)
+                .limit(self.batch_size)
+            )
+            if until_id is not None:
+                statement = statement.where(ChannelAccount.id <= until_id)
+            batch = session.exec(statement).all()
+            if not batch:
+                return
+            yield list(batch)
+            after_id = batch[-1].id
+
+    def run_once(self) -> int:
+        """한 틱 실행 - 갱신한 채널 수 반환"""
+        remaining = dict(self.budgets)
+        refreshed = 0
+        start_cursor = self._cursor
+        # 이전 틱에서 멈춘 위치부터 끝까지, 그 다음 처음부터 시작 위치까지 한 바퀴
+        passes: List[Tuple[int, Optional[int]]] = [(start_cursor, None)]
+        if start_cursor:
+            passes.append((0, start_cursor))
+
+        # 예산 초과로 건너뛴 첫 채널 직전 위치 (다음 틱은 여기서 재개)
+        resume_after: Optional[int] = None
+
+        with session_context() as session:
+            for after_id, until_id in passes:
+                for batch in self._iter_batches(session, after_id, until_id):
+                    now = time.monotonic()
+                    due: List[ChannelAccount] = []
+                    previous_id = after_id
+                    for account in batch:
+                        if self._is_due(account, now):
+                            budget = remaining.get(account.platform, DEFAULT_RATE_BUDGET)
+                            if budget > 0:
+                                remaining[account.platform] = budget - 1
+                                due.append(account)
+                            elif resume_after is None:
+                                resume_after = previous_id
+                        previous_id = account.id
+                    after_id = previous_id
+
+                    if due:
+                        try:
+                            refresh_channel_snapshots(due)
+                        except Exception as exc:
+                            logger.error(f"Background refresh batch failed: {exc}")
+                        finished = time.monotonic()
+                        for account in due:
+                            self._last_refreshed[account.id] = finished
+                        refreshed += len(due)
+
+                    if not any(value > 0 for value in remaining.values()):
+                        # 모든 플랫폼 예산 소진 - 나머지는 다음 틱에
+                        self._cursor = resume_after if resume_after is not None else after_id
+                        return refreshed
+
+        # 한 바퀴를 다 돌았으면 건너뛴 위치(없으면 처음)부터 다시
+        self._cursor = resume_after or 0
+        return refreshed
+
+    async def run_forever(self, tick_seconds: int) -> None:
+        """asyncio 작업으로 주기 실행 (DB/HTTP 작업은 스레드에서 수행)"""
+        while True:
+            try:
+                refreshed = await asyncio.to_thread(self.run_once)
+                if refreshed:
+                    logger.info(f"Background refresh updated {refreshed} channel snapshots")
+            except Exception as exc:
+                logger.error(f"Background refresh tick failed: {exc}")
+            await asyncio.sleep(tick_seconds)
+
+
+def build_scheduler() -> SnapshotRefreshScheduler:
+    settings = get_settings()
+    return SnapshotRefreshScheduler(batch_size=settings.refresh_scheduler_batch_size)
+
+
+def main() -> None:
+    """별도 워커 프로세스 진입점"""
+    from .metric_history import history_writer
+
+    logging.basicConfig(level=logging.INFO)
+    settings = get_settings()
+    scheduler = build_scheduler()
+    try:
+        asyncio.run(scheduler.run_forever(settings.refresh_scheduler_tick_seconds))
+    finally:
+        history_writer.flush()
+
+
+if __name__ == "__main__":
+    main()
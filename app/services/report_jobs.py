@@ -0,0 +1,249 @@
+"""PDF 리포트 작업 큐
+
+reportlab 렌더링은 CPU 를 오래 점유하므로 요청 워커에서 실행하지 않고
+프로세스 풀로 보냅니다. 결과 PDF 는 입력 데이터 digest 를 키로 캐시하므로
+같은 스냅샷으로 다시 요청하면 렌더링 없이 바로 내려받을 수 있고,
+같은 입력이 동시에 들어오면 렌더링은 한 번만 실행됩니다.
+
+작업 상태는 프로세스 메모리에 보관되므로 상태 조회/다운로드는
+작업을 제출한 워커 프로세스에서 처리되어야 합니다 (세션 고정 또는 단일 워커).
+렌더링이 끝나면 작업은 future(PDF bytes)를 놓고 캐시만 참조하므로, 캐시에서
+밀려난 작업은 만료(expired)로 보고 다시 제출하도록 안내합니다.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..cache import cache
+from ..config import get_settings
+from .pdf_generator import render_report
+
+logger = logging.getLogger(__name__)
+
+REPORT_CACHE_PREFIX = "report:pdf:"
+VOLATILE_SNAPSHOT_KEYS = ("stale", "age_seconds")  # 요청마다 달라져 digest 에서 제외
+
+
+class ReportJob:
+    __slots__ = ("id", "owner_id", "kind", "digest", "filename", "created_at", "future", "error")
+
+    def __init__(self, owner_id: int, kind: str, digest: str, filename: str, future: Optional[Future]):
+        self.id = uuid.uuid4().hex
+        self.owner_id = owner_id
+        self.kind = kind
+        self.digest = digest
+        self.filename = filename
+        self.created_at = time.monotonic()
+        self.future = future  # 렌더링 중에만 보관 (끝나면 None, 결과는 캐시에서 조회)
+        self.error: Optional[str] = None
+
+
+def _person(user) -> Dict[str, Any]:
+    return {"id": user.id, "email": user.email, "name": user.name, "organization": user.organization}
+
+
+def _channel(channel) -> Dict[str, Any]:
+    return {
+        "id": channel.id,
+        "owner_id": channel.owner_id,
+        "platform": channel.platform,
+        "account_name": channel.account_name,
+    }
+
+
+def _stable_snapshots(snapshots: Dict[int, Dict[str, Any]], channels: Iterable) -> Dict[int, Dict[str, Any]]:
+    return {
+        channel.id: {
+            key: value
+            for key, value in snapshots.get(channel.id, {}).items()
+            if key not in VOLATILE_SNAPSHOT_KEYS
+        }
+        for channel in channels
+    }
+
+
+def dashboard_payload(user, accounts: List, snapshots: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
+    """개인 대시보드 리포트 입력 (프로세스 간 전달 가능한 dict)"""
+    return {
+        "user": _person(user),
+        "accounts": [_channel(account) for account in accounts],
+        "snapshots": _stable_snapshots(snapshots, accounts),
+    }
+
+
+def manager_payload(manager, creators: List, creator_channels: Dict[int, List], creator_snapshots: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
+    """기업 관리자 통합 리포트 입력 (프로세스 간 전달 가능한 dict)"""
+    channels = [channel for items in creator_channels.values() for channel in items]
+    return {
+        "manager": _person(manager),
+        "creators": [_person(creator) for creator in creators],
+        "creator_channels": {
+            creator_id: [_channel(channel) for channel in items]
+            for creator_id, items in creator_channels.items()
+        },
+        "creator_snapshots": _stable_snapshots(creator_snapshots, channels),
+    }
+
+
+def report_digest(kind: str, payload: Dict[str, Any]) -> str:
+    encoded = json.dumps([kind, payload], sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ReportJobQueue:
+    """PDF 렌더링 작업 제출/상태/결과 관리"""
+
+    def __init__(self, worker_processes: int = 2, cache_ttl_seconds: int = 3600, max_jobs: int = 1000):
+        self.worker_processes = worker_processes
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.max_jobs = max_jobs
+        self._executor = None
+        self._jobs: "OrderedDict[str, ReportJob]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.rendered = 0
+        self.cache_hits = 0
+        self.failed = 0
+
+    def _get_executor(self):
+        if self._executor is None:
+            if self.worker_processes > 0:
+                # 웹 서버 스레드 상태를 복제하지 않도록 spawn 으로 워커 생성
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.worker_processes,
+                    mp_context=get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report-render")
+        return self._executor
+
+    def submit(self, kind: str, payload: Dict[str, Any], *, owner_id: int, filename: str) -> ReportJob:
+        """렌더링 작업 제출 - 캐시된 결과가 있거나 같은 입력이 렌더링 중이면 재사용"""
+        digest = report_digest(kind, payload)
+        future: Optional[Future] = None
+        started = False
+        with self._lock:
+            if cache.get(f"{REPORT_CACHE_PREFIX}{digest}") is not None:
+                self.cache_hits += 1
+            else:
+                future = self._inflight.get(digest)
+                if future is None:
+                    try:
+                        future = self._get_executor().submit(render_report, kind, payload)
+                    except BrokenProcessPool:
+                        self._executor = None
+                        future = self._get_executor().submit(render_report, kind, payload)
+                    self._inflight[digest] = future
+                    started = True
+
+            job = ReportJob(owner_id, kind, digest, filename, future)
+            self._jobs[job.id] = job
+            self._prune()
+        if started:
+            # 이미 끝난 future 면 콜백이 즉시 실행되므로 잠금 밖에서 등록
+            future.add_done_callback(lambda done: self._finish(digest, done))
+        return job
+
+    def _finish(self, digest: str, future: Future) -> None:
+        error = future.exception()
+        if error is None:
+            cache.set(f"{REPORT_CACHE_PREFIX}{digest}", future.result(), self.cache_ttl_seconds)
+        else:
+            logger.error(f"Report rendering failed: {error}")
+            if isinstance(error, BrokenProcessPool):
+                self._executor = None
+        with self._lock:
+            self._inflight.pop(digest, None)
+            # PDF bytes 를 쥔 future 는 놓아 작업 목록이 캐시 한도 밖에서 메모리를 잡지 않도록 함
+            for job in self._jobs.values():
+                if job.future is future:
+                    job.future = None
+                    job.error = str(error) if error is not None else None
+            if error is None:
+                self.rendered += 1
+            else:
+                self.failed += 1
+
+    def _prune(self) -> None:
+        expires_before = time.monotonic() - self.cache_ttl_seconds
+        while self._jobs:
+            oldest = next(iter(self._jobs.values()))
+            if len(self._jobs) <= self.max_jobs and oldest.created_at >= expires_before:
+                break
+            self._jobs.popitem(last=False)
+
+    def get(self, job_id: str, owner_id: int) -> Optional[ReportJob]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None or job.owner_id != owner_id:
+            return None
+        return job
+
+    @staticmethod
+    def status(job: ReportJob) -> str:
+        """pending / done / failed / expired (캐시에서 밀려나 다시 제출해야 함)"""
+        future = job.future
+        if future is None:
+            if job.error is not None:
+                return "failed"
+            return "done" if cache.get(f"{REPORT_CACHE_PREFIX}{job.digest}") is not None else "expired"
+        if not future.done():
+            return "pending"
+        return "failed" if future.exception() is not None else "done"
+
+    def result(self, job: ReportJob) -> Optional[bytes]:
+        """완료된 PDF bytes (아직 렌더링 중이거나 캐시에서 밀려났으면 None)"""
+        pdf = cache.get(f"{REPORT_CACHE_PREFIX}{job.digest}")
+        future = job.future
+        if pdf is None and future is not None and future.done() and future.exception() is None:
+            # 완료 콜백이 캐시에 넣기 직전
+            pdf = future.result()
+        return pdf
+
+    def render(self, kind: str, payload: Dict[str, Any], *, owner_id: int, filename: str, timeout: Optional[float] = None) -> bytes:
+        """제출 후 완료까지 대기 (기존 동기 다운로드 엔드포인트용)"""
+        job = self.submit(kind, payload, owner_id=owner_id, filename=filename)
+        future = job.future
+        if future is not None:
+            return future.result(timeout=timeout)
+        pdf = self.result(job)
+        if pdf is None:
+            # 캐시 확인 직후 항목이 밀려난 드문 경우 - 직접 렌더링
+            pdf = render_report(kind, payload)
+        return pdf
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "jobs": len(self._jobs),
+                "in_flight": len(self._inflight),
+                "rendered": self.rendered,
+                "cache_hits": self.cache_hits,
+                "failed": self.failed,
+            }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+def _build_report_queue() -> ReportJobQueue:
+    settings = get_settings()
+    return ReportJobQueue(
+        worker_processes=settings.report_worker_processes,
+        cache_ttl_seconds=settings.report_cache_ttl_seconds,
+    )
+
+
+report_queue = _build_report_queue()
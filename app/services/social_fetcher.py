@@ -1,14 +1,27 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 from random import randint, random
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Set, Union
 
-from ..models import ChannelAccount
 from ..cache import cache
+from ..config import get_settings
+from ..models import ChannelAccount, ChannelCredential
 from .channel_connectors import (
-    ChannelConnectorConfigError,
     ChannelConnectorError,
+    ChannelConnectorRateLimitError,
+    fetch_graph_batch,
     get_connector,
+    is_graph_platform,
 )
+from .crypto import preload_credentials
+from .metric_history import history_growth_rates, history_writer
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_TTL_SECONDS = 300  # 정상 데이터 5분 캐싱
+ERROR_SNAPSHOT_TTL_SECONDS = 60  # 에러는 1분만 캐싱
 
 PLATFORMS = [
     "instagram",
@@ -67,65 +80,365 @@ def generate_mock_metrics(account_name: str) -> Dict[str, str | int | float]:
 
 def _with_metadata(metrics: Dict[str, Any], *, source: str, error: str | None = None) -> Dict[str, Any]:
     metrics["source"] = source
+    metrics["fetched_at"] = datetime.utcnow().isoformat()
     if error:
         metrics["error"] = error
     return metrics
 
 
-def fetch_channel_snapshots(accounts: List[ChannelAccount]) -> Dict[int, Dict[str, Any]]:
-    """채널 스냅샷 가져오기 (5분 캐싱 적용)"""
+def _snapshot_cache_key(account: ChannelAccount) -> str:
+    return f"snapshot:{account.id}:{account.platform}"
+
+
+def _last_known_cache_key(account: ChannelAccount) -> str:
+    return f"snapshot:last:{account.id}:{account.platform}"
+
+
+def _fetch_snapshot(account: ChannelAccount) -> Dict[str, Any]:
+    """채널 하나를 커넥터로 조회 (실패 시 mock 스냅샷으로 대체)"""
+    connector = get_connector(account.platform)
+    if not connector:
+        metrics = generate_mock_metrics(account.account_name)
+        return _with_metadata(
+            metrics,
+            source="mock",
+            error="지원되지 않는 채널입니다.",
+        )
+    return _build_snapshot(account, lambda: connector.fetch(account))
+
+
+def _build_snapshot(account: ChannelAccount, fetch: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """커넥터 조회 결과(또는 오류)를 스냅샷으로 정리하고 이력/마지막 스냅샷에 반영"""
+    try:
+        metrics = fetch()
+        metrics.setdefault("recent_posts", [])
+        metrics.setdefault("followers", 0)
+        metrics.setdefault("growth_rate", 0.0)
+        metrics.setdefault("engagement_rate", 0.0)
+        metrics.setdefault("account", account.account_name)
+        growth = history_growth_rates([account.id]).get(account.id)
+        if growth is not None:
+            # 자격 증명 메타데이터에 저장된 값보다 실제 이력으로 계산한 성장률을 우선
+            metrics["growth_rate"] = growth
+        snapshot = _with_metadata(metrics, source="api")
+    except ChannelConnectorRateLimitError as exc:
+        # 호출 제한 중에는 mock 대신 마지막 실제 스냅샷을 제한이 풀릴 때까지 사용
+        stale = _stale_snapshot(account)
+        if stale is None:
+            stale = _with_metadata(generate_mock_metrics(account.account_name), source="mock")
+        stale["error"] = str(exc)
+        stale["retry_after"] = exc.retry_after
+        return stale
+    except ChannelConnectorError as exc:
+        # ChannelConnectorConfigError 포함
+        metrics = generate_mock_metrics(account.account_name)
+        return _with_metadata(
+            metrics,
+            source="mock",
+            error=str(exc),
+        )
+    # 실제 API 데이터만 시계열 이력과 stale-while-revalidate 용 "마지막 스냅샷"으로 보관
+    history_writer.record(account.id, snapshot)
+    cache.set(
+        _last_known_cache_key(account),
+        snapshot,
+        ttl_seconds=get_settings().snapshot_stale_max_age_seconds,
+    )
+    return snapshot
+
+
+def _snapshot_ttl(account: ChannelAccount, snapshot: Dict[str, Any]) -> int:
+    # 커넥터 오류로 대체된 mock 데이터는 1분만 캐싱 (미지원 채널은 바뀔 일이 없으므로 5분)
+    if snapshot.get("retry_after") is not None:
+        # 호출 제한 응답은 제한이 풀릴 때까지 다시 호출하지 않음
+        return int(min(max(snapshot["retry_after"], ERROR_SNAPSHOT_TTL_SECONDS), SNAPSHOT_TTL_SECONDS))
+    if snapshot.get("source") == "api" or get_connector(account.platform) is None:
+        return SNAPSHOT_TTL_SECONDS
+    return ERROR_SNAPSHOT_TTL_SECONDS
+
+
+def _load_snapshot(account: ChannelAccount, *, force: bool = False) -> Dict[str, Any]:
+    """캐시 미스 채널을 조회해 캐시에 저장
+
+    같은 채널을 동시에 요청한 다른 요청/스레드는 진행 중인 조회 결과를 함께 받습니다.
+    """
+    return cache.compute(
+        _snapshot_cache_key(account),
+        lambda: _fetch_snapshot(account),
+        lambda snapshot: _snapshot_ttl(account, snapshot),
+        force=force,
+    )
+
+
+def _load_graph_batch(
+    accounts: List[ChannelAccount], force_ids: Set[int] = frozenset()
+) -> Dict[int, Dict[str, Any]]:
+    """Graph 채널 여러 개를 batch 요청 한 번으로 조회해 캐시에 저장
+
+    채널별 캐시 키로 single-flight 를 등록하므로, 같은 채널을 동시에 요청한 다른 호출은
+    진행 중인 batch 결과를 기다리고 아직 아무도 조회하지 않는 채널만 batch 에 담깁니다.
+    """
+    by_key = {_snapshot_cache_key(account): account for account in accounts}
+
+    def load(keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        group = [by_key[key] for key in keys]
+        results = fetch_graph_batch(group)
+        # 채널별 성장률 이력을 한 번에 조회해 캐시에 채워 둠
+        history_growth_rates(account.id for account in group)
+        snapshots: Dict[str, Dict[str, Any]] = {}
+        for key, account in zip(keys, group):
+            result = results.get(account.id) or ChannelConnectorError("Graph batch 결과가 없습니다.")
+            snapshots[key] = _build_snapshot(account, lambda result=result: _raise_or_return(result))
+        return snapshots
+
+    snapshots = cache.compute_many(
+        list(by_key),
+        load,
+        lambda key, snapshot: _snapshot_ttl(by_key[key], snapshot),
+        force_keys=[key for key, account in by_key.items() if account.id in force_ids],
+    )
+    return {by_key[key].id: snapshot for key, snapshot in snapshots.items()}
+
+
+def _raise_or_return(result: Union[Dict[str, Any], ChannelConnectorError]) -> Dict[str, Any]:
+    if isinstance(result, ChannelConnectorError):
+        raise result
+    return result
+
+
+def _plan_fetch_groups(accounts: List[ChannelAccount]) -> List[List[ChannelAccount]]:
+    """조회 단위 묶기 - Graph 채널은 batch 요청 단위로, 나머지는 채널 하나씩"""
+    batch_size = get_settings().connector_graph_batch_size
+    graph_accounts = [account for account in accounts if is_graph_platform(account.platform)]
+    if batch_size <= 1 or len(graph_accounts) <= 1:
+        return [[account] for account in accounts]
+    groups = [
+        graph_accounts[start:start + batch_size]
+        for start in range(0, len(graph_accounts), batch_size)
+    ]
+    groups.extend([account] for account in accounts if not is_graph_platform(account.platform))
+    return groups
+
+
+def _load_group(group: List[ChannelAccount], force_ids: Set[int]) -> Dict[int, Dict[str, Any]]:
+    if len(group) == 1:
+        account = group[0]
+        return {account.id: _load_snapshot(account, force=account.id in force_ids)}
+    return _load_graph_batch(group, force_ids)
+
+
+def _stale_snapshot(account: ChannelAccount) -> Optional[Dict[str, Any]]:
+    """마지막으로 성공한 스냅샷 사본에 경과 시간(age_seconds)을 붙여 반환"""
+    last_known = cache.get(_last_known_cache_key(account))
+    if last_known is None:
+        return None
+    snapshot = dict(last_known)
+    snapshot["stale"] = True
+    try:
+        fetched_at = datetime.fromisoformat(snapshot["fetched_at"])
+        snapshot["age_seconds"] = max(int((datetime.utcnow() - fetched_at).total_seconds()), 0)
+    except (KeyError, TypeError, ValueError):
+        snapshot["age_seconds"] = None
+    return snapshot
+
+
+def _timeout_snapshot(account: ChannelAccount) -> Dict[str, Any]:
+    """요청 마감 시간 내에 응답하지 않은 채널용 대체 스냅샷 (캐싱하지 않음)"""
+    stale = _stale_snapshot(account)
+    if stale is not None:
+        return stale
+    metrics = generate_mock_metrics(account.account_name)
+    return _with_metadata(
+        metrics,
+        source="mock",
+        error="채널 응답 시간이 초과되었습니다.",
+    )
+
+
+def _detached_copy(account: ChannelAccount) -> ChannelAccount:
+    """백그라운드 갱신용 - 요청 DB 세션과 분리된 채널/자격 증명 사본"""
+    copy = ChannelAccount(
+        id=account.id,
+        owner_id=account.owner_id,
+        platform=account.platform,
+        account_name=account.account_name,
+        extra_metadata=dict(account.extra_metadata or {}),
+    )
+    credential = account.credential
+    if credential is not None:
+        copy.credential = ChannelCredential(
+            id=credential.id,
+            channel_id=credential.channel_id,
+            auth_type=credential.auth_type,
+            identifier=credential.identifier,
+            secret_encrypted=credential.secret_encrypted,
+            access_token_encrypted=credential.access_token_encrypted,
+            refresh_token_encrypted=credential.refresh_token_encrypted,
+            expires_at=credential.expires_at,
+            metadata_json=dict(credential.metadata_json or {}),
+        )
+    return copy
+
+
+_refresh_executor: Optional[ThreadPoolExecutor] = None
+_refreshing: Set[str] = set()
+_refresh_lock = threading.Lock()
+
+
+def _schedule_refresh(account: ChannelAccount) -> None:
+    """채널 스냅샷 백그라운드 갱신 예약 (같은 채널은 한 번만 예약)"""
+    global _refresh_executor
+    cache_key = _snapshot_cache_key(account)
+    with _refresh_lock:
+        if cache_key in _refreshing:
+            return
+        _refreshing.add(cache_key)
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(
+                max_workers=max(get_settings().snapshot_fetch_max_workers, 1),
+                thread_name_prefix="snapshot-refresh",
+            )
+        executor = _refresh_executor
+
+    detached = _detached_copy(account)
+
+    def refresh() -> None:
+        try:
+            _load_snapshot(detached, force=True)
+        except Exception as exc:  # pragma: no cover - 백그라운드 실패는 로그만 남김
+            logger.warning(f"Background snapshot refresh failed for {cache_key}: {exc}")
+        finally:
+            with _refresh_lock:
+                _refreshing.discard(cache_key)
+
+    executor.submit(refresh)
+
+
+def _preload_credentials(accounts: List[ChannelAccount]) -> None:
+    """워커 스레드에서 DB 세션 지연 로딩이 일어나지 않도록 자격 증명을 미리 로드하고
+    토큰을 한 번에 복호화해 둠 (커넥터의 반복 속성 접근은 평문 캐시 적중)"""
+    preload_credentials(getattr(account, "credential", None) for account in accounts)
+
+
+def fetch_channel_snapshots(
+    accounts: List[ChannelAccount],
+    *,
+    max_workers: Optional[int] = None,
+    deadline_seconds: Optional[float] = None,
+    stale_while_revalidate: Optional[bool] = None,
+) -> Dict[int, Dict[str, Any]]:
+    """채널 스냅샷 가져오기 (5분 캐싱 + 동시 조회)
+
+    캐시 미스 채널은 스레드 풀에서 동시에 조회하므로 페이지 지연 시간은
+    전체 호출 합이 아니라 가장 느린 채널에 맞춰집니다. 같은 채널이 여러 요청에서
+    동시에 미스나면 플랫폼 API 는 한 번만 호출됩니다 (single-flight).
+
+    stale-while-revalidate 가 켜져 있으면 한 번이라도 조회에 성공한 채널은
+    마지막 스냅샷(``stale=True``, ``age_seconds`` 포함)을 즉시 반환하고
+    갱신은 백그라운드에서 진행합니다.
+
+    Args:
+        accounts: 조회할 채널 목록
+        max_workers: 이번 호출의 동시 커넥터 호출 상한 (기본: 설정값, 1이면 순차 조회)
+        deadline_seconds: 전체 대기 한도. 초과한 채널은 마지막 스냅샷 또는 mock 으로 대체되며,
+            늦게 끝난 조회 결과는 백그라운드에서 캐시에 저장됩니다.
+        stale_while_revalidate: 마지막 스냅샷 즉시 반환 여부 (기본: 설정값)
+    """
+    settings = get_settings()
+    if max_workers is None:
+        max_workers = settings.snapshot_fetch_max_workers
+    if deadline_seconds is None:
+        deadline_seconds = settings.snapshot_fetch_deadline_seconds
+    if stale_while_revalidate is None:
+        stale_while_revalidate = settings.snapshot_stale_while_revalidate
+
     snapshots: Dict[int, Dict[str, Any]] = {}
+    pending: List[ChannelAccount] = []
+    refresh_early: Set[int] = set()
     for account in accounts:
         if account.id is None:
             continue
 
-        # 캐시 키 생성
-        cache_key = f"snapshot:{account.id}:{account.platform}"
-
-        # 캐시에서 조회
-        cached_snapshot = cache.get(cache_key)
-        if cached_snapshot is not None:
+        # 캐시에서 조회 (만료 직전이면 확률적으로 이번 요청이 미리 갱신)
+        cached_snapshot, fresh = cache.lookup(
+            _snapshot_cache_key(account),
+            early_refresh_beta=settings.snapshot_early_refresh_beta,
+        )
+        if fresh:
             snapshots[account.id] = cached_snapshot
             continue
 
-        # 캐시 미스 - 새로 가져오기
-        connector = get_connector(account.platform)
-        if not connector:
-            metrics = generate_mock_metrics(account.account_name)
-            snapshot = _with_metadata(
-                metrics,
-                source="mock",
-                error="지원되지 않는 채널입니다.",
-            )
-            snapshots[account.id] = snapshot
-            cache.set(cache_key, snapshot, ttl_seconds=300)  # 5분 캐싱
-            continue
-        try:
-            metrics = connector.fetch(account)
-            metrics.setdefault("recent_posts", [])
-            metrics.setdefault("followers", 0)
-            metrics.setdefault("growth_rate", 0.0)
-            metrics.setdefault("engagement_rate", 0.0)
-            metrics.setdefault("account", account.account_name)
-            snapshot = _with_metadata(metrics, source="api")
-            snapshots[account.id] = snapshot
-            cache.set(cache_key, snapshot, ttl_seconds=300)  # 5분 캐싱
-        except ChannelConnectorConfigError as exc:
-            metrics = generate_mock_metrics(account.account_name)
-            snapshot = _with_metadata(
-                metrics,
-                source="mock",
-                error=str(exc),
-            )
-            snapshots[account.id] = snapshot
-            cache.set(cache_key, snapshot, ttl_seconds=60)  # 에러는 1분만 캐싱
-        except ChannelConnectorError as exc:
-            metrics = generate_mock_metrics(account.account_name)
-            snapshot = _with_metadata(
-                metrics,
-                source="mock",
-                error=str(exc),
-            )
-            snapshots[account.id] = snapshot
-            cache.set(cache_key, snapshot, ttl_seconds=60)  # 에러는 1분만 캐싱
+        if stale_while_revalidate:
+            # 아직 유효한 값이면 그대로, 만료됐으면 마지막 스냅샷을 내려주고 갱신은 백그라운드로
+            stale = cached_snapshot if cached_snapshot is not None else _stale_snapshot(account)
+            if stale is not None:
+                snapshots[account.id] = stale
+                _schedule_refresh(account)
+                continue
+
+        if cached_snapshot is not None:
+            refresh_early.add(account.id)
+        pending.append(account)
+
+    if not pending:
+        return snapshots
+
+    _preload_credentials(pending)
+    # 채널별 성장률 이력을 한 번에 조회해 캐시에 채워 둠 (워커의 _build_snapshot 은 캐시 적중)
+    history_growth_rates(account.id for account in pending)
+
+    groups = _plan_fetch_groups(pending)
+    if max_workers <= 1 or len(groups) == 1:
+        for group in groups:
+            snapshots.update(_load_group(group, refresh_early))
+        return snapshots
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(max_workers, len(groups)),
+        thread_name_prefix="snapshot-fetch",
+    )
+    try:
+        futures = {executor.submit(_load_group, group, refresh_early): group for group in groups}
+        done, not_done = wait(futures, timeout=deadline_seconds)
+        for future in done:
+            snapshots.update(future.result())
+        for future in not_done:
+            for account in futures[future]:
+                logger.warning(
+                    f"Snapshot fetch for {account.platform}:{account.id} exceeded "
+                    f"{deadline_seconds:.1f}s deadline"
+                )
+                snapshots[account.id] = _timeout_snapshot(account)
+    finally:
+        # 마감 시간을 넘긴 작업(아직 시작하지 못하고 대기 중인 묶음 포함)은 기다리지 않고
+        # 백그라운드에서 마저 실행해 캐시를 채우도록 둠
+        executor.shutdown(wait=False)
+    return snapshots
+
+
+def refresh_channel_snapshots(
+    accounts: List[ChannelAccount],
+    *,
+    max_workers: Optional[int] = None,
+) -> Dict[int, Dict[str, Any]]:
+    """캐시 상태와 관계없이 채널 스냅샷을 다시 조회해 캐시/이력을 갱신 (백그라운드 작업용)
+
+    요청 경로가 아니므로 마감 시간 없이 모든 채널의 조회가 끝날 때까지 기다립니다.
+    """
+    if max_workers is None:
+        max_workers = get_settings().snapshot_fetch_max_workers
+    targets = [account for account in accounts if account.id is not None]
+    if not targets:
+        return {}
+    _preload_credentials(targets)
+    history_growth_rates(account.id for account in targets)
+    force_ids = {account.id for account in targets}
+    groups = _plan_fetch_groups(targets)
+    snapshots: Dict[int, Dict[str, Any]] = {}
+    with ThreadPoolExecutor(
+        max_workers=max(min(max_workers, len(groups)), 1),
+        thread_name_prefix="snapshot-refresh-batch",
+    ) as executor:
+        for result in executor.map(lambda group: _load_group(group, force_ids), groups):
+            snapshots.update(result)
     return snapshots
@@ -1,11 +1,13 @@
 import imaplib
+import re
 import smtplib
+import threading
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from email import message_from_bytes
 from email.header import decode_header, make_header
 from email.message import EmailMessage
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from ..config import Settings
 
@@ -82,6 +84,84 @@ def _extract_text_snippet(message) -> str:
     return text_content
 
 
+_FETCH_START = re.compile(rb"^\d+ \(")
+_FETCH_UID = re.compile(rb"UID (\d+)")
+
+
+def _untagged_value(imap, name: str) -> Optional[bytes]:
+    """Read an untagged response code (e.g. UIDVALIDITY) stored by SELECT."""
+    _, values = imap.response(name)
+    if not values or values[-1] is None:
+        return None
+    return values[-1]
+
+
+def _parse_fetch_response(data) -> Iterator[Tuple[int, bytes, bytes]]:
+    """Yield (uid, header bytes, body text bytes) from a UID FETCH response.
+
+    imaplib returns each literal as a (prefix, payload) tuple followed by the
+    remainder of the response line; the UID item may appear in either.
+    """
+    current: Optional[Dict[str, Any]] = None
+
+    def finish(item):
+        if item is not None and item["uid"] is not None:
+            return item["uid"], item["header"], item["text"]
+        return None
+
+    for part in data or []:
+        if isinstance(part, tuple):
+            prefix, payload = part
+            if _FETCH_START.match(prefix):
+                done = finish(current)
+                if done:
+                    yield done
+                current = {"uid": None, "header": b"", "text": b""}
+            if current is None:
+                continue
+            match = _FETCH_UID.search(prefix)
+            if match:
+                current["uid"] = int(match.group(1))
+            if b"BODY[HEADER]" in prefix:
+                current["header"] = payload or b""
+            elif b"BODY[TEXT]" in prefix:
+                current["text"] = payload or b""
+        elif isinstance(part, bytes) and current is not None:
+            match = _FETCH_UID.search(part)
+            if match and current["uid"] is None:
+                current["uid"] = int(match.group(1))
+
+    done = finish(current)
+    if done:
+        yield done
+
+
+@dataclass
+class _FolderState:
+    """Cached summaries for one mailbox folder, valid for a single UIDVALIDITY."""
+
+    uidvalidity: Optional[bytes]
+    uidnext: Optional[bytes] = None
+    exists: Optional[bytes] = None
+    limit: int = 0
+    last_uid: int = 0  # 마지막 동기화 시점 폴더의 가장 큰 UID (이후 UID 만 검색)
+    uids: List[int] = field(default_factory=list)
+    summaries: Dict[int, EmailSummary] = field(default_factory=dict)
+
+    def latest(self) -> List[EmailSummary]:
+        return [self.summaries[uid] for uid in self.uids]
+
+
+# (IMAP 호스트, 계정, 폴더) 별 요약 캐시 - 프로세스 메모리
+_folder_cache: Dict[Tuple[str, str, str], _FolderState] = {}
+_folder_cache_lock = threading.Lock()
+
+
+def clear_mailbox_cache() -> None:
+    with _folder_cache_lock:
+        _folder_cache.clear()
+
+
 def _ensure_configured(settings: Settings) -> None:
     if not settings.super_admin_email or not settings.super_admin_email_password:
         raise EmailConfigurationError(
@@ -101,8 +181,8 @@ class SuperAdminEmailService:
     def is_configured(settings: Settings) -> bool:
         return bool(settings.super_admin_email and settings.super_admin_email_password)
 
-    @contextmanager
-    def _smtp_connection(self):
+    def connect_smtp(self) -> smtplib.SMTP:
+        """Open an authenticated SMTP session; the caller is responsible for ``quit()``."""
         try:
             server = smtplib.SMTP(
                 self.settings.smtp_host,
@@ -120,13 +200,24 @@ class SuperAdminEmailService:
                         self.settings.super_admin_email,
                         self.settings.super_admin_email_password,
                     )
-
-                yield server
-            finally:
-                server.quit()
+            except Exception:
+                server.close()
+                raise
+            return server
         except Exception as exc:
             raise EmailSendError(f"Failed to connect to SMTP server: {exc}") from exc
 
+    @contextmanager
+    def _smtp_connection(self):
+        server = self.connect_smtp()
+        try:
+            yield server
+        finally:
+            try:
+                server.quit()
+            except Exception:
+                server.close()
+
     @contextmanager
     def _imap_connection(self):
         try:
@@ -152,12 +243,18 @@ class SuperAdminEmailService:
         except Exception as exc:
             raise EmailReceiveError(f"Failed to connect to IMAP server: {exc}") from exc
 
-    def send_email(self, to_address: str, subject: str, body: str) -> None:
+    def build_message(self, to_address: str, subject: str, body: str, html: bool = False) -> EmailMessage:
         msg = EmailMessage()
         msg["From"] = self.settings.super_admin_email
         msg["To"] = to_address
         msg["Subject"] = subject.strip()
         msg.set_content(body)
+        if html:
+            msg.add_alternative(body, subtype="html")
+        return msg
+
+    def send_email(self, to_address: str, subject: str, body: str) -> None:
+        msg = self.build_message(to_address, subject, body)
 
         with self._smtp_connection() as smtp:
             try:
@@ -173,38 +270,94 @@ class SuperAdminEmailService:
         return self._fetch_folder(folder, limit)
 
     def _fetch_folder(self, folder: str, limit: int) -> List[EmailSummary]:
+        """Return the latest ``limit`` messages, fetching only UIDs not cached yet.
+
+        Summaries are cached per (account, folder) and keyed by UIDVALIDITY/UID.
+        When UIDNEXT and EXISTS are unchanged since the last sync the cached list
+        is returned without searching the mailbox. Otherwise only UIDs above the
+        highest one seen are searched; EXISTS is used to detect expunges, which
+        (like a UIDVALIDITY change or a cold cache) fall back to a full search.
+        """
+        key = (self.settings.imap_host, self.settings.super_admin_email, folder)
         with self._imap_connection() as imap:
-            status, _ = imap.select(folder, readonly=True)
+            status, data = imap.select(folder, readonly=True)
             if status != "OK":
                 raise EmailReceiveError(f"Unable to access folder '{folder}'.")
 
-            status, data = imap.search(None, "ALL")
-            if status != "OK":
-                raise EmailReceiveError("Failed to search mailbox.")
-
-            message_ids = data[0].split()
-            if not message_ids:
-                return []
-
-            latest_ids = list(reversed(message_ids))[:limit]
-            summaries: List[EmailSummary] = []
-
-            for uid in latest_ids:
-                status, msg_data = imap.fetch(uid, "(RFC822)")
-                if status != "OK" or not msg_data:
-                    continue
-
-                raw_email = msg_data[0][1]
-                email_message = message_from_bytes(raw_email)
-                summaries.append(
-                    EmailSummary(
-                        uid=uid.decode("utf-8", errors="ignore"),
-                        subject=_decode_header(email_message.get("Subject")),
-                        sender=_decode_header(email_message.get("From")),
-                        recipient=_decode_header(email_message.get("To")),
-                        date=_decode_header(email_message.get("Date")),
-                        snippet=_extract_text_snippet(email_message),
-                    )
-                )
+            exists = data[0] if data else None
+            uidvalidity = _untagged_value(imap, "UIDVALIDITY")
+            uidnext = _untagged_value(imap, "UIDNEXT")
+
+            with _folder_cache_lock:
+                state = _folder_cache.get(key)
+            if state is None or uidvalidity is None or state.uidvalidity != uidvalidity:
+                # UIDVALIDITY 가 바뀌면 기존 UID 는 의미가 없으므로 새로 동기화
+                state = _FolderState(uidvalidity=uidvalidity)
+            elif uidnext is not None and (state.uidnext, state.exists, state.limit) == (uidnext, exists, limit):
+                return state.latest()
+
+            latest_uids = None
+            if state.exists is not None and exists is not None and limit <= state.limit:
+                # "n:*" 는 n 보다 큰 UID 가 없어도 가장 큰 UID 를 돌려주므로 다시 걸러냄
+                found = self._search_uids(imap, "UID", f"{state.last_uid + 1}:*")
+                new_uids = [uid for uid in found if uid > state.last_uid]
+                # 새 메일 수만큼만 늘었으면 삭제(expunge)된 메일이 없으므로 캐시된 목록에 이어 붙임
+                if int(exists) == int(state.exists) + len(new_uids):
+                    latest_uids = list(reversed(new_uids))[:limit]
+                    latest_uids += state.uids[:limit - len(latest_uids)]
+            if latest_uids is None:
+                uids = self._search_uids(imap, "ALL")
+                latest_uids = list(reversed(uids))[:limit]
+                last_uid = uids[-1] if uids else 0
+            else:
+                last_uid = max([state.last_uid, *latest_uids])
+
+            missing = [uid for uid in latest_uids if uid not in state.summaries]
+            fetched = self._fetch_summaries(imap, missing) if missing else {}
+
+        summaries = {
+            uid: state.summaries.get(uid) or fetched[uid]
+            for uid in latest_uids
+            if uid in state.summaries or uid in fetched
+        }
+        state = _FolderState(
+            uidvalidity=uidvalidity,
+            uidnext=uidnext,
+            exists=exists,
+            limit=limit,
+            last_uid=last_uid,
+            uids=[uid for uid in latest_uids if uid in summaries],
+            summaries=summaries,
+        )
+        with _folder_cache_lock:
+            _folder_cache[key] = state
+        return state.latest()
 
-            return summaries
+    @staticmethod
+    def _search_uids(imap, *criteria: str) -> List[int]:
+        status, data = imap.uid("SEARCH", None, *criteria)
+        if status != "OK":
+            raise EmailReceiveError("Failed to search mailbox.")
+        return sorted(int(uid) for uid in (data[0] or b"").split())
+
+    def _fetch_summaries(self, imap, uids: List[int]) -> Dict[int, EmailSummary]:
+        """Fetch headers and the first bytes of the body for ``uids`` in a single UID FETCH."""
+        uid_set = ",".join(str(uid) for uid in uids)
+        query = f"(UID BODY.PEEK[HEADER] BODY.PEEK[TEXT]<0.{self.settings.imap_snippet_bytes}>)"
+        status, data = imap.uid("FETCH", uid_set, query)
+        if status != "OK":
+            raise EmailReceiveError("Failed to fetch messages.")
+
+        summaries: Dict[int, EmailSummary] = {}
+        for uid, header, text in _parse_fetch_response(data):
+            # 본문 앞부분만 받았으므로 멀티파트가 잘려 있어도 최선의 미리보기만 추출
+            email_message = message_from_bytes(header + text)
+            summaries[uid] = EmailSummary(
+                uid=str(uid),
+                subject=_decode_header(email_message.get("Subject")),
+                sender=_decode_header(email_message.get("From")),
+                recipient=_decode_header(email_message.get("To")),
+                date=_decode_header(email_message.get("Date")),
+                snippet=_extract_text_snippet(email_message),
+            )
+        return summaries
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from sqlmodel import SQLModel, Session, create_engine, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.datastructures import State
+
+pytest.importorskip("aiosqlite")
+
+from app import database
+from app.auth import auth_manager
+from app.cache import cache
+from app.database import async_session_context, get_async_engine, get_async_session, get_session
+from app.dependencies import get_current_user_async
+from app.main import app
+from app.models import Subscription, User, UserRole
+
+
+@pytest.fixture(autouse=True)
+def async_database(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path / 'async.db'}"
+    sync_engine = create_engine(url, connect_args={"check_same_thread": False})
+    SQLModel.metadata.create_all(sync_engine)
+    with Session(sync_engine) as session:
+        session.add(User(id=1, email="creator@example.com", hashed_password="x", role=UserRole.CREATOR))
+        session.add(User(id=2, email="inactive@example.com", hashed_password="x", is_active=False))
+        session.commit()
+
+    monkeypatch.setattr(database.settings, "database_url", url)
+    monkeypatch.setattr(database, "engine", sync_engine)
+    monkeypatch.setattr(database, "_db_initialized", True)
+    monkeypatch.setattr(database, "_async_engine", None)
+    monkeypatch.setattr(database, "_async_session_factory", None)
+    cache.clear()
+    yield sync_engine
+    cache.clear()
+    if database._async_engine is not None:
+        asyncio.run(database._async_engine.dispose())
+    sync_engine.dispose()
+
+
+def make_request(email: str | None):
+    cookies = {"session": auth_manager.create_access_token(email)} if email else {}
+    return SimpleNamespace(cookies=cookies, state=State())
+
+
+async def current_user(email: str | None):
+    async with async_session_context() as session:
+        assert isinstance(session, AsyncSession)
+        user = await get_current_user_async(make_request(email), session)
+        return user.email, user in session
+
+
+def test_async_engine_uses_aiosqlite_and_resolves_user():
+    assert get_async_engine().url.drivername == "sqlite+aiosqlite"
+    assert asyncio.run(current_user("creator@example.com")) == ("creator@example.com", True)
+
+
+@pytest.mark.parametrize(
+    ("email", "status_code"),
+    [("inactive@example.com", 403), ("missing@example.com", 401), (None, 401)],
+)
+def test_async_user_lookup_rejects_inactive_and_unknown_users(email, status_code):
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(current_user(email))
+    assert exc_info.value.status_code == status_code
+
+
+def test_async_route_end_to_end(async_database, monkeypatch):
+    def override_get_session():
+        with Session(async_database) as session:
+            yield session
+
+    # 다른 테스트 모듈의 오버라이드를 걷어내고 실제 async 세션 경로를 사용
+    monkeypatch.setitem(app.dependency_overrides, get_async_session, get_async_session)
+    monkeypatch.setitem(app.dependency_overrides, get_session, override_get_session)
+
+    client = TestClient(app)
+    client.cookies.set("session", auth_manager.create_access_token("creator@example.com"))
+    response = client.get("/dashboard")
+
+    assert response.status_code == 200
+    # 라우트가 async 세션으로 기본 구독을 만들어 커밋함
+    with Session(async_database) as session:
+        assert session.exec(select(Subscription).where(Subscription.user_id == 1)).one().max_accounts == 1
+
+
+def test_signup_hashes_password_without_blocking_wrapper(async_database, monkeypatch):
+    def blocking_hash(password):
+        raise AssertionError("async routes must use hash_password_async")
+
+    monkeypatch.setattr(auth_manager, "hash_password", blocking_hash)
+    monkeypatch.setitem(app.dependency_overrides, get_async_session, get_async_session)
+
+    client = TestClient(app)
+    response = client.post(
+        "/signup",
+        data={
+            "email": "new@example.com",
+            "password": "s3cret-pass",
+            "name": "New",
+            "privacy_agreement": "on",
+            "guidance_agreement": "on",
+        },
+        follow_redirects=False,
+    )
+
+    assert response.status_code == 303
+    with Session(async_database) as session:
+        user = session.exec(select(User).where(User.email == "new@example.com")).one()
+        assert auth_manager.verify_password("s3cret-pass", user.hashed_password)
+        assert session.exec(select(Subscription).where(Subscription.user_id == user.id)).one().max_accounts == 1
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from app.auth import PasswordHashExecutor, auth_manager
+
+
+def test_password_roundtrip_through_executor():
+    hashed = auth_manager.hash_password("Passw0rd!")
+
+    assert auth_manager.verify_password("Passw0rd!", hashed)
+    assert asyncio.run(auth_manager.verify_password_async("wrong", hashed)) is False
+
+
+def test_executor_rejects_when_queue_is_full():
+    executor = PasswordHashExecutor(max_workers=1, max_queue=1)
+    release = threading.Event()
+    running = executor.submit(release.wait)
+    queued = executor.submit(lambda: None)
+
+    with pytest.raises(HTTPException) as excinfo:
+        executor.submit(lambda: None)
+    assert excinfo.value.status_code == 503
+    assert executor.stats()["rejected"] == 1
+
+    release.set()
+    running.result()
+    queued.result()
+    assert executor.stats()["completed"] == 2
@@ -7,7 +7,7 @@ from sqlmodel import SQLModel, Session, create_engine
 
 from app.auth import auth_manager
 from app.config import get_settings
-from app.database import get_session
+from app.database import ThreadedAsyncSession, get_async_session, get_session
 from app.main import app
 from app.models import User, UserRole
 
@@ -26,7 +26,13 @@ def override_get_session():
         yield session
 
 
+async def override_get_async_session():
+    with Session(engine, expire_on_commit=False) as session:
+        yield ThreadedAsyncSession(session)
+
+
 app.dependency_overrides[get_session] = override_get_session
+app.dependency_overrides[get_async_session] = override_get_async_session
 
 
 @pytest.fixture(autouse=True)
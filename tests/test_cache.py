@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import time
+
+from app.cache import BoundedTTLCache
+
+
+def test_get_set_delete_roundtrip():
+    cache = BoundedTTLCache()
+    cache.set("a", {"followers": 1})
+
+    assert cache.get("a") == {"followers": 1}
+    cache.delete("a")
+    assert cache.get("a") is None
+
+
+def test_expired_entries_are_dropped():
+    cache = BoundedTTLCache()
+    cache.set("short", 1, ttl_seconds=0.05)
+    cache.set("long", 2, ttl_seconds=60)
+
+    time.sleep(0.1)
+    cache.cleanup_expired()
+
+    assert len(cache) == 1
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+    assert cache.stats()["expirations"] == 1
+
+
+def test_lru_eviction_by_entry_count():
+    cache = BoundedTTLCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # b 가 가장 오래 사용되지 않은 항목이 됨
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_eviction_by_memory_budget():
+    cache = BoundedTTLCache(max_bytes=4_000)
+    for index in range(10):
+        cache.set(f"key{index}", "x" * 1_000)
+
+    stats = cache.stats()
+    assert stats["bytes"] <= 4_000
+    assert stats["entries"] < 10
+    assert cache.get("key9") is not None
+
+
+def test_hit_miss_counters():
+    cache = BoundedTTLCache()
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("missing")
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_get_or_compute_coalesces_concurrent_misses():
+    import threading
+
+    cache = BoundedTTLCache()
+    calls = []
+    barrier = threading.Barrier(5)
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.1)
+        return "value"
+
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(cache.get_or_compute("hot", loader, ttl_seconds=60))
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+
+
+def test_early_refresh_recomputes_before_expiry():
+    cache = BoundedTTLCache()
+    cache.set("slow", "old", ttl_seconds=1, compute_seconds=100.0)
+
+    value = cache.get_or_compute("slow", lambda: "new", ttl_seconds=60, early_refresh_beta=1.0)
+
+    assert value == "new"
+    assert cache.stats()["early_refreshes"] == 1
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.services import connector_transport
+from app.services.channel_connectors import TikTokConnector, YouTubeConnector
+from app.services.connector_transport import ConnectorTransport, get_transport
+
+
+class RedirectHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == "/old":
+            self.send_response(302)
+            self.send_header("Location", "/new")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = b"moved"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), RedirectHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def reset_transport(monkeypatch):
+    monkeypatch.setattr(connector_transport, "_transport", None)
+    yield
+    connector_transport.close_transport()
+
+
+@pytest.mark.parametrize("http2", [False, True])
+def test_transport_follows_redirects(server, http2):
+    if http2:
+        pytest.importorskip("h2")
+    transport = ConnectorTransport(http2=http2)
+    try:
+        assert transport.http2 is http2
+        response = transport.get(f"{server}/old")
+        assert response.status_code == 200
+        assert response.text == "moved"
+    finally:
+        transport.close()
+
+
+def test_connectors_share_one_transport(reset_transport):
+    transport = get_transport()
+    assert YouTubeConnector().transport is transport
+    assert TikTokConnector().transport is transport
+    assert get_transport() is transport
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from app.models import ChannelCredential
+from app.services import crypto
+
+
+@pytest.fixture(autouse=True)
+def clear_plaintext_cache():
+    crypto.plaintext_cache.clear()
+    yield
+    crypto.plaintext_cache.clear()
+
+
+def test_repeated_property_access_decrypts_once():
+    credential = ChannelCredential(channel_id=1)
+    credential.access_token = "token-a"
+    crypto.plaintext_cache.clear()
+
+    fernet = crypto._get_fernet()
+    with patch.object(fernet, "decrypt", wraps=fernet.decrypt) as spy:
+        assert credential.access_token == "token-a"
+        assert credential.access_token == "token-a"
+    assert spy.call_count == 1
+
+
+def test_decrypt_many_dedupes_and_skips_invalid():
+    token = crypto.encrypt("secret")
+    crypto.plaintext_cache.clear()
+
+    fernet = crypto._get_fernet()
+    with patch.object(fernet, "decrypt", wraps=fernet.decrypt) as spy:
+        assert crypto.decrypt_many([token, None, token, "not-a-token"]) == ["secret", None, "secret", None]
+    assert spy.call_count == 2
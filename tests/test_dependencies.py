@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine
+from starlette.datastructures import State
+
+from app.auth import auth_manager
+from app.cache import cache
+from app.dependencies import get_current_user, lookup_user_by_email, resolve_request_user
+from app.models import User
+
+
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+
+
+@pytest.fixture(autouse=True)
+def prepare_database():
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    cache.clear()
+    with Session(engine) as session:
+        session.add(User(id=1, email="creator@example.com", hashed_password="x", locale="en"))
+        session.commit()
+    yield
+    cache.clear()
+    SQLModel.metadata.drop_all(engine)
+
+
+@pytest.fixture
+def user_selects():
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM user" in statement:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
+
+
+def make_request(email: str):
+    token = auth_manager.create_access_token(email)
+    return SimpleNamespace(cookies={"session": token}, state=State())
+
+
+def test_user_resolved_once_per_request(user_selects):
+    request = make_request("creator@example.com")
+
+    with Session(engine) as middleware_session:
+        assert resolve_request_user(request, middleware_session).locale == "en"
+    with Session(engine) as session:
+        user = get_current_user(request, session)
+        assert user.email == "creator@example.com"
+        assert user in session
+
+    assert len(user_selects) == 1
+
+
+def test_user_cache_invalidated_on_update():
+    with Session(engine) as session:
+        assert lookup_user_by_email(session, "creator@example.com").is_active is True
+        user = session.get(User, 1)
+        user.is_active = False
+        session.add(user)
+        session.commit()
+
+    with Session(engine) as session:
+        assert lookup_user_by_email(session, "creator@example.com").is_active is False
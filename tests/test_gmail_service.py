@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from app.services.gmail_service import SUMMARY_HEADERS, GmailService
+
+
+class FakeRequest:
+    def __init__(self, result):
+        self.result = result
+
+    def execute(self):
+        return self.result
+
+
+class FakeBatch:
+    def __init__(self, service, callback):
+        self.service = service
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        self.service.http_calls += 1
+        for request_id, request in self.requests:
+            if request_id == "broken":
+                self.callback(request_id, None, RuntimeError("boom"))
+            else:
+                self.callback(request_id, request.result, None)
+
+
+class FakeGmail:
+    def __init__(self, message_ids):
+        self.message_ids = message_ids
+        self.http_calls = 0
+        self.get_params = []
+
+    def users(self):
+        return self
+
+    def messages(self):
+        return self
+
+    def list(self, **params):
+        self.http_calls += 1
+        return FakeRequest({"messages": [{"id": message_id} for message_id in self.message_ids]})
+
+    def get(self, id, **params):
+        self.get_params.append(params)
+        headers = [{"name": "Subject", "value": f"subject {id}"}, {"name": "From", "value": "a@example.com"}]
+        return FakeRequest({"id": id, "threadId": "t", "snippet": f"snippet {id}", "payload": {"headers": headers}})
+
+    def new_batch_http_request(self, callback):
+        return FakeBatch(self, callback)
+
+
+def make_service(fake):
+    service = GmailService.__new__(GmailService)
+    service.sender_email = "me@example.com"
+    service._get_gmail_service = lambda: fake
+    return service
+
+
+def test_list_messages_uses_batched_metadata_requests():
+    ids = [f"m{index}" for index in range(60)] + ["broken"]
+    fake = FakeGmail(ids)
+
+    messages = make_service(fake).list_messages(max_results=61, summary_only=True)
+
+    # 목록 1회 + 배치 2회 (50 + 11)
+    assert fake.http_calls == 3
+    assert [message.id for message in messages] == ids[:-1]
+    assert messages[0].subject == "subject m0"
+    assert messages[0].body == "snippet m0"
+    assert fake.get_params[0] == {"userId": "me", "format": "metadata", "metadataHeaders": SUMMARY_HEADERS}
+
+
+def test_list_messages_defaults_to_full_format():
+    fake = FakeGmail(["m1"])
+    make_service(fake).list_messages()
+    assert fake.get_params == [{"userId": "me", "format": "full"}]
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import smtplib
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from app.config import Settings
+from app.models import OutboundEmail, OutboundEmailStatus
+from app.services import mail_queue, super_admin_email
+from app.services.mail_queue import MailQueueWorker, _SMTPTransport, enqueue_email
+
+
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+
+
+class FakeTransport:
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.sent = []
+        self.closed = 0
+        self.statuses_during_send = []
+
+    def send(self, email):
+        # 발송 중에 다른 세션에서 보이는 상태 (가져가기 트랜잭션이 이미 커밋되었는지 확인용)
+        with Session(engine) as session:
+            self.statuses_during_send.append(session.get(OutboundEmail, email.id).status)
+        if email.to_address in self.failing:
+            raise RuntimeError("mailbox unavailable")
+        self.sent.append(email.to_address)
+
+    def close(self):
+        self.closed += 1
+
+
+@contextmanager
+def override_session_context():
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture(autouse=True)
+def prepare_database(monkeypatch):
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    monkeypatch.setattr(mail_queue, "session_context", override_session_context)
+    monkeypatch.setattr(mail_queue, "_resolve_transport", lambda transport: "smtp")
+    yield
+    SQLModel.metadata.drop_all(engine)
+
+
+def make_worker(transport):
+    worker = MailQueueWorker(batch_size=10, max_attempts=2, backoff_seconds=30)
+    worker._transports["smtp"] = transport
+    return worker
+
+
+def test_enqueued_mail_is_claimed_then_sent_outside_the_transaction():
+    with Session(engine) as session:
+        for index in range(3):
+            enqueue_email(session, f"user{index}@example.com", "subject", "body")
+        session.commit()
+
+    transport = FakeTransport()
+    assert make_worker(transport).run_once() == 3
+    assert transport.sent == [f"user{index}@example.com" for index in range(3)]
+    assert transport.statuses_during_send == [OutboundEmailStatus.SENDING] * 3
+    assert transport.closed == 0
+
+    with Session(engine) as session:
+        statuses = {email.status for email in session.exec(select(OutboundEmail)).all()}
+    assert statuses == {OutboundEmailStatus.SENT}
+
+
+def test_mail_claimed_by_another_worker_is_not_sent_twice(monkeypatch):
+    with Session(engine) as session:
+        for index in range(2):
+            enqueue_email(session, f"user{index}@example.com", "subject", "body")
+        session.commit()
+
+    now = datetime.utcnow()
+    slow_worker = make_worker(FakeTransport())
+    # 느린 워커가 후보를 읽은 직후 다른 프로세스의 워커가 먼저 가져감 (SQLite 는 행 잠금 없음)
+    with Session(engine) as session:
+        stale_candidates = slow_worker._claim_candidates(session, now)
+    assert len(make_worker(FakeTransport())._claim(now)) == 2
+
+    monkeypatch.setattr(slow_worker, "_claim_candidates", lambda session, now: stale_candidates)
+    assert slow_worker._claim(now) == []
+
+
+def test_failed_mail_is_retried_with_backoff_then_marked_failed():
+    with Session(engine) as session:
+        enqueue_email(session, "bounce@example.com", "subject", "body")
+        session.commit()
+
+    transport = FakeTransport(failing={"bounce@example.com"})
+    worker = make_worker(transport)
+    before = datetime.utcnow()
+    assert worker.run_once() == 1
+    # 재시도 시각 전에는 다시 가져가지 않음
+    assert worker.run_once() == 0
+
+    with Session(engine) as session:
+        email = session.exec(select(OutboundEmail)).one()
+        assert email.status == OutboundEmailStatus.PENDING
+        assert email.attempts == 1
+        assert email.next_attempt_at >= before + timedelta(seconds=30)
+        email.next_attempt_at = datetime.utcnow()
+        session.add(email)
+        session.commit()
+
+    assert worker.run_once() == 1
+    with Session(engine) as session:
+        email = session.exec(select(OutboundEmail)).one()
+        assert email.status == OutboundEmailStatus.FAILED
+        assert email.last_error == "mailbox unavailable"
+
+
+def test_expired_claim_is_picked_up_again():
+    with Session(engine) as session:
+        email = OutboundEmail(to_address="lost@example.com", subject="s", body="b",
+                              status=OutboundEmailStatus.SENDING,
+                              next_attempt_at=datetime.utcnow() - timedelta(seconds=1))
+        session.add(email)
+        session.commit()
+
+    transport = FakeTransport()
+    assert make_worker(transport).run_once() == 1
+    assert transport.sent == ["lost@example.com"]
+
+
+class FakeSMTP:
+    instances = []
+
+    def __init__(self, host, port, timeout=None):
+        self.messages = []
+        self.drop_next = False
+        self.quit_called = False
+        FakeSMTP.instances.append(self)
+
+    def noop(self):
+        return 250, b"OK"
+
+    def send_message(self, message):
+        if self.drop_next:
+            raise smtplib.SMTPServerDisconnected("idle timeout")
+        self.messages.append(message["To"])
+
+    def quit(self):
+        self.quit_called = True
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_smtp(monkeypatch):
+    FakeSMTP.instances = []
+    settings = Settings(super_admin_email="admin@example.com", super_admin_email_password="secret",
+                        smtp_host="localhost", smtp_use_tls=False)
+    monkeypatch.setattr(mail_queue, "get_settings", lambda: settings)
+    monkeypatch.setattr(super_admin_email.smtplib, "SMTP", FakeSMTP)
+    return FakeSMTP
+
+
+def make_email(to_address):
+    return OutboundEmail(to_address=to_address, subject="subject", body="body")
+
+
+def test_smtp_transport_reuses_connection_and_reconnects_once(fake_smtp):
+    transport = _SMTPTransport()
+    transport.send(make_email("a@example.com"))
+    transport.send(make_email("b@example.com"))
+    assert len(fake_smtp.instances) == 1
+    assert fake_smtp.instances[0].messages == ["a@example.com", "b@example.com"]
+
+    # 서버가 유휴 세션을 끊으면 새 연결로 한 번 재시도
+    fake_smtp.instances[0].drop_next = True
+    transport.send(make_email("c@example.com"))
+    assert len(fake_smtp.instances) == 2
+    assert fake_smtp.instances[0].quit_called
+    assert fake_smtp.instances[1].messages == ["c@example.com"]
+
+    transport.close()
+    assert fake_smtp.instances[1].quit_called
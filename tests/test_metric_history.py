@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from app.cache import cache
+from app.database import enable_sqlite_foreign_keys
+from app.models import ChannelAccount, ChannelMetricSnapshot, User
+from app.services import metric_history, social_fetcher
+from app.services.metric_history import (
+    MetricHistoryWriter,
+    compute_growth_rates,
+    history_growth_rates,
+    load_history,
+)
+
+
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+enable_sqlite_foreign_keys(engine)
+
+
+@contextmanager
+def override_session_context():
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture(autouse=True)
+def prepare_database(monkeypatch):
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    monkeypatch.setattr(metric_history, "session_context", override_session_context)
+    cache.clear()
+    with Session(engine) as session:
+        session.add(User(id=1, email="creator@example.com", hashed_password="x"))
+        session.add(ChannelAccount(id=1, owner_id=1, platform="youtube", account_name="yt"))
+        session.add(ChannelAccount(id=2, owner_id=1, platform="instagram", account_name="ig"))
+        session.commit()
+    yield
+    cache.clear()
+    SQLModel.metadata.drop_all(engine)
+
+
+def snapshot(followers: int, captured_at: datetime) -> dict:
+    return {
+        "followers": followers,
+        "engagement_rate": 1.5,
+        "fetched_at": captured_at.isoformat(),
+        "recent_posts": [{"impressions": 10, "likes": 2, "comments": 1}] * 2,
+    }
+
+
+def test_writer_buffers_and_bulk_inserts():
+    writer = MetricHistoryWriter(batch_size=3)
+    now = datetime.utcnow()
+    writer.record(1, snapshot(100, now))
+    writer.record(2, snapshot(50, now))
+
+    assert writer.pending() == 2
+    writer.record(1, snapshot(110, now + timedelta(minutes=5)))
+    assert writer.pending() == 0
+
+    with Session(engine) as session:
+        history = load_history(session, [1, 2])
+    assert [row.followers for row in history[1]] == [100, 110]
+    assert history[2][0].impressions == 20
+
+
+def test_growth_rate_from_stored_history():
+    writer = MetricHistoryWriter()
+    now = datetime.utcnow()
+    writer.record(1, snapshot(100, now - timedelta(days=3)))
+    writer.record(1, snapshot(105, now - timedelta(days=1)))
+    writer.record(1, snapshot(120, now))
+    writer.record(2, snapshot(80, now))
+    writer.flush()
+
+    with Session(engine) as session:
+        growth = compute_growth_rates(session, [1, 2], days=7)
+        rows = session.query(ChannelMetricSnapshot).count()
+
+    assert rows == 4
+    assert growth == {1: 20.0}
+
+
+def test_snapshot_growth_rate_uses_stored_history():
+    writer = MetricHistoryWriter()
+    now = datetime.utcnow()
+    writer.record(1, snapshot(100, now - timedelta(days=2)))
+    writer.record(1, snapshot(150, now))
+    writer.flush()
+
+    assert history_growth_rates([1, 2]) == {1: 50.0}
+    account = ChannelAccount(id=1, owner_id=1, platform="youtube", account_name="yt")
+    built = social_fetcher._build_snapshot(account, lambda: {"followers": 150, "growth_rate": 3.0})
+    assert built["growth_rate"] == 50.0
+
+    # 이력이 없는 채널은 커넥터 값 유지 (조회 결과도 캐시되어 다시 쿼리하지 않음)
+    other = ChannelAccount(id=2, owner_id=1, platform="instagram", account_name="ig")
+    assert social_fetcher._build_snapshot(other, lambda: {"growth_rate": 3.0})["growth_rate"] == 3.0
+
+
+def test_deleting_channel_cascades_history_in_database():
+    writer = MetricHistoryWriter()
+    writer.record(1, snapshot(100, datetime.utcnow()))
+    writer.record(2, snapshot(50, datetime.utcnow()))
+    writer.flush()
+
+    with Session(engine) as session:
+        session.delete(session.get(ChannelAccount, 1))
+        session.commit()
+        remaining = session.exec(select(ChannelMetricSnapshot.channel_id)).all()
+    assert remaining == [2]
+
+
+def test_history_csv_streams_in_chunks(monkeypatch):
+    from app.services import csv_export
+
+    monkeypatch.setattr(csv_export, "session_context", override_session_context)
+    base = datetime(2024, 1, 1)
+    with Session(engine) as session:
+        for minute in range(5):
+            session.add(ChannelMetricSnapshot(channel_id=1, captured_at=base + timedelta(minutes=minute), followers=100 + minute))
+        session.add(ChannelMetricSnapshot(channel_id=2, captured_at=base, followers=7))
+        session.commit()
+        channels = [session.get(ChannelAccount, 1)]
+
+    rows = list(csv_export.iter_history_rows(channels, chunk_size=2))
+    chunks = list(csv_export.iter_csv(csv_export.HISTORY_HEADER, rows, flush_rows=2))
+
+    assert [row[4] for row in rows] == [100, 101, 102, 103, 104]
+    assert len(chunks) == 4  # 헤더 + 2 + 2 + 1 행
+    assert chunks[1].splitlines()[0].startswith("1,youtube,yt,2024-01-01T00:00:00,100")
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine
+
+from app.config import get_settings
+from app.services.metrics import Counter, Histogram, MetricsRegistry, registry as metrics_registry
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    latency = registry.register(Histogram("latency_seconds", "test", ("route",), buckets=(0.1, 1.0)))
+    calls = registry.register(Counter("calls_total", "test", ("outcome",)))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.observe(value, route="/items/{item_id}")
+    calls.inc(outcome="2xx")
+
+    lines = registry.render().splitlines()
+
+    assert 'latency_seconds_bucket{route="/items/{item_id}",le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{route="/items/{item_id}",le="1"} 3' in lines
+    assert 'latency_seconds_bucket{route="/items/{item_id}",le="+Inf"} 4' in lines
+    assert 'latency_seconds_count{route="/items/{item_id}"} 4' in lines
+    assert 'calls_total{outcome="2xx"} 1.0' in lines
+    assert "# TYPE latency_seconds histogram" in lines
+
+
+@pytest.fixture
+def client(monkeypatch):
+    from app.database import get_session
+    from app.main import app
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+
+    def override_get_session():
+        with Session(engine) as session:
+            yield session
+
+    monkeypatch.setitem(app.dependency_overrides, get_session, override_get_session)
+    return TestClient(app)
+
+
+def test_metrics_endpoint_labels_route_templates_and_requires_token(client, monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "metrics_token", "scrape-secret")
+
+    assert client.get("/manager/creator/123").status_code == 401
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+
+    response = client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert response.status_code == 200
+    assert 'route="/manager/creator/{creator_id}"' in response.text
+    assert "/manager/creator/123" not in response.text
+    # 모든 요청이 끝나면 처리 중 요청 수는 0 으로 돌아옴
+    assert 'http_requests_in_flight 0.0' in metrics_registry.render().splitlines()
+
+
+def test_metrics_without_token_is_closed_in_production_unless_opted_in(client, monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "metrics_token", "")
+    monkeypatch.setattr(settings, "environment", "production")
+    assert client.get("/metrics").status_code == 403
+
+    monkeypatch.setattr(settings, "metrics_public", True)
+    assert client.get("/metrics").status_code == 200
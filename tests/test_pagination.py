@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from app.cache import cache
+from app.models import User
+from app.services.pagination import cached_count, keyset_page, parse_page
+
+
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+
+
+@pytest.fixture(autouse=True)
+def prepare_database():
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    cache.clear()
+    base = datetime(2024, 1, 1)
+    with Session(engine) as session:
+        for index in range(1, 12):
+            # 같은 created_at 이 여러 개 있어도 id 로 구분되어야 함
+            created_at = base + timedelta(minutes=index // 3)
+            session.add(User(id=index, email=f"user{index}@example.com", hashed_password="x", created_at=created_at))
+        session.commit()
+    yield
+    cache.clear()
+    SQLModel.metadata.drop_all(engine)
+
+
+def test_keyset_pages_cover_every_row_once():
+    seen = []
+    cursor = None
+    with Session(engine) as session:
+        while True:
+            page = keyset_page(
+                session,
+                select(User),
+                sort_column=User.created_at,
+                tie_column=User.id,
+                per_page=4,
+                cursor=cursor,
+            )
+            seen.extend(user.id for user in page.items)
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+
+        legacy = keyset_page(
+            session, select(User), sort_column=User.created_at, tie_column=User.id, per_page=4, page=2
+        )
+
+    assert seen == [11, 10, 9, 8, 7, 6, 5, 4, 3, 2, 1]
+    assert [user.id for user in legacy.items] == [7, 6, 5, 4]
+
+
+def test_invalid_cursor_rejected():
+    with Session(engine) as session, pytest.raises(HTTPException) as exc_info:
+        keyset_page(session, select(User), sort_column=User.created_at, tie_column=User.id, per_page=4, cursor="bogus")
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.parametrize("value", ["abc", "0", "-2"])
+def test_invalid_page_rejected(value):
+    with pytest.raises(HTTPException) as exc_info:
+        parse_page(value)
+    assert exc_info.value.status_code == 400
+    assert parse_page(None) == 1 and parse_page("3") == 3
+
+
+def test_count_is_cached():
+    with Session(engine) as session:
+        assert cached_count(session, "users", User.id) == 11
+        session.add(User(email="late@example.com", hashed_password="x"))
+        session.commit()
+        assert cached_count(session, "users", User.id) == 11
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import json
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine
+
+from app.models import ChannelAccount, ChannelMetricSnapshot, ManagerCreatorLink, User
+from app.services import portfolio_export
+from app.services.portfolio_export import PortfolioExportError, stream_portfolio_export
+
+
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+
+BASE = datetime(2024, 1, 10)
+
+
+@contextmanager
+def override_session_context():
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture(autouse=True)
+def prepare_database(monkeypatch):
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    monkeypatch.setattr(portfolio_export, "session_context", override_session_context)
+    with Session(engine) as session:
+        session.add(User(id=1, email="manager@example.com", hashed_password="x"))
+        session.add(User(id=2, email="approved@example.com", hashed_password="x"))
+        session.add(User(id=3, email="pending@example.com", hashed_password="x"))
+        session.add(ManagerCreatorLink(manager_id=1, creator_id=2, approved=True))
+        session.add(ManagerCreatorLink(manager_id=1, creator_id=3, approved=False))
+        session.add(ChannelAccount(id=10, owner_id=2, platform="youtube", account_name="yt"))
+        session.add(ChannelAccount(id=11, owner_id=3, platform="instagram", account_name="ig"))
+        session.add(ChannelAccount(id=12, owner_id=2, platform="tiktok", account_name="tt"))
+        for day in range(3):
+            session.add(ChannelMetricSnapshot(channel_id=10, captured_at=BASE + timedelta(days=day), followers=100 + day))
+            session.add(ChannelMetricSnapshot(channel_id=11, captured_at=BASE + timedelta(days=day), followers=5))
+        session.commit()
+    yield
+    SQLModel.metadata.drop_all(engine)
+
+
+def test_ndjson_export_covers_approved_creators_in_range():
+    body = stream_portfolio_export(1, BASE + timedelta(days=1), BASE + timedelta(days=5), "ndjson")
+    records = [json.loads(line) for chunk in body for line in chunk.splitlines()]
+
+    assert [(record["channel_id"], record["followers"]) for record in records] == [(10, 101), (10, 102), (12, None)]
+    assert {record["creator_email"] for record in records} == {"approved@example.com"}
+    # 기간 내 이력이 없는 채널은 지표가 빈 행 하나로 포함
+    assert records[-1]["captured_at"] is None
+
+
+def test_unknown_format_rejected_before_streaming():
+    with pytest.raises(PortfolioExportError):
+        stream_portfolio_export(1, BASE, BASE + timedelta(days=1), "xlsx")
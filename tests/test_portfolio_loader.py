@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from app.models import ChannelAccount, ManagerCreatorLink, User
+from app.services import portfolio_loader
+from app.services.portfolio_loader import load_portfolio
+from app.services.query_stats import assert_max_queries
+
+
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+
+
+def seed(creator_count: int) -> None:
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(User(id=1, email="manager@example.com", hashed_password="x"))
+        for index in range(creator_count):
+            creator_id = 100 + index
+            session.add(User(id=creator_id, email=f"creator{index}@example.com", hashed_password="x"))
+            session.add(ManagerCreatorLink(manager_id=1, creator_id=creator_id, approved=True))
+            for platform in ("youtube", "instagram"):
+                session.add(ChannelAccount(owner_id=creator_id, platform=platform, account_name=f"{platform}{index}"))
+        session.add(User(id=999, email="pending@example.com", hashed_password="x"))
+        session.add(ManagerCreatorLink(manager_id=1, creator_id=999, approved=False))
+        session.add(ChannelAccount(owner_id=999, platform="youtube", account_name="hidden"))
+        session.commit()
+
+
+def test_portfolio_loads_in_constant_queries_and_one_snapshot_batch(monkeypatch):
+    batches = []
+
+    def fake_fetch(channels):
+        batches.append([channel.id for channel in channels])
+        return {channel.id: {"followers": channel.id} for channel in channels}
+
+    monkeypatch.setattr(portfolio_loader, "fetch_channel_snapshots", fake_fetch)
+
+    for creator_count in (2, 12):
+        seed(creator_count)
+        batches.clear()
+        with Session(engine) as session:
+            with assert_max_queries(4, engine=engine):
+                portfolio = load_portfolio(session, manager_id=1)
+
+        assert len(batches) == 1
+        assert len(portfolio.approved_creators) == creator_count
+        assert 999 not in portfolio.creator_channels
+        grouped = portfolio.snapshots_by_creator()
+        for creator in portfolio.approved_creators:
+            channels = portfolio.creator_channels[creator.id]
+            assert len(channels) == 2
+            assert grouped[creator.id] == {channel.id: {"followers": channel.id} for channel in channels}
+
+
+def test_given_links_include_pending_creators_without_channels(monkeypatch):
+    monkeypatch.setattr(portfolio_loader, "fetch_channel_snapshots", lambda channels: {})
+    seed(1)
+    with Session(engine) as session:
+        links = session.exec(select(ManagerCreatorLink)).all()
+        portfolio = load_portfolio(session, 1, links=links, with_snapshots=False)
+
+    assert [link.creator_id for link in portfolio.pending_links] == [999]
+    assert 999 in portfolio.creator_lookup
+    assert list(portfolio.creator_channels) == [100]
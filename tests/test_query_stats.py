@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.pool import StaticPool
+from sqlmodel import create_engine
+
+from app.services.query_stats import assert_max_queries, track_queries
+
+
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+
+
+def run_queries(count: int) -> None:
+    with engine.connect() as conn:
+        for _ in range(count):
+            conn.execute(text("SELECT 1"))
+
+
+def test_query_budget_exceeded_lists_statements():
+    with assert_max_queries(2, engine=engine) as stats:
+        run_queries(2)
+    assert stats.count == 2
+
+    with pytest.raises(AssertionError, match="3 queries executed, budget was 2"):
+        with assert_max_queries(2, engine=engine):
+            run_queries(3)
+
+
+def test_queries_in_worker_threads_count_toward_request():
+    async def handler():
+        with track_queries() as stats:
+            await asyncio.to_thread(run_queries, 2)
+        return stats
+
+    with assert_max_queries(10, engine=engine):
+        stats = asyncio.run(handler())
+    assert stats.count == 2
+    assert stats.total_seconds > 0
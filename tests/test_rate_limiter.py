@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+import pytest
+
+from app.services import channel_connectors
+from app.services.channel_connectors import (
+    ChannelConnectorRateLimitError,
+    GraphConnector,
+)
+from app.services.rate_limiter import RateLimiter, RateLimitExceeded, rate_limiter
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, payload: Dict[str, Any], headers: Dict[str, str] | None = None):
+        self.status_code = status_code
+        self._payload = payload
+        self.headers = headers or {}
+        self.text = str(payload)
+
+    def json(self) -> Dict[str, Any]:
+        return self._payload
+
+
+class FakeTransport:
+    def __init__(self, responses: List[FakeResponse]):
+        self.responses = responses
+        self.calls = 0
+
+    def request(self, method, url, **kwargs):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+class DummyGraphConnector(GraphConnector):
+    platform = "graph_test"
+
+    def build_request(self, account):  # pragma: no cover - 사용하지 않음
+        return "me", {}, "token"
+
+    def parse_response(self, account, data):  # pragma: no cover - 사용하지 않음
+        return data
+
+
+@pytest.fixture(autouse=True)
+def reset_limiter():
+    rate_limiter.reset()
+    yield
+    rate_limiter.reset()
+
+
+def install_transport(monkeypatch, responses: List[FakeResponse]) -> FakeTransport:
+    transport = FakeTransport(responses)
+    monkeypatch.setattr(channel_connectors, "get_transport", lambda: transport)
+    return transport
+
+
+def test_bucket_rejects_when_wait_exceeds_budget():
+    limiter = RateLimiter()
+    for _ in range(3):
+        limiter.acquire("threads", max_wait=0)
+
+    with pytest.raises(RateLimitExceeded):
+        limiter.acquire("threads", max_wait=0)
+    assert limiter.stats()["threads"]["rejected"] == 1
+
+
+def test_retry_after_is_honoured_then_succeeds(monkeypatch):
+    transport = install_transport(
+        monkeypatch,
+        [
+            FakeResponse(429, {}, {"Retry-After": "0.05"}),
+            FakeResponse(200, {"id": "1"}),
+        ],
+    )
+
+    data = DummyGraphConnector()._graph_get("me", "token")
+
+    assert data == {"id": "1"}
+    assert transport.calls == 2
+    bucket = next(stats for key, stats in rate_limiter.stats().items() if key.startswith("graph_test:"))
+    assert bucket["throttled"] == 1
+    assert bucket["waited_seconds"] > 0
+
+
+def test_graph_throttle_code_with_long_retry_raises(monkeypatch):
+    install_transport(
+        monkeypatch,
+        [FakeResponse(400, {"error": {"code": 17}}, {"Retry-After": "600"})],
+    )
+
+    with pytest.raises(ChannelConnectorRateLimitError) as excinfo:
+        DummyGraphConnector()._graph_get("me", "token")
+    assert excinfo.value.retry_after == 600
+
+    # 차단된 토큰은 플랫폼을 다시 호출하지 않고 바로 실패
+    with pytest.raises(ChannelConnectorRateLimitError):
+        DummyGraphConnector()._graph_get("me", "token")
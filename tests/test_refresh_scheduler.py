@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine
+
+from app.models import ChannelAccount, User
+from app.services import refresh_scheduler
+from app.services.refresh_scheduler import SnapshotRefreshScheduler
+
+
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+
+
+@contextmanager
+def override_session_context():
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def refreshed(monkeypatch):
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(User(id=1, email="creator@example.com", hashed_password="x"))
+        for index in range(1, 6):
+            session.add(ChannelAccount(id=index, owner_id=1, platform="twitter", account_name=f"tw{index}"))
+        session.add(ChannelAccount(id=6, owner_id=1, platform="youtube", account_name="yt"))
+        session.commit()
+
+    calls: list[list[int]] = []
+    monkeypatch.setattr(refresh_scheduler, "session_context", override_session_context)
+    monkeypatch.setattr(
+        refresh_scheduler,
+        "refresh_channel_snapshots",
+        lambda accounts: calls.append([account.id for account in accounts]),
+    )
+    yield calls
+    SQLModel.metadata.drop_all(engine)
+
+
+def test_budget_limits_each_tick_and_resumes(refreshed):
+    scheduler = SnapshotRefreshScheduler(batch_size=2, budgets={"twitter": 2, "youtube": 5})
+
+    assert scheduler.run_once() == 3
+    assert sum(refreshed, []) == [1, 2, 6]
+
+    refreshed.clear()
+    assert scheduler.run_once() == 2
+    assert sum(refreshed, []) == [3, 4]
+
+    refreshed.clear()
+    assert scheduler.run_once() == 1
+    assert sum(refreshed, []) == [5]
+
+    # 모든 채널이 주기 내에 갱신되었으므로 더 이상 호출하지 않음
+    refreshed.clear()
+    assert scheduler.run_once() == 0
+    assert refreshed == []
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from app.cache import cache
+from app.services import report_jobs
+from app.services.report_jobs import ReportJobQueue, dashboard_payload
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def payload(age_seconds: int) -> dict:
+    user = SimpleNamespace(id=1, email="creator@example.com", name="Creator", organization=None)
+    accounts = [SimpleNamespace(id=7, owner_id=1, platform="youtube", account_name="yt")]
+    return dashboard_payload(user, accounts, {7: {"followers": 10, "stale": True, "age_seconds": age_seconds}})
+
+
+def gated_render(monkeypatch, calls):
+    """release 될 때까지 끝나지 않는 가짜 렌더러 (submit 직후 future 를 확인할 수 있도록)"""
+    release = threading.Event()
+
+    def fake_render(kind, data):
+        release.wait(timeout=5)
+        calls.append(kind)
+        return b"%PDF-fake"
+
+    monkeypatch.setattr(report_jobs, "render_report", fake_render)
+    return release
+
+
+def test_identical_input_rendered_once(monkeypatch):
+    calls = []
+    release = gated_render(monkeypatch, calls)
+    queue = ReportJobQueue(worker_processes=0)
+
+    first = queue.submit("dashboard", payload(5), owner_id=1, filename="a.pdf")
+    future = first.future
+    assert queue.status(first) == "pending"
+    release.set()
+    assert future.result(timeout=5) == b"%PDF-fake"
+    # 경과 시간만 다른 스냅샷은 같은 digest 로 취급
+    second = queue.submit("dashboard", payload(90), owner_id=1, filename="b.pdf")
+
+    assert queue.status(second) == "done"
+    assert queue.result(second) == b"%PDF-fake"
+    assert calls == ["dashboard"]
+    assert queue.get(second.id, owner_id=2) is None
+    queue.shutdown()
+
+
+def test_finished_job_drops_pdf_and_expires_with_cache(monkeypatch):
+    release = gated_render(monkeypatch, [])
+    queue = ReportJobQueue(worker_processes=0)
+
+    job = queue.submit("dashboard", payload(5), owner_id=1, filename="a.pdf")
+    executor = queue._executor
+    release.set()
+    # 워커 스레드가 완료 콜백까지 실행하고 끝날 때까지 대기
+    executor.shutdown(wait=True)
+
+    # 결과는 캐시에만 남고 작업은 future 를 놓음
+    assert job.future is None
+    assert queue.status(job) == "done"
+    assert queue.result(job) == b"%PDF-fake"
+
+    cache.clear()
+    assert queue.status(job) == "expired"
+    assert queue.result(job) is None
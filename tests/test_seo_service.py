@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+
+import pytest
+
+from app.seo import seo_service
+from app.seo.seo_service import SEOService, get_seo_service
+
+
+@pytest.fixture
+def locale_dir(tmp_path, monkeypatch):
+    shutil.copy(seo_service.SEO_LOCALE_DIR / "ko.json", tmp_path / "ko.json")
+    monkeypatch.setattr(seo_service, "SEO_LOCALE_DIR", tmp_path)
+    monkeypatch.setattr(seo_service, "RELOAD_CHECK_SECONDS", 0)
+    monkeypatch.setattr(seo_service, "_seo_services", {})
+    monkeypatch.setattr(seo_service, "_supported_locales", None)
+    return tmp_path
+
+
+def test_service_is_reused_and_output_matches_fresh_render(locale_dir):
+    service = get_seo_service("ko")
+    assert get_seo_service("ko") is service
+    # 지원하지 않는 로케일은 기본 로케일 인스턴스 공유
+    assert get_seo_service("xx") is service
+    # 로케일 목록은 한 번만 계산 (새 로케일 파일은 preload 시 반영)
+    shutil.copy(locale_dir / "ko.json", locale_dir / "xx.json")
+    assert get_seo_service("xx") is service
+    seo_service.preload_seo_services({})
+    assert get_seo_service("xx") is not service
+
+    head = service.generate_all_schemas("support", include_faq=True)
+    assert service.generate_all_schemas("support", include_faq=True) is head
+    assert head == SEOService("ko").generate_all_schemas("support", include_faq=True)
+
+
+def test_locale_file_change_reloads(locale_dir):
+    service = get_seo_service("ko")
+    path = locale_dir / "ko.json"
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["pages"]["home"]["title"] = "Updated title"
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+    reloaded = get_seo_service("ko")
+    assert reloaded is not service
+    assert 'content="Updated title"' in reloaded.generate_opengraph_tags("home")
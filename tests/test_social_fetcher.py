@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any, Dict
+
+import pytest
+
+from app.cache import cache
+from app.models import ChannelAccount, ChannelCredential
+from app.services import channel_connectors, metric_history, social_fetcher
+from app.services.channel_connectors import BaseConnector
+from app.services.rate_limiter import rate_limiter
+from app.services.social_fetcher import fetch_channel_snapshots
+
+
+class SleepyConnector(BaseConnector):
+    platform = "sleepy"
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def fetch(self, account: ChannelAccount) -> Dict[str, Any]:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return {"followers": account.id * 10}
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(monkeypatch):
+    cache.clear()
+    # 지표 이력 DB 는 test_metric_history 에서 다룸 - 여기서는 커넥터 동작만 확인
+    monkeypatch.setattr(social_fetcher, "history_growth_rates", lambda channel_ids: {})
+    yield
+    cache.clear()
+
+
+def install_connector(monkeypatch, connector: BaseConnector) -> None:
+    monkeypatch.setitem(channel_connectors.CONNECTOR_REGISTRY, connector.platform, connector)
+
+
+def make_accounts(count: int, platform: str = "sleepy") -> list[ChannelAccount]:
+    return [
+        ChannelAccount(id=i, owner_id=1, platform=platform, account_name=f"acct{i}")
+        for i in range(1, count + 1)
+    ]
+
+
+def test_concurrent_fetch_tracks_slowest_channel(monkeypatch):
+    connector = SleepyConnector(delay=0.2)
+    install_connector(monkeypatch, connector)
+
+    started = time.monotonic()
+    snapshots = fetch_channel_snapshots(make_accounts(6), max_workers=6, deadline_seconds=5)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.6
+    assert sorted(snapshots) == [1, 2, 3, 4, 5, 6]
+    assert all(snapshot["source"] == "api" for snapshot in snapshots.values())
+    assert snapshots[3]["followers"] == 30
+
+
+def test_growth_rates_loaded_once_for_pending_channels(monkeypatch):
+    install_connector(monkeypatch, SleepyConnector(delay=0))
+    lookups = []
+
+    def compute_growth_rates(session, channel_ids, days):
+        lookups.append(sorted(channel_ids))
+        return {channel_id: 1.5 for channel_id in channel_ids}
+
+    monkeypatch.setattr(social_fetcher, "history_growth_rates", metric_history.history_growth_rates)
+    monkeypatch.setattr(metric_history, "session_context", nullcontext)
+    monkeypatch.setattr(metric_history, "compute_growth_rates", compute_growth_rates)
+
+    snapshots = fetch_channel_snapshots(make_accounts(4), max_workers=4)
+
+    assert lookups == [[1, 2, 3, 4]]
+    assert all(snapshot["growth_rate"] == 1.5 for snapshot in snapshots.values())
+
+
+def test_cached_snapshots_skip_connector(monkeypatch):
+    connector = SleepyConnector(delay=0)
+    install_connector(monkeypatch, connector)
+    accounts = make_accounts(3)
+
+    fetch_channel_snapshots(accounts, max_workers=3)
+    fetch_channel_snapshots(accounts, max_workers=3)
+
+    assert connector.calls == 3
+
+
+def test_deadline_returns_fallback_and_warms_cache_later(monkeypatch):
+    connector = SleepyConnector(delay=0.3)
+    install_connector(monkeypatch, connector)
+    # 워커보다 채널이 많아 세 번째 채널은 마감 시점에 아직 대기열에 있음
+    accounts = make_accounts(3)
+
+    snapshots = fetch_channel_snapshots(accounts, max_workers=2, deadline_seconds=0.05)
+
+    assert {snapshot["source"] for snapshot in snapshots.values()} == {"mock"}
+    assert all("error" in snapshot for snapshot in snapshots.values())
+
+    time.sleep(0.8)
+    assert connector.calls == 3
+    warmed = fetch_channel_snapshots(accounts, max_workers=2, deadline_seconds=0.05)
+    assert {snapshot["source"] for snapshot in warmed.values()} == {"api"}
+
+
+def test_single_worker_fetches_serially(monkeypatch):
+    connector = SleepyConnector(delay=0)
+    install_connector(monkeypatch, connector)
+
+    snapshots = fetch_channel_snapshots(make_accounts(3), max_workers=1)
+
+    assert connector.calls == 3
+    assert len(snapshots) == 3
+
+
+def test_stale_while_revalidate_serves_last_snapshot(monkeypatch):
+    connector = SleepyConnector(delay=0)
+    install_connector(monkeypatch, connector)
+    account = make_accounts(1)[0]
+    fetch_channel_snapshots([account])
+
+    # 5분 캐시 만료를 흉내내고, 느려진 플랫폼으로 교체
+    cache.delete(f"snapshot:{account.id}:{account.platform}")
+    connector.delay = 0.3
+
+    started = time.monotonic()
+    snapshots = fetch_channel_snapshots([account], stale_while_revalidate=True)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.2
+    assert snapshots[account.id]["stale"] is True
+    assert snapshots[account.id]["age_seconds"] >= 0
+
+    time.sleep(0.5)
+    assert connector.calls == 2
+    refreshed = fetch_channel_snapshots([account])
+    assert "stale" not in refreshed[account.id]
+
+
+def test_stale_while_revalidate_disabled_blocks_on_fetch(monkeypatch):
+    connector = SleepyConnector(delay=0)
+    install_connector(monkeypatch, connector)
+    account = make_accounts(1)[0]
+    fetch_channel_snapshots([account])
+    cache.delete(f"snapshot:{account.id}:{account.platform}")
+
+    snapshots = fetch_channel_snapshots([account], stale_while_revalidate=False)
+
+    assert "stale" not in snapshots[account.id]
+    assert connector.calls == 2
+
+
+class BatchTransport:
+    def __init__(self, delay: float = 0) -> None:
+        self.delay = delay
+        self.requests: list[tuple[str, Dict[str, Any]]] = []
+
+    def request(self, method, url, *, data=None, **kwargs):
+        self.requests.append((method, data or {}))
+        time.sleep(self.delay)
+        batch = json.loads(data["batch"])
+        items = []
+        for entry in batch:
+            path = entry["relative_url"].split("?", 1)[0]
+            if path == "999":
+                items.append({"code": 400, "body": json.dumps({"error": {"code": 100}})})
+            else:
+                body = {"username": f"user{path}", "followers_count": int(path) * 100, "media": {"data": []}}
+                items.append({"code": 200, "body": json.dumps(body)})
+        return FakeResponse(items)
+
+
+class FakeResponse:
+    status_code = 200
+    headers: Dict[str, str] = {}
+
+    def __init__(self, payload) -> None:
+        self._payload = payload
+        self.text = json.dumps(payload)
+
+    def json(self):
+        return self._payload
+
+
+def make_instagram_account(account_id: int) -> ChannelAccount:
+    account = ChannelAccount(id=account_id, owner_id=1, platform="instagram", account_name=f"ig{account_id}")
+    credential = ChannelCredential(channel_id=account_id, identifier=str(account_id))
+    credential.access_token = f"token-{account_id}"
+    account.credential = credential
+    return account
+
+
+def test_graph_channels_share_one_batch_request(monkeypatch):
+    transport = BatchTransport()
+    monkeypatch.setattr(channel_connectors, "get_transport", lambda: transport)
+    rate_limiter.reset()
+    acquired = []
+    original_acquire = rate_limiter.acquire
+
+    def counting_acquire(platform, credential=None, **kwargs):
+        acquired.append(platform)
+        return original_acquire(platform, credential, **kwargs)
+
+    monkeypatch.setattr(rate_limiter, "acquire", counting_acquire)
+    accounts = [make_instagram_account(account_id) for account_id in (11, 12, 999)]
+
+    snapshots = fetch_channel_snapshots(accounts, max_workers=4, stale_while_revalidate=False)
+
+    assert len(transport.requests) == 1
+    # 호출 한도는 batch 안의 요청마다 한 번씩만 (봉투 POST 는 따로 차지하지 않음)
+    assert acquired == ["instagram"] * 3
+    assert transport.requests[0][0] == "POST"
+    assert snapshots[11]["source"] == "api"
+    assert snapshots[12]["followers"] == 1200
+    assert snapshots[999]["source"] == "mock"
+    assert "HTTP 400" in snapshots[999]["error"]
+
+
+def test_concurrent_graph_batches_are_coalesced(monkeypatch):
+    transport = BatchTransport(delay=0.2)
+    monkeypatch.setattr(channel_connectors, "get_transport", lambda: transport)
+    rate_limiter.reset()
+    shared = [make_instagram_account(account_id) for account_id in (21, 22)]
+    overlapping = [shared[1], make_instagram_account(23)]
+    results = []
+
+    def load(accounts):
+        results.append(fetch_channel_snapshots(accounts, stale_while_revalidate=False))
+
+    threads = [threading.Thread(target=load, args=(shared,)) for _ in range(4)]
+    threads.append(threading.Thread(target=load, args=(overlapping,)))
+    for thread in threads:
+        thread.start()
+        time.sleep(0.01)
+    for thread in threads:
+        thread.join()
+
+    # 동시에 들어온 같은 채널은 leader 의 batch 하나만 기다림 - 채널마다 한 번씩만 조회
+    entries = [json.loads(data["batch"]) for _, data in transport.requests]
+    assert len(transport.requests) == 2
+    assert sorted(len(batch) for batch in entries) == [1, 2]
+    assert all(result[22]["followers"] == 2200 for result in results)
+    assert any(result.get(23, {}).get("source") == "api" for result in results)
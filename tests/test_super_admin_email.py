@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+
+import pytest
+
+from app.config import Settings
+from app.services import super_admin_email
+from app.services.super_admin_email import SuperAdminEmailService, clear_mailbox_cache
+
+
+def raw_message(uid: int) -> tuple[bytes, bytes]:
+    header = (
+        f"Subject: Hello {uid}\r\nFrom: sender{uid}@example.com\r\n"
+        f"To: admin@example.com\r\nDate: Mon, 1 Jan 2024 00:00:0{uid % 10} +0000\r\n"
+        "Content-Type: text/plain; charset=utf-8\r\n\r\n"
+    ).encode()
+    return header, f"Body of message {uid}".encode()
+
+
+class FakeIMAP:
+    def __init__(self, uids, uidvalidity=b"7"):
+        self.uids = list(uids)
+        self.uidvalidity = uidvalidity
+        self.commands = []
+
+    def select(self, folder, readonly=False):
+        return "OK", [str(len(self.uids)).encode()]
+
+    def response(self, name):
+        values = {"UIDVALIDITY": self.uidvalidity, "UIDNEXT": str(max(self.uids, default=0) + 1).encode()}
+        return name, [values[name]]
+
+    def uid(self, command, *args):
+        self.commands.append((command, args))
+        if command == "SEARCH":
+            uids = sorted(self.uids)
+            if args[1] == "UID":
+                start = int(args[2].split(":")[0])
+                # 실제 서버처럼 start 이상 UID 가 없으면 가장 큰 UID 를 돌려줌
+                uids = [uid for uid in uids if uid >= start] or uids[-1:]
+            return "OK", [" ".join(str(uid) for uid in uids).encode()]
+        data = []
+        for index, uid in enumerate(int(value) for value in args[0].split(",")):
+            header, text = raw_message(uid)
+            data.append((f"{index + 1} (UID {uid} BODY[HEADER] {{{len(header)}}}".encode(), header))
+            data.append((f" BODY[TEXT]<0> {{{len(text)}}}".encode(), text))
+            data.append(b")")
+        return "OK", data
+
+
+@pytest.fixture
+def service(monkeypatch):
+    clear_mailbox_cache()
+    settings = Settings(super_admin_email="admin@example.com", super_admin_email_password="secret")
+    service = SuperAdminEmailService(settings)
+    service.imap = FakeIMAP([1, 2, 3])
+
+    @contextmanager
+    def fake_connection():
+        yield service.imap
+
+    monkeypatch.setattr(service, "_imap_connection", fake_connection)
+    yield service
+    clear_mailbox_cache()
+
+
+def fetched_uid_sets(imap):
+    return [args[0] for command, args in imap.commands if command == "FETCH"]
+
+
+def searches(imap):
+    return [args for command, args in imap.commands if command == "SEARCH"]
+
+
+def test_inbox_fetches_headers_in_one_batch_and_then_only_new_uids(service):
+    inbox = service.fetch_inbox(limit=2)
+    assert [summary.uid for summary in inbox] == ["3", "2"]
+    assert inbox[0].subject == "Hello 3"
+    assert inbox[0].snippet == "Body of message 3"
+    assert fetched_uid_sets(service.imap) == ["3,2"]
+    assert "BODY.PEEK[HEADER]" in service.imap.commands[-1][1][1]
+
+    # 변경 없음 - SEARCH/FETCH 없이 캐시 반환
+    service.imap.commands.clear()
+    assert [summary.uid for summary in service.fetch_inbox(limit=2)] == ["3", "2"]
+    assert service.imap.commands == []
+
+    service.imap.uids.append(5)
+    assert [summary.uid for summary in service.fetch_inbox(limit=2)] == ["5", "3"]
+    assert fetched_uid_sets(service.imap) == ["5"]
+    # 마지막으로 본 UID 이후만 검색
+    assert searches(service.imap) == [(None, "UID", "4:*")]
+
+
+def test_expunge_falls_back_to_full_search(service):
+    service.fetch_inbox(limit=2)
+    service.imap.commands.clear()
+
+    service.imap.uids.remove(3)
+    service.imap.uids.append(4)
+    assert [summary.uid for summary in service.fetch_inbox(limit=2)] == ["4", "2"]
+    assert searches(service.imap) == [(None, "UID", "4:*"), (None, "ALL")]
+    assert fetched_uid_sets(service.imap) == ["4"]
+
+
+def test_uidvalidity_change_resyncs(service):
+    service.fetch_inbox(limit=2)
+    service.imap = FakeIMAP([1, 2, 3], uidvalidity=b"8")
+    service.fetch_inbox(limit=2)
+    assert fetched_uid_sets(service.imap) == ["3,2"]
+
+
+def test_mailbox_poller_keeps_last_lists_when_refresh_fails(monkeypatch):
+    from app.services import mailbox_poller as poller_module
+    from app.services.mailbox_poller import MailboxPoller
+    from app.services.super_admin_email import EmailReceiveError, EmailSummary
+
+    settings = Settings(super_admin_email="admin@example.com", super_admin_email_password="secret")
+    monkeypatch.setattr(poller_module, "get_settings", lambda: settings)
+    summary = EmailSummary(uid="1", subject="s", sender="a", recipient="b", date="d", snippet="")
+    results = [[summary], [summary], EmailReceiveError("IMAP down")]
+
+    def fake_fetch(self, limit=20):
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setattr(SuperAdminEmailService, "fetch_inbox", fake_fetch)
+    monkeypatch.setattr(SuperAdminEmailService, "fetch_sent", fake_fetch)
+
+    poller = MailboxPoller()
+    assert poller.snapshot().age_seconds() is None
+    first = poller.refresh()
+    assert first.inbox == [summary] and first.error is None
+
+    failed = poller.refresh()
+    assert failed.error == "IMAP down"
+    assert failed.inbox == [summary]
+    assert failed.refreshed_at == first.refreshed_at
+    assert failed.to_dict()["inbox"][0]["uid"] == "1"
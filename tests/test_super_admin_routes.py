@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine
+
+from app import main
+from app.auth import auth_manager
+from app.cache import cache
+from app.config import get_settings
+from app.database import ThreadedAsyncSession, get_session
+from app.main import app
+from app.models import User, UserRole
+from app.routers import admin
+from app.services.mailbox_poller import MailboxPoller, MailboxSnapshot
+
+
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+
+
+class RecordingPoller(MailboxPoller):
+    def __init__(self, snapshot: MailboxSnapshot):
+        super().__init__()
+        self._snapshot = snapshot
+        self.background_refreshes = 0
+
+    def refresh_in_background(self) -> bool:
+        self.background_refreshes += 1
+        return True
+
+
+def override_get_session():
+    with Session(engine) as session:
+        yield session
+
+
+@asynccontextmanager
+async def override_async_session_context():
+    with Session(engine, expire_on_commit=False) as session:
+        yield ThreadedAsyncSession(session)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    cache.clear()
+    with Session(engine) as session:
+        session.add(User(email="root@example.com", hashed_password="x", role=UserRole.SUPER_ADMIN))
+        session.commit()
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "super_admin_email", "root@example.com")
+    monkeypatch.setattr(settings, "super_admin_email_password", "secret")
+    monkeypatch.setattr(settings, "mailbox_poller_enabled", True)
+    monkeypatch.setitem(app.dependency_overrides, get_session, override_get_session)
+    monkeypatch.setattr(main, "async_session_context", override_async_session_context)
+
+    client = TestClient(app)
+    client.cookies.set("session", auth_manager.create_access_token("root@example.com"))
+    yield client
+    cache.clear()
+    SQLModel.metadata.drop_all(engine)
+
+
+def use_poller(monkeypatch, snapshot: MailboxSnapshot) -> RecordingPoller:
+    poller = RecordingPoller(snapshot)
+    monkeypatch.setattr(admin, "mailbox_poller", poller)
+    return poller
+
+
+def test_refresh_button_starts_background_refresh(client, monkeypatch):
+    refreshed_at = datetime(2024, 1, 1, 9, 30)
+    poller = use_poller(monkeypatch, MailboxSnapshot(configured=True, refreshed_at=refreshed_at))
+
+    response = client.get("/super-admin")
+    assert response.status_code == 200
+    assert 'name="refresh_mailbox"' in response.text
+    assert "2024-01-01 09:30 UTC" in response.text
+    assert poller.background_refreshes == 0
+
+    response = client.get("/super-admin", params={"refresh_mailbox": "1"})
+    assert response.status_code == 200
+    assert poller.background_refreshes == 1
+    assert "메일함을 불러오는 중" in response.text
+
+
+def test_dashboard_shows_refreshing_before_first_snapshot(client, monkeypatch):
+    use_poller(monkeypatch, MailboxSnapshot())
+
+    response = client.get("/super-admin")
+    assert response.status_code == 200
+    assert "메일함을 불러오는 중" in response.text
+
+
+def test_user_list_links_next_page_with_cursor(client, monkeypatch):
+    use_poller(monkeypatch, MailboxSnapshot())
+    with Session(engine) as session:
+        for index in range(60):
+            session.add(User(email=f"user{index}@example.com", hashed_password="x"))
+        session.commit()
+
+    response = client.get("/super-admin")
+    assert response.status_code == 200
+    assert "/super-admin?cursor=" in response.text
+
+    assert client.get("/super-admin", params={"page": "abc"}).status_code == 400